@@ -17,7 +17,18 @@ java {
     }
 }
 
+val loadTest: SourceSet by sourceSets.creating {
+    compileClasspath += sourceSets.main.get().output
+    runtimeClasspath += sourceSets.main.get().output
+}
+
 configurations {
+    named(loadTest.implementationConfigurationName) {
+        extendsFrom(configurations.testImplementation.get())
+    }
+    named(loadTest.runtimeOnlyConfigurationName) {
+        extendsFrom(configurations.testRuntimeOnly.get())
+    }
     compileOnly {
         extendsFrom(configurations.annotationProcessor.get())
     }
@@ -43,6 +54,7 @@ dependencies {
     // Spring Boot
     implementation("org.springframework.boot:spring-boot-h2console")
     implementation("org.springframework.boot:spring-boot-starter-actuator")
+    implementation("org.springframework.boot:spring-boot-starter-cache")
     implementation("org.springframework.boot:spring-boot-starter-flyway")
     implementation("org.springframework.boot:spring-boot-starter-security")
     implementation("org.springframework.boot:spring-boot-starter-webmvc")
@@ -51,6 +63,7 @@ dependencies {
     implementation("org.jetbrains.kotlin:kotlin-reflect")
     implementation("org.springframework.cloud:spring-cloud-starter-openfeign")
     implementation("tools.jackson.module:jackson-module-kotlin")
+    implementation("com.github.ben-manes.caffeine:caffeine")
 
     // JWT
     implementation("io.jsonwebtoken:jjwt-api:${property("jjwtVersion")}")
@@ -90,6 +103,11 @@ dependencies {
     // Test - ArchUnit
     testImplementation("com.tngtech.archunit:archunit-junit5:1.4.1")
 
+    // Test - Testcontainers (PostgreSQL 전용 경로 검증, Docker가 없으면 해당 테스트는 건너뛴다)
+    testImplementation("org.springframework.boot:spring-boot-testcontainers")
+    testImplementation("org.testcontainers:testcontainers-junit-jupiter")
+    testImplementation("org.testcontainers:testcontainers-postgresql")
+
     testImplementation("org.jetbrains.kotlin:kotlin-test-junit5")
     testRuntimeOnly("org.junit.platform:junit-platform-launcher")
 }
@@ -122,6 +140,40 @@ ktlint {
     }
 }
 
-tasks.withType<Test> {
+tasks.test {
+    useJUnitPlatform {
+        excludeTags("benchmark")
+    }
+}
+
+tasks.register<Test>("benchmark") {
+    description = "Runs persistence benchmarks tagged with @Tag(\"benchmark\")."
+    group = "verification"
+    testClassesDirs = sourceSets.test.get().output.classesDirs
+    classpath = sourceSets.test.get().runtimeClasspath
+    useJUnitPlatform {
+        includeTags("benchmark")
+    }
+    filter {
+        includeTestsMatching("*BenchmarkTest")
+    }
+    testLogging {
+        showStandardStreams = true
+    }
+}
+
+tasks.register<Test>("loadTest") {
+    description = "Seeds a synthetic dataset and replays the GraphQL operation mix against /graphql."
+    group = "verification"
+    testClassesDirs = loadTest.output.classesDirs
+    classpath = loadTest.runtimeClasspath
     useJUnitPlatform()
+    shouldRunAfter(tasks.test)
+    maxHeapSize = "2g"
+    // -Ploadtest.members=100000 처럼 전달한 값을 시스템 프로퍼티로 넘긴다 (LoadTestSettings 참고)
+    systemProperties(project.properties.filterKeys { it.startsWith("loadtest.") })
+    outputs.upToDateWhen { false }
+    testLogging {
+        showStandardStreams = true
+    }
 }
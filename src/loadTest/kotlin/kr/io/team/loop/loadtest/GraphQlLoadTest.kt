@@ -0,0 +1,112 @@
+package kr.io.team.loop.loadtest
+
+import kr.io.team.loop.common.config.JwtTokenProvider
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.core.env.Environment
+import org.springframework.test.context.ActiveProfiles
+import org.springframework.test.context.DynamicPropertyRegistry
+import org.springframework.test.context.DynamicPropertySource
+import org.testcontainers.postgresql.PostgreSQLContainer
+import tools.jackson.module.kotlin.jacksonObjectMapper
+import tools.jackson.module.kotlin.readValue
+import java.net.URI
+import java.nio.file.Files
+import java.nio.file.Path
+import javax.sql.DataSource
+
+/**
+ * 합성 데이터를 적재한 서버에 연산 구성([OperationMix])을 재생하고, 결과를 저장된 기준과 비교한다.
+ *
+ * `./gradlew loadTest`로만 실행된다. 설정은 [LoadTestSettings] 참고.
+ * 기준 파일이 없으면 이번 결과를 기준으로 저장한다. 기준은 측정한 머신에서만 의미가 있다.
+ */
+@SpringBootTest(webEnvironment = SpringBootTest.WebEnvironment.RANDOM_PORT)
+@ActiveProfiles("loadtest")
+class GraphQlLoadTest {
+    @Autowired
+    lateinit var dataSource: DataSource
+
+    @Autowired
+    lateinit var jwtTokenProvider: JwtTokenProvider
+
+    @Autowired
+    lateinit var environment: Environment
+
+    private val log = LoggerFactory.getLogger(javaClass)
+    private val objectMapper = jacksonObjectMapper()
+
+    @Test
+    fun `operation mix stays within the stored baseline`() {
+        SyntheticDataGenerator(dataSource, settings.scale, settings.seed, settings.anchorDate).generate()
+
+        val port = environment.getRequiredProperty("local.server.port")
+        val tokens =
+            settings.scale
+                .memberIds()
+                .take(settings.activeMembers)
+                .associateWith { jwtTokenProvider.generateToken(it) }
+        val operations =
+            LoadDriver(
+                endpoint = URI.create("http://localhost:$port/graphql"),
+                mix = OperationMix.default(settings.scale, settings.anchorDate),
+                tokens = tokens,
+                concurrency = settings.concurrency,
+                seed = settings.seed,
+            ).run(settings.warmup, settings.duration)
+        val report =
+            LoadReport(
+                database = settings.database.name.lowercase(),
+                scale = settings.scale,
+                concurrency = settings.concurrency,
+                durationSeconds = settings.duration.seconds,
+                operations = operations,
+            )
+        log.info("[loadtest] {}\n{}", report.database, report.toTable())
+        write(settings.reportPath, report)
+
+        assertThat(report.operations.filterValues { it.errors > 0 }).isEmpty()
+
+        val baselinePath = settings.baselinePath
+        if (settings.updateBaseline || Files.notExists(baselinePath)) {
+            write(baselinePath, report)
+            log.info("[loadtest] baseline written to {}", baselinePath.toAbsolutePath())
+            return
+        }
+        val baseline = objectMapper.readValue<LoadReport>(Files.readString(baselinePath))
+        assertThat(report.regressionsAgainst(baseline, settings.maxRegression)).isEmpty()
+    }
+
+    private fun write(
+        path: Path,
+        report: LoadReport,
+    ) {
+        path.parent?.let { Files.createDirectories(it) }
+        Files.writeString(path, objectMapper.writerWithDefaultPrettyPrinter().writeValueAsString(report))
+    }
+
+    companion object {
+        private val settings = LoadTestSettings.fromSystemProperties()
+
+        private val postgres =
+            if (settings.database == LoadTestSettings.Database.POSTGRESQL) {
+                PostgreSQLContainer("postgres:17-alpine").withUrlParam("reWriteBatchedInserts", "true")
+            } else {
+                null
+            }
+
+        @JvmStatic
+        @DynamicPropertySource
+        fun datasource(registry: DynamicPropertyRegistry) {
+            val container = postgres ?: return
+            container.start()
+            registry.add("spring.datasource.url", container::getJdbcUrl)
+            registry.add("spring.datasource.username", container::getUsername)
+            registry.add("spring.datasource.password", container::getPassword)
+            registry.add("spring.datasource.driver-class-name") { "org.postgresql.Driver" }
+        }
+    }
+}
@@ -0,0 +1,109 @@
+package kr.io.team.loop.loadtest
+
+import tools.jackson.module.kotlin.jacksonObjectMapper
+import java.net.URI
+import java.net.http.HttpClient
+import java.net.http.HttpRequest
+import java.net.http.HttpResponse
+import java.time.Duration
+import java.util.Collections
+import java.util.Random
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.Executors
+import java.util.concurrent.atomic.AtomicLong
+
+/**
+ * [endpoint]에 [mix]의 연산을 closed loop로 보내고 연산별 지연 시간을 모은다.
+ *
+ * [concurrency]개의 가상 스레드가 각자 응답을 받은 즉시 다음 요청을 보낸다.
+ * 요청마다 [tokens] 중 한 회원을 골라 Bearer 토큰으로 인증한다.
+ * HTTP 200이 아니거나 응답에 `errors`가 있으면 오류로 센다.
+ */
+class LoadDriver(
+    private val endpoint: URI,
+    private val mix: OperationMix,
+    private val tokens: Map<Long, String>,
+    private val concurrency: Int,
+    private val seed: Long,
+) {
+    private val client = HttpClient.newBuilder().connectTimeout(Duration.ofSeconds(5)).build()
+    private val objectMapper = jacksonObjectMapper()
+    private val memberIds = tokens.keys.toList()
+
+    fun run(
+        warmup: Duration,
+        duration: Duration,
+    ): Map<String, OperationStats> {
+        drive(warmup, Samples())
+        val samples = Samples()
+        val elapsed = drive(duration, samples)
+        return samples.stats(elapsed)
+    }
+
+    private fun drive(
+        duration: Duration,
+        samples: Samples,
+    ): Duration {
+        val start = System.nanoTime()
+        val deadline = start + duration.toNanos()
+        Executors.newVirtualThreadPerTaskExecutor().use { executor ->
+            repeat(concurrency) { worker ->
+                executor.submit {
+                    val random = Random(seed + worker)
+                    while (System.nanoTime() < deadline) {
+                        execute(mix.pick(random), random, samples)
+                    }
+                }
+            }
+        }
+        return Duration.ofNanos(System.nanoTime() - start)
+    }
+
+    private fun execute(
+        operation: LoadOperation,
+        random: Random,
+        samples: Samples,
+    ) {
+        val memberId = memberIds[random.nextInt(memberIds.size)]
+        val graphQlRequest = operation.request(memberId, random)
+        val body =
+            objectMapper.writeValueAsString(
+                mapOf("query" to graphQlRequest.query, "variables" to graphQlRequest.variables),
+            )
+        val request =
+            HttpRequest
+                .newBuilder(endpoint)
+                .header("Content-Type", "application/json")
+                .header("Authorization", "Bearer ${tokens.getValue(memberId)}")
+                .POST(HttpRequest.BodyPublishers.ofString(body))
+                .build()
+        val start = System.nanoTime()
+        val succeeded =
+            runCatching {
+                val response = client.send(request, HttpResponse.BodyHandlers.ofString())
+                response.statusCode() == 200 && !objectMapper.readTree(response.body()).has("errors")
+            }.getOrDefault(false)
+        samples.record(operation.name, System.nanoTime() - start, succeeded)
+    }
+
+    private class Samples {
+        private val latencies = ConcurrentHashMap<String, MutableList<Long>>()
+        private val errors = ConcurrentHashMap<String, AtomicLong>()
+
+        fun record(
+            operation: String,
+            nanos: Long,
+            succeeded: Boolean,
+        ) {
+            latencies.computeIfAbsent(operation) { Collections.synchronizedList(ArrayList()) }.add(nanos)
+            if (!succeeded) {
+                errors.computeIfAbsent(operation) { AtomicLong() }.incrementAndGet()
+            }
+        }
+
+        fun stats(elapsed: Duration): Map<String, OperationStats> =
+            latencies.toSortedMap().mapValues { (operation, values) ->
+                OperationStats.of(values.sorted(), errors[operation]?.get() ?: 0, elapsed)
+            }
+    }
+}
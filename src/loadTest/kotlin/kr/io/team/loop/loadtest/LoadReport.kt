@@ -0,0 +1,96 @@
+package kr.io.team.loop.loadtest
+
+import java.time.Duration
+import kotlin.math.ceil
+
+/** 연산 하나의 측정 결과. 지연 시간 단위는 ms, 처리량은 초당 요청 수다. */
+data class OperationStats(
+    val count: Long,
+    val errors: Long,
+    val throughput: Double,
+    val p50: Double,
+    val p95: Double,
+    val p99: Double,
+) {
+    companion object {
+        fun of(
+            sortedNanos: List<Long>,
+            errors: Long,
+            elapsed: Duration,
+        ): OperationStats =
+            OperationStats(
+                count = sortedNanos.size.toLong(),
+                errors = errors,
+                throughput = sortedNanos.size / (elapsed.toNanos() / 1_000_000_000.0),
+                p50 = percentile(sortedNanos, 0.50),
+                p95 = percentile(sortedNanos, 0.95),
+                p99 = percentile(sortedNanos, 0.99),
+            )
+
+        /** nearest-rank 백분위수 (ms). */
+        private fun percentile(
+            sortedNanos: List<Long>,
+            quantile: Double,
+        ): Double {
+            if (sortedNanos.isEmpty()) {
+                return 0.0
+            }
+            val index = (ceil(quantile * sortedNanos.size).toInt() - 1).coerceIn(0, sortedNanos.lastIndex)
+            return sortedNanos[index] / 1_000_000.0
+        }
+    }
+}
+
+/** 한 번의 부하 테스트 결과. 같은 형식의 JSON 파일을 기준(baseline)으로 저장해 비교한다. */
+data class LoadReport(
+    val database: String,
+    val scale: DatasetScale,
+    val concurrency: Int,
+    val durationSeconds: Long,
+    val operations: Map<String, OperationStats>,
+) {
+    /**
+     * [baseline] 대비 p95 지연이 [maxRegression] 비율보다 늘었거나 처리량이 그만큼 줄어든 연산을 설명하는 문자열 목록.
+     * 데이터 규모나 동시성이 다른 기준과는 비교하지 않는다.
+     */
+    fun regressionsAgainst(
+        baseline: LoadReport,
+        maxRegression: Double,
+    ): List<String> {
+        if (baseline.scale != scale || baseline.concurrency != concurrency) {
+            return listOf("Baseline was recorded with a different scale or concurrency: ${baseline.scale}")
+        }
+        return baseline.operations.flatMap { (name, expected) ->
+            val actual = operations[name] ?: return@flatMap listOf("$name: not executed")
+            buildList {
+                if (actual.p95 > expected.p95 * (1 + maxRegression)) {
+                    add("$name: p95 %.2fms -> %.2fms".format(expected.p95, actual.p95))
+                }
+                if (actual.throughput < expected.throughput * (1 - maxRegression)) {
+                    add("$name: throughput %.1f/s -> %.1f/s".format(expected.throughput, actual.throughput))
+                }
+            }
+        }
+    }
+
+    fun toTable(): String =
+        buildString {
+            appendLine(
+                "%-16s %8s %6s %10s %9s %9s %9s"
+                    .format("operation", "count", "errors", "req/s", "p50ms", "p95ms", "p99ms"),
+            )
+            operations.forEach { (name, stats) ->
+                appendLine(
+                    "%-16s %8d %6d %10.1f %9.2f %9.2f %9.2f".format(
+                        name,
+                        stats.count,
+                        stats.errors,
+                        stats.throughput,
+                        stats.p50,
+                        stats.p95,
+                        stats.p99,
+                    ),
+                )
+            }
+        }
+}
@@ -0,0 +1,117 @@
+package kr.io.team.loop.loadtest
+
+import java.nio.file.Path
+import java.time.Duration
+import java.time.LocalDate
+
+/**
+ * 부하 테스트 설정. `./gradlew loadTest -Ploadtest.<key>=<value>`로 전달한 시스템 프로퍼티에서 읽는다.
+ *
+ * | 키 | 기본값 | 설명 |
+ * |----|--------|------|
+ * | database | h2 | h2 또는 postgresql (Testcontainers로 기동) |
+ * | members, goals-per-member, daily-goals-per-member | [DatasetScale] | 데이터 규모 |
+ * | tasks-per-member, reviews-per-member, days | [DatasetScale] | 데이터 규모 |
+ * | seed | 42 | 데이터·요청 생성 난수 시드 |
+ * | active-members | 1000 | 부하를 거는 회원 수 (members 이하) |
+ * | concurrency | 16 | 동시 요청 수 (closed loop) |
+ * | warmup-seconds, duration-seconds | 10, 30 | 예열·측정 시간 |
+ * | baseline | src/loadTest/baseline/{database}.json | 비교 기준 파일 (없으면 이번 결과로 생성) |
+ * | report | build/reports/loadtest/{database}.json | 이번 결과 파일 |
+ * | update-baseline | false | true면 이번 결과로 기준 파일을 덮어쓴다 |
+ * | max-regression | 0.25 | 허용 회귀 비율 (p95 증가, 처리량 감소) |
+ */
+data class LoadTestSettings(
+    val database: Database,
+    val scale: DatasetScale,
+    val seed: Long,
+    val anchorDate: LocalDate,
+    val activeMembers: Int,
+    val concurrency: Int,
+    val warmup: Duration,
+    val duration: Duration,
+    val baselinePath: Path,
+    val reportPath: Path,
+    val updateBaseline: Boolean,
+    val maxRegression: Double,
+) {
+    enum class Database {
+        H2,
+        POSTGRESQL,
+    }
+
+    companion object {
+        private const val PREFIX = "loadtest."
+
+        fun fromSystemProperties(): LoadTestSettings {
+            val database = Database.valueOf(property("database", "h2").uppercase())
+            val defaultScale = DatasetScale()
+            val scale =
+                DatasetScale(
+                    members = property("members", defaultScale.members.toString()).toInt(),
+                    goalsPerMember = property("goals-per-member", defaultScale.goalsPerMember.toString()).toInt(),
+                    dailyGoalsPerMember =
+                        property("daily-goals-per-member", defaultScale.dailyGoalsPerMember.toString()).toInt(),
+                    tasksPerMember = property("tasks-per-member", defaultScale.tasksPerMember.toString()).toInt(),
+                    reviewsPerMember = property("reviews-per-member", defaultScale.reviewsPerMember.toString()).toInt(),
+                    days = property("days", defaultScale.days.toString()).toInt(),
+                )
+            val name = database.name.lowercase()
+            return LoadTestSettings(
+                database = database,
+                scale = scale,
+                seed = property("seed", "42").toLong(),
+                anchorDate = LocalDate.now(),
+                activeMembers = property("active-members", "1000").toInt().coerceAtMost(scale.members),
+                concurrency = property("concurrency", "16").toInt(),
+                warmup = Duration.ofSeconds(property("warmup-seconds", "10").toLong()),
+                duration = Duration.ofSeconds(property("duration-seconds", "30").toLong()),
+                baselinePath = Path.of(property("baseline", "src/loadTest/baseline/$name.json")),
+                reportPath = Path.of(property("report", "build/reports/loadtest/$name.json")),
+                updateBaseline = property("update-baseline", "false").toBoolean(),
+                maxRegression = property("max-regression", "0.25").toDouble(),
+            )
+        }
+
+        private fun property(
+            key: String,
+            default: String,
+        ): String = System.getProperty(PREFIX + key) ?: default
+    }
+}
+
+/**
+ * 합성 데이터 규모와 ID 배치.
+ *
+ * ID는 회원 순서대로 연속 구간을 차지한다. 예를 들어 회원 m의 목표 ID는 `(m-1)*goalsPerMember+1 .. m*goalsPerMember`이다.
+ * 부하 드라이버는 이 배치로 DB를 다시 읽지 않고도 회원별 목표·할일 ID를 고른다.
+ * 100k 회원 × 500 할일이면 할일 5천만 건이다.
+ */
+data class DatasetScale(
+    val members: Int = 1_000,
+    val goalsPerMember: Int = 5,
+    val dailyGoalsPerMember: Int = 20,
+    val tasksPerMember: Int = 200,
+    val reviewsPerMember: Int = 30,
+    val days: Int = 90,
+) {
+    init {
+        require(reviewsPerMember <= days) { "reviewsPerMember must not exceed days" }
+        require(dailyGoalsPerMember <= goalsPerMember * days) { "dailyGoalsPerMember must not exceed goals * days" }
+    }
+
+    fun memberIds(): LongRange = 1L..members
+
+    fun goalIdsOf(memberId: Long): LongRange = rangeOf(memberId, goalsPerMember)
+
+    fun taskIdsOf(memberId: Long): LongRange = rangeOf(memberId, tasksPerMember)
+
+    fun reviewIdsOf(memberId: Long): LongRange = rangeOf(memberId, reviewsPerMember)
+
+    fun dailyGoalIdsOf(memberId: Long): LongRange = rangeOf(memberId, dailyGoalsPerMember)
+
+    private fun rangeOf(
+        memberId: Long,
+        perMember: Int,
+    ): LongRange = ((memberId - 1) * perMember + 1)..(memberId * perMember)
+}
@@ -0,0 +1,90 @@
+package kr.io.team.loop.loadtest
+
+import java.time.LocalDate
+import java.util.Random
+
+/** 부하 드라이버가 보내는 GraphQL 요청 하나. */
+data class GraphQlRequest(
+    val query: String,
+    val variables: Map<String, Any?> = emptyMap(),
+)
+
+/** 가중치 [weight]로 선택되는 연산. [request]는 회원 ID와 난수로 요청을 만든다. */
+data class LoadOperation(
+    val name: String,
+    val weight: Int,
+    val request: (memberId: Long, random: Random) -> GraphQlRequest,
+)
+
+/**
+ * 실제 사용 패턴을 흉내 낸 연산 구성.
+ *
+ * 조회 연산은 서버에 등록된 연산 파일(graphql/operations)을 그대로 보낸다.
+ */
+class OperationMix(
+    val operations: List<LoadOperation>,
+) {
+    private val totalWeight = operations.sumOf { it.weight }
+
+    fun pick(random: Random): LoadOperation {
+        var remaining = random.nextInt(totalWeight)
+        return operations.first { operation ->
+            remaining -= operation.weight
+            remaining < 0
+        }
+    }
+
+    companion object {
+        private const val CREATE_TASK =
+            "mutation CreateTask(\$input: CreateTaskInput!) { createTask(input: \$input) { id status } }"
+        private const val UPDATE_TASK =
+            "mutation UpdateTask(\$input: UpdateTaskInput!) { updateTask(input: \$input) { id status } }"
+        private const val MY_REVIEW_STATS = "query MyReviewStats { myReviewStats { totalCount consecutiveDays } }"
+
+        fun default(
+            scale: DatasetScale,
+            anchorDate: LocalDate,
+        ): OperationMix {
+            val myGoals = operationDocument("MyGoals")
+            val myTasks = operationDocument("MyTasks")
+            val weeks = (scale.days / 7).coerceAtLeast(1)
+            return OperationMix(
+                listOf(
+                    LoadOperation("myGoals", 30) { _, _ -> GraphQlRequest(myGoals) },
+                    LoadOperation("myTasksByWeek", 30) { _, random ->
+                        val end = anchorDate.minusWeeks(random.nextInt(weeks).toLong())
+                        GraphQlRequest(
+                            myTasks,
+                            mapOf("filter" to mapOf("startDate" to end.minusDays(6).toString(), "endDate" to "$end")),
+                        )
+                    },
+                    LoadOperation("createTask", 15) { memberId, random ->
+                        val goalIds = scale.goalIdsOf(memberId)
+                        val input =
+                            mapOf(
+                                "title" to "Load task ${random.nextInt(1_000_000)}",
+                                "goalId" to (goalIds.first + random.nextInt(scale.goalsPerMember)).toString(),
+                                "date" to anchorDate.minusDays(random.nextInt(7).toLong()).toString(),
+                            )
+                        GraphQlRequest(CREATE_TASK, mapOf("input" to input))
+                    },
+                    LoadOperation("updateTask", 15) { memberId, random ->
+                        val taskIds = scale.taskIdsOf(memberId)
+                        val input =
+                            mapOf(
+                                "id" to (taskIds.first + random.nextInt(scale.tasksPerMember)).toString(),
+                                "status" to if (random.nextBoolean()) "DONE" else "TODO",
+                            )
+                        GraphQlRequest(UPDATE_TASK, mapOf("input" to input))
+                    },
+                    LoadOperation("myReviewStats", 10) { _, _ -> GraphQlRequest(MY_REVIEW_STATS) },
+                ),
+            )
+        }
+
+        private fun operationDocument(name: String): String =
+            checkNotNull(OperationMix::class.java.getResource("/graphql/operations/$name.graphql")) {
+                "Missing operation document: $name"
+            }.readText()
+    }
+}
@@ -0,0 +1,216 @@
+package kr.io.team.loop.loadtest
+
+import org.slf4j.LoggerFactory
+import java.sql.Connection
+import java.sql.PreparedStatement
+import java.time.LocalDate
+import java.time.OffsetDateTime
+import java.time.ZoneOffset
+import java.util.Random
+import javax.sql.DataSource
+
+/**
+ * 회원, 목표, 일별 목표, 할일, 회고(JSONB), 목표별 할일 통계를 [scale] 규모로 적재한다.
+ *
+ * - 같은 [seed]면 같은 데이터를 만든다. 날짜는 [anchorDate]부터 `days`일 전까지 분포한다.
+ * - ID는 [DatasetScale]의 배치대로 직접 지정하고, 적재 후 identity 시퀀스를 다음 값으로 재설정한다.
+ * - 회원 단위로 한 번만 순회하며 JDBC 배치로 쓰므로, 메모리 사용량은 규모와 무관하다.
+ *   PostgreSQL은 `reWriteBatchedInserts=true` 커넥션에서 가장 빠르다.
+ */
+class SyntheticDataGenerator(
+    private val dataSource: DataSource,
+    private val scale: DatasetScale,
+    private val seed: Long,
+    private val anchorDate: LocalDate,
+) {
+    private val log = LoggerFactory.getLogger(javaClass)
+
+    fun generate() {
+        dataSource.connection.use { connection ->
+            check(count(connection, "member") == 0L) { "Synthetic data must be generated into an empty database" }
+            connection.autoCommit = false
+            val start = System.nanoTime()
+            Writers(connection).use { writers ->
+                val random = Random(seed)
+                for (memberId in scale.memberIds()) {
+                    writeMember(writers, memberId, random)
+                    if (memberId % COMMIT_EVERY_MEMBERS == 0L) {
+                        writers.flush()
+                        connection.commit()
+                    }
+                    if (memberId % (scale.members / PROGRESS_STEPS).coerceAtLeast(1) == 0L) {
+                        log.info("[loadtest] generated {}/{} members", memberId, scale.members)
+                    }
+                }
+                writers.flush()
+            }
+            restartIdentities(connection)
+            connection.commit()
+            log.info(
+                "[loadtest] generated {} in {}s",
+                scale,
+                (System.nanoTime() - start) / 1_000_000_000,
+            )
+        }
+    }
+
+    private fun writeMember(
+        writers: Writers,
+        memberId: Long,
+        random: Random,
+    ) {
+        val createdAt = createdAt(anchorDate.minusDays(scale.days.toLong()))
+        writers.members.add(memberId, "member-$memberId", "loadtest-$memberId", PASSWORD_HASH, createdAt)
+
+        val goalIds = scale.goalIdsOf(memberId)
+        goalIds.forEachIndexed { index, goalId ->
+            writers.goals.add(goalId, "Goal ${index + 1}", memberId, createdAt)
+        }
+
+        scale.dailyGoalIdsOf(memberId).forEachIndexed { index, dailyGoalId ->
+            val date = anchorDate.minusDays((index / scale.goalsPerMember).toLong())
+            val goalId = goalIds.first + index % scale.goalsPerMember
+            writers.dailyGoals.add(dailyGoalId, goalId, memberId, date, createdAt(date))
+        }
+
+        val totalCounts = IntArray(scale.goalsPerMember)
+        val completedCounts = IntArray(scale.goalsPerMember)
+        scale.taskIdsOf(memberId).forEach { taskId ->
+            val goalIndex = random.nextInt(scale.goalsPerMember)
+            val date = anchorDate.minusDays(random.nextInt(scale.days).toLong())
+            val done = random.nextDouble() < DONE_RATIO
+            totalCounts[goalIndex]++
+            if (done) completedCounts[goalIndex]++
+            writers.tasks.add(
+                taskId,
+                "Task $taskId",
+                if (done) "DONE" else "TODO",
+                goalIds.first + goalIndex,
+                memberId,
+                date,
+                createdAt(date),
+            )
+        }
+        goalIds.forEachIndexed { index, goalId ->
+            writers.goalTaskStats.add(goalId, totalCounts[index], completedCounts[index])
+        }
+
+        val reviewDays = (0 until scale.days).shuffled(random).take(scale.reviewsPerMember)
+        scale.reviewIdsOf(memberId).zip(reviewDays).forEach { (reviewId, daysAgo) ->
+            val date = anchorDate.minusDays(daysAgo.toLong())
+            writers.reviews.add(reviewId, "DAILY", memberId, steps(random), date, "DAILY:$date", createdAt(date))
+        }
+    }
+
+    private fun steps(random: Random): String {
+        val types = listOf("KEEP", "PROBLEM", "TRY").filter { it == "KEEP" || random.nextBoolean() }
+        return types.joinToString(",", "[", "]") { """{"type":"$it","content":"$it note ${random.nextInt(1000)}"}""" }
+    }
+
+    private fun restartIdentities(connection: Connection) {
+        val nextIds =
+            listOf(
+                Triple("member", "member_id", scale.members.toLong()),
+                Triple("goal", "goal_id", scale.members.toLong() * scale.goalsPerMember),
+                Triple("daily_goal", "daily_goal_id", scale.members.toLong() * scale.dailyGoalsPerMember),
+                Triple("task", "task_id", scale.members.toLong() * scale.tasksPerMember),
+                Triple("review", "review_id", scale.members.toLong() * scale.reviewsPerMember),
+            )
+        connection.createStatement().use { statement ->
+            nextIds.forEach { (table, column, lastId) ->
+                statement.execute("ALTER TABLE $table ALTER COLUMN $column RESTART WITH ${lastId + 1}")
+            }
+        }
+    }
+
+    private fun count(
+        connection: Connection,
+        table: String,
+    ): Long =
+        connection.createStatement().use { statement ->
+            statement.executeQuery("SELECT COUNT(*) FROM $table").use { resultSet ->
+                resultSet.next()
+                resultSet.getLong(1)
+            }
+        }
+
+    private fun createdAt(date: LocalDate): OffsetDateTime = date.atTime(9, 0).atOffset(ZoneOffset.UTC)
+
+    /** 테이블별 배치 INSERT 묶음. */
+    private class Writers(
+        connection: Connection,
+    ) : AutoCloseable {
+        private val jsonParameter =
+            if (connection.metaData.databaseProductName == "PostgreSQL") "CAST(? AS jsonb)" else "? FORMAT JSON"
+
+        val members =
+            BatchInsert(connection, "member (member_id, nickname, login_id, password, created_at)", "?, ?, ?, ?, ?")
+        val goals = BatchInsert(connection, "goal (goal_id, title, member_id, created_at)", "?, ?, ?, ?")
+        val dailyGoals =
+            BatchInsert(connection, "daily_goal (daily_goal_id, goal_id, member_id, date, created_at)", "?, ?, ?, ?, ?")
+        val tasks =
+            BatchInsert(
+                connection,
+                "task (task_id, title, status, goal_id, member_id, task_date, created_at)",
+                "?, ?, ?, ?, ?, ?, ?",
+            )
+        val reviews =
+            BatchInsert(
+                connection,
+                "review (review_id, review_type, member_id, steps, start_date, period_key, created_at)",
+                "?, ?, ?, $jsonParameter, ?, ?, ?",
+            )
+        val goalTaskStats =
+            BatchInsert(connection, "goal_task_stats (goal_id, total_count, completed_count)", "?, ?, ?", false)
+
+        private val all = listOf(members, goals, dailyGoals, tasks, reviews, goalTaskStats)
+
+        fun flush() = all.forEach { it.flush() }
+
+        override fun close() = all.forEach { it.close() }
+    }
+
+    private class BatchInsert(
+        connection: Connection,
+        target: String,
+        values: String,
+        identity: Boolean = true,
+    ) : AutoCloseable {
+        // identity 컬럼(GENERATED ALWAYS)에 값을 직접 넣으려면 OVERRIDING SYSTEM VALUE가 필요하다
+        private val statement: PreparedStatement =
+            connection.prepareStatement(
+                "INSERT INTO $target ${if (identity) "OVERRIDING SYSTEM VALUE " else ""}VALUES ($values)",
+            )
+        private var pending = 0
+
+        fun add(vararg values: Any) {
+            values.forEachIndexed { index, value -> statement.setObject(index + 1, value) }
+            statement.addBatch()
+            if (++pending >= BATCH_SIZE) {
+                flush()
+            }
+        }
+
+        fun flush() {
+            if (pending > 0) {
+                statement.executeBatch()
+                pending = 0
+            }
+        }
+
+        override fun close() {
+            flush()
+            statement.close()
+        }
+    }
+
+    companion object {
+        private const val BATCH_SIZE = 1_000
+        private const val COMMIT_EVERY_MEMBERS = 500L
+        private const val PROGRESS_STEPS = 10
+        private const val DONE_RATIO = 0.6
+
+        // 형식만 맞춘 BCrypt 해시. 부하 테스트는 로그인 대신 JWT를 직접 발급하므로 검증되지 않는다
+        private const val PASSWORD_HASH = "\$2a\$10\$7EqJtq98hPqEX7fNZaFWoOhi5BWX4Z6gFG3k7Z9n5G6Rz1N1dS5xK"
+    }
+}
@@ -13,17 +13,24 @@ import kr.io.team.loop.codegen.types.AuthToken
 import kr.io.team.loop.codegen.types.LoginInput
 import kr.io.team.loop.codegen.types.RegisterInput
 import kr.io.team.loop.common.config.Authorize
+import kr.io.team.loop.common.config.CacheRegion
+import kr.io.team.loop.common.config.MemberCache
 import kr.io.team.loop.common.domain.MemberId
 import kr.io.team.loop.codegen.types.Member as MemberGraphql
 
 @DgsComponent
 class AuthDataFetcher(
     private val authService: AuthService,
+    private val memberCache: MemberCache,
 ) {
     @DgsQuery
     fun me(
         @Authorize memberId: Long,
-    ): MemberGraphql = authService.getMe(MemberId(memberId)).toGraphql()
+    ): MemberGraphql =
+        // 비밀번호 해시가 캐시에 남지 않도록 도메인 객체 대신 응답 타입을 캐시한다
+        memberCache.getOrLoad(CacheRegion.MEMBERS, MemberId(memberId), "me") {
+            authService.getMe(MemberId(memberId)).toGraphql()
+        }
 
     @DgsMutation
     fun register(
@@ -1,6 +1,5 @@
 package kr.io.team.loop.common.config
 
-import com.netflix.graphql.dgs.context.DgsContext
 import com.netflix.graphql.dgs.internal.method.ArgumentResolver
 import graphql.schema.DataFetchingEnvironment
 import kr.io.team.loop.common.domain.exception.AuthenticationException
@@ -12,7 +11,7 @@ import org.springframework.stereotype.Component
 @Component
 @Order(Ordered.HIGHEST_PRECEDENCE + 50)
 class AuthorizeArgumentResolver(
-    private val jwtTokenProvider: JwtTokenProvider,
+    private val requestMemberResolver: RequestMemberResolver,
 ) : ArgumentResolver {
     override fun supportsParameter(parameter: MethodParameter): Boolean =
         parameter.hasParameterAnnotation(Authorize::class.java)
@@ -22,10 +21,10 @@ class AuthorizeArgumentResolver(
         dfe: DataFetchingEnvironment,
     ): Any? {
         val authorize = parameter.getParameterAnnotation(Authorize::class.java)!!
-        val token = extractToken(dfe)
+        val memberId = requestMemberResolver.resolve(dfe.graphQlContext)
 
-        if (token != null && jwtTokenProvider.validateToken(token)) {
-            return jwtTokenProvider.getMemberIdFromToken(token)
+        if (memberId != null) {
+            return memberId
         }
 
         if (authorize.require) {
@@ -33,14 +32,4 @@ class AuthorizeArgumentResolver(
         }
         return null
     }
-
-    private fun extractToken(dfe: DataFetchingEnvironment): String? {
-        val authHeader =
-            DgsContext
-                .getRequestData(dfe)
-                ?.headers
-                ?.getFirst("Authorization")
-                ?: return null
-        return authHeader.removePrefix("Bearer ").takeIf { it != authHeader }
-    }
 }
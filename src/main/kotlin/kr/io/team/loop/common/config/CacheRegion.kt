@@ -0,0 +1,10 @@
+package kr.io.team.loop.common.config
+
+enum class CacheRegion(
+    val cacheName: String,
+) {
+    GOALS("goals"),
+    TASKS("tasks"),
+    REVIEW_STATS("reviewStats"),
+    MEMBERS("members"),
+}
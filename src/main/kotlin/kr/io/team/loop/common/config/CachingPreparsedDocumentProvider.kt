@@ -0,0 +1,138 @@
+package kr.io.team.loop.common.config
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import graphql.ExecutionInput
+import graphql.execution.preparsed.PreparsedDocumentEntry
+import graphql.execution.preparsed.PreparsedDocumentProvider
+import graphql.execution.preparsed.persisted.ApolloPersistedQuerySupport
+import graphql.execution.preparsed.persisted.PersistedQueryCache
+import graphql.execution.preparsed.persisted.PersistedQueryCacheMiss
+import graphql.execution.preparsed.persisted.PersistedQueryNotFound
+import graphql.execution.preparsed.persisted.PersistedQuerySupport.PERSISTED_QUERY_MARKER
+import io.micrometer.core.instrument.Gauge
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import io.micrometer.core.instrument.binder.cache.CaffeineCacheMetrics
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.security.MessageDigest
+import java.util.HexFormat
+import java.util.concurrent.CompletableFuture
+import java.util.concurrent.ConcurrentHashMap
+import java.util.concurrent.TimeUnit
+import java.util.function.Function
+
+/**
+ * 파싱·검증된 GraphQL 문서 캐시와 Apollo 방식 자동 persisted query(APQ)를 제공한다.
+ *
+ * - 문서는 쿼리 원문을 키로 크기 제한 캐시에 보관해, 같은 연산은 다시 파싱·검증하지 않는다.
+ * - APQ 프로토콜(해시 추출, 해시 검증, PersistedQueryNotFound/PersistedQueryIdInvalid 오류)은
+ *   graphql-java의 [ApolloPersistedQuerySupport]가 처리하고, 이 클래스는 해시별 원문 저장소만 제공한다.
+ * - 오류가 있는 결과(검증 실패, 없는 해시, 해시 불일치)는 어느 캐시에도 저장하지 않는다.
+ * - [register]로 등록한 연산(서버에 포함된 연산)의 해시는 캐시 크기와 무관하게 유지된다.
+ */
+@Component
+class CachingPreparsedDocumentProvider(
+    meterRegistry: MeterRegistry,
+    @Value("\${app.graphql.document-cache.maximum-size:500}") documentCacheSize: Long,
+    @Value("\${app.graphql.persisted-queries.maximum-size:1000}") persistedQueryCacheSize: Long,
+) : PreparsedDocumentProvider {
+    private val documents: Cache<String, PreparsedDocumentEntry> =
+        Caffeine
+            .newBuilder()
+            .maximumSize(documentCacheSize)
+            .recordStats()
+            .build()
+
+    private val persistedQueries = PersistedQueries(persistedQueryCacheSize)
+
+    private val persistedQuerySupport = ApolloPersistedQuerySupport(persistedQueries)
+
+    private val parseAndValidateTimer: Timer =
+        Timer
+            .builder("graphql.document.parse.validate")
+            .description("Time spent parsing and validating GraphQL documents on cache miss")
+            .register(meterRegistry)
+
+    init {
+        CaffeineCacheMetrics.monitor(meterRegistry, documents, "graphqlDocuments")
+        Gauge
+            .builder("graphql.document.cache.hit.ratio", documents) { it.stats().hitRate() }
+            .description("Hit ratio of the parsed GraphQL document cache")
+            .register(meterRegistry)
+    }
+
+    override fun getDocumentAsync(
+        executionInput: ExecutionInput,
+        parseAndValidateFunction: Function<ExecutionInput, PreparsedDocumentEntry>,
+    ): CompletableFuture<PreparsedDocumentEntry> =
+        persistedQuerySupport.getDocumentAsync(executionInput) { input -> document(input, parseAndValidateFunction) }
+
+    /** 서버에 포함된 연산을 미리 파싱·검증한 결과와 함께 등록한다. */
+    fun register(
+        query: String,
+        entry: PreparsedDocumentEntry,
+    ) {
+        persistedQueries.register(sha256(query), query)
+        documents.put(query, entry)
+    }
+
+    private fun document(
+        executionInput: ExecutionInput,
+        parseAndValidateFunction: Function<ExecutionInput, PreparsedDocumentEntry>,
+    ): PreparsedDocumentEntry {
+        val query = executionInput.query
+        documents.getIfPresent(query)?.let { return it }
+        val start = System.nanoTime()
+        val entry = parseAndValidateFunction.apply(executionInput)
+        parseAndValidateTimer.record(System.nanoTime() - start, TimeUnit.NANOSECONDS)
+        if (!entry.hasErrors()) {
+            documents.put(query, entry)
+        }
+        return entry
+    }
+
+    private fun sha256(query: String): String =
+        HexFormat.of().formatHex(MessageDigest.getInstance("SHA-256").digest(query.toByteArray()))
+
+    /**
+     * 해시별 쿼리 원문 저장소. 문서 자체는 원문 키 캐시([documents])가 보관하므로 여기에는 원문만 둔다.
+     *
+     * 처음 보는 해시에 원문이 없으면 [PersistedQueryNotFound]를 던지고,
+     * 원문이 있으면 [PersistedQueryCacheMiss]가 해시를 검증하고 파싱한 결과에 오류가 없을 때만 저장한다.
+     */
+    private class PersistedQueries(
+        maximumSize: Long,
+    ) : PersistedQueryCache {
+        private val queries: Cache<Any, String> = Caffeine.newBuilder().maximumSize(maximumSize).build()
+        private val registeredQueries = ConcurrentHashMap<Any, String>()
+
+        fun register(
+            persistedQueryId: Any,
+            query: String,
+        ) {
+            registeredQueries[persistedQueryId] = query
+        }
+
+        override fun getPersistedQueryDocumentAsync(
+            persistedQueryId: Any,
+            executionInput: ExecutionInput,
+            onCacheMiss: PersistedQueryCacheMiss,
+        ): CompletableFuture<PreparsedDocumentEntry> {
+            val known = registeredQueries[persistedQueryId] ?: queries.getIfPresent(persistedQueryId)
+            if (known != null) {
+                return CompletableFuture.completedFuture(onCacheMiss.apply(known))
+            }
+            // 원문 없이 해시만 온 요청은 빈 문자열이나 PERSISTED_QUERY_MARKER(Spring GraphQL)로 들어온다
+            val query =
+                executionInput.query.takeUnless { it.isNullOrBlank() || it == PERSISTED_QUERY_MARKER }
+                    ?: throw PersistedQueryNotFound(persistedQueryId)
+            val entry = onCacheMiss.apply(query)
+            if (!entry.hasErrors()) {
+                queries.put(persistedQueryId, query)
+            }
+            return CompletableFuture.completedFuture(entry)
+        }
+    }
+}
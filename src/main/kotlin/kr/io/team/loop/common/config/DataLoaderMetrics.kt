@@ -0,0 +1,46 @@
+package kr.io.team.loop.common.config
+
+import io.micrometer.core.instrument.DistributionSummary
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.util.concurrent.CompletionStage
+import java.util.concurrent.TimeUnit
+
+/**
+ * DataLoader 배치 크기(`graphql.dataloader.batch.size`)와 배치 처리 시간(`graphql.dataloader.dispatch`)을 기록한다.
+ *
+ * `app.tracing.data-loaders.enabled=false`이면 배치 함수를 그대로 호출한다.
+ */
+@Component
+class DataLoaderMetrics(
+    private val meterRegistry: MeterRegistry,
+    @Value("\${app.tracing.data-loaders.enabled:false}") private val enabled: Boolean,
+) {
+    fun <T> record(
+        name: String,
+        batchSize: Int,
+        load: () -> CompletionStage<T>,
+    ): CompletionStage<T> {
+        if (!enabled) {
+            return load()
+        }
+        DistributionSummary
+            .builder("graphql.dataloader.batch.size")
+            .description("Number of keys per DataLoader batch")
+            .tag("loader", name)
+            .publishPercentileHistogram()
+            .register(meterRegistry)
+            .record(batchSize.toDouble())
+        val timer =
+            Timer
+                .builder("graphql.dataloader.dispatch")
+                .description("Time from DataLoader batch dispatch to completion")
+                .tag("loader", name)
+                .publishPercentileHistogram()
+                .register(meterRegistry)
+        val start = System.nanoTime()
+        return load().whenComplete { _, _ -> timer.record(System.nanoTime() - start, TimeUnit.NANOSECONDS) }
+    }
+}
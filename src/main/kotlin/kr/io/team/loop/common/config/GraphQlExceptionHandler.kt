@@ -8,6 +8,8 @@ import kr.io.team.loop.common.domain.exception.BusinessRuleException
 import kr.io.team.loop.common.domain.exception.DuplicateEntityException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
 import kr.io.team.loop.common.domain.exception.InvalidInputException
+import kr.io.team.loop.common.domain.exception.QueryComplexityException
+import kr.io.team.loop.common.domain.exception.RateLimitExceededException
 import org.slf4j.LoggerFactory
 import org.springframework.graphql.data.method.annotation.GraphQlExceptionHandler
 import org.springframework.web.bind.annotation.ControllerAdvice
@@ -75,4 +77,24 @@ class GraphQlExceptionHandler {
             .message(ex.message)
             .build()
     }
+
+    @GraphQlExceptionHandler
+    fun handleQueryComplexity(ex: QueryComplexityException): GraphQLError {
+        log.warn("[BAD_REQUEST] {}", ex.message)
+        return GraphQLError
+            .newError()
+            .errorType(ErrorType.BAD_REQUEST)
+            .message(ex.message)
+            .build()
+    }
+
+    @GraphQlExceptionHandler
+    fun handleRateLimitExceeded(ex: RateLimitExceededException): GraphQLError {
+        log.warn("[UNAVAILABLE] {}", ex.message)
+        return GraphQLError
+            .newError()
+            .errorType(ErrorType.UNAVAILABLE)
+            .message(ex.message)
+            .build()
+    }
 }
@@ -0,0 +1,83 @@
+package kr.io.team.loop.common.config
+
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.cache.Cache
+import org.springframework.cache.CacheManager
+import org.springframework.cache.concurrent.ConcurrentMapCache
+import org.springframework.cache.support.NoOpCache
+import org.springframework.stereotype.Component
+import com.github.benmanes.caffeine.cache.Cache as CaffeineCache
+
+/**
+ * 같은 JVM 안의 Spring [CacheManager](기본 Caffeine)에 객체 참조를 그대로 저장하는 [MemberCacheBackend].
+ *
+ * 캐시되는 도메인 객체는 직렬화를 지원하지 않으므로, 값을 직렬화하는 캐시(Redis, storeByValue 등)가 설정되면
+ * 첫 요청에서 실패하는 대신 기동 시점에 거부한다. CacheManager에 없는 영역은 캐시하지 않는다.
+ *
+ * 무효화(세대 교체)도 이 노드의 캐시에만 반영되므로, 여러 인스턴스로 배포하면 다른 노드는 TTL(기본 5분)이
+ * 지날 때까지 이전 값을 돌려준다. 그래서 `app.cache.member.single-instance=false`이면 기동을 거부하고,
+ * 배포 형태를 밝히지 않았으면 기동 시 경고를 남긴다. 여러 인스턴스에서는 노드 간 무효화를 전파하는
+ * 공유 [MemberCacheBackend] 구현이 필요하다.
+ */
+@Component
+class InProcessMemberCacheBackend(
+    cacheManager: CacheManager,
+    @Value("\${app.cache.member.single-instance:#{null}}") singleInstance: Boolean?,
+) : MemberCacheBackend {
+    private val log = LoggerFactory.getLogger(javaClass)
+
+    private val caches: Map<CacheRegion, Cache> =
+        CacheRegion.entries
+            .mapNotNull { region -> cacheManager.getCache(region.cacheName)?.let { region to it } }
+            .toMap()
+
+    init {
+        caches.forEach { (region, cache) ->
+            check(cache.storesByReference()) {
+                "Cache '${region.cacheName}' (${cache.javaClass.name}) does not store values by reference; " +
+                    "MemberCache needs an in-process cache or a serializing MemberCacheBackend"
+            }
+        }
+        // 캐시가 꺼져 있으면(NoOp) 오래된 값이 남을 일이 없으므로 배포 형태와 무관하다
+        if (caches.values.any { it !is NoOpCache }) {
+            check(singleInstance != false) {
+                "InProcessMemberCacheBackend only evicts entries on the local node; " +
+                    "provide a shared MemberCacheBackend for multi-instance deployments"
+            }
+            if (singleInstance == null) {
+                log.warn(
+                    "[MEMBER_CACHE] app.cache.member.single-instance is not set. InProcessMemberCacheBackend " +
+                        "evicts only this node; with more than one instance, other nodes serve stale entries " +
+                        "until the cache TTL expires.",
+                )
+            }
+        }
+    }
+
+    override fun get(
+        region: CacheRegion,
+        key: String,
+    ): Any? = caches[region]?.get(key)?.get()
+
+    override fun put(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    ) {
+        caches[region]?.put(key, value)
+    }
+
+    override fun putIfAbsent(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    ): Any? = caches[region]?.putIfAbsent(key, value)?.get()
+
+    private fun Cache.storesByReference(): Boolean =
+        when (this) {
+            is ConcurrentMapCache -> !isStoreByValue
+            is NoOpCache -> true
+            else -> nativeCache is CaffeineCache<*, *>
+        }
+}
@@ -1,5 +1,6 @@
 package kr.io.team.loop.common.config
 
+import io.jsonwebtoken.JwtParser
 import io.jsonwebtoken.Jwts
 import io.jsonwebtoken.security.Keys
 import org.springframework.beans.factory.annotation.Value
@@ -14,6 +15,13 @@ class JjwtTokenProvider(
 ) : JwtTokenProvider {
     private val key: SecretKey = Keys.hmacShaKeyFor(secret.toByteArray())
 
+    // JwtParser는 불변이고 thread-safe하므로 한 번만 만든다
+    private val parser: JwtParser =
+        Jwts
+            .parser()
+            .verifyWith(key)
+            .build()
+
     override fun generateToken(memberId: Long): String {
         val now = Date()
         val expiry = Date(now.time + expirationMs)
@@ -26,25 +34,11 @@ class JjwtTokenProvider(
             .compact()
     }
 
-    override fun validateToken(token: String): Boolean =
+    override fun verify(token: String): VerifiedToken? =
         try {
-            Jwts
-                .parser()
-                .verifyWith(key)
-                .build()
-                .parseSignedClaims(token)
-            true
+            val claims = parser.parseSignedClaims(token).payload
+            VerifiedToken(memberId = claims.subject.toLong(), expiresAt = claims.expiration.toInstant())
         } catch (_: Exception) {
-            false
+            null
         }
-
-    override fun getMemberIdFromToken(token: String): Long =
-        Jwts
-            .parser()
-            .verifyWith(key)
-            .build()
-            .parseSignedClaims(token)
-            .payload
-            .subject
-            .toLong()
 }
@@ -3,7 +3,6 @@ package kr.io.team.loop.common.config
 interface JwtTokenProvider {
     fun generateToken(memberId: Long): String
 
-    fun validateToken(token: String): Boolean
-
-    fun getMemberIdFromToken(token: String): Long
+    /** 서명과 만료를 검증하고, 유효하지 않으면 null을 반환한다. */
+    fun verify(token: String): VerifiedToken?
 }
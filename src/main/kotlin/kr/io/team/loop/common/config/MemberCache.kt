@@ -0,0 +1,50 @@
+package kr.io.team.loop.common.config
+
+import kr.io.team.loop.common.domain.MemberId
+import org.springframework.stereotype.Component
+import java.util.UUID
+
+/**
+ * 회원 단위 read-through 캐시.
+ *
+ * 항목 키에 회원별 세대(generation)를 포함하므로, 무효화는 세대만 교체하면 해당 회원의 기존 항목이
+ * 모두 조회되지 않는다 (남은 항목은 크기/TTL 정책으로 정리된다). 세대도 같은 [MemberCacheBackend]에 저장되어
+ * 저장소를 공유하는 노드는 같은 무효화를 본다. 기본 저장소는 [InProcessMemberCacheBackend]다.
+ */
+@Component
+class MemberCache(
+    private val backend: MemberCacheBackend,
+) {
+    fun <T : Any> getOrLoad(
+        region: CacheRegion,
+        memberId: MemberId,
+        key: Any,
+        loader: () -> T,
+    ): T {
+        val entryKey = "${memberId.value}:${generationOf(region, memberId)}:$key"
+        @Suppress("UNCHECKED_CAST")
+        val cached = backend.get(region, entryKey) as T?
+        return cached ?: loader().also { backend.put(region, entryKey, it) }
+    }
+
+    fun evict(
+        region: CacheRegion,
+        memberId: MemberId,
+    ) {
+        backend.put(region, generationKey(memberId), newGeneration())
+    }
+
+    private fun generationOf(
+        region: CacheRegion,
+        memberId: MemberId,
+    ): String {
+        val key = generationKey(memberId)
+        backend.get(region, key)?.let { return it as String }
+        val generation = newGeneration()
+        return backend.putIfAbsent(region, key, generation) as String? ?: generation
+    }
+
+    private fun generationKey(memberId: MemberId): String = "${memberId.value}:generation"
+
+    private fun newGeneration(): String = UUID.randomUUID().toString()
+}
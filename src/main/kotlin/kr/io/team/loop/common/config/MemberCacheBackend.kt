@@ -0,0 +1,27 @@
+package kr.io.team.loop.common.config
+
+/**
+ * [MemberCache]가 항목과 회원별 세대를 보관하는 저장소.
+ *
+ * 값은 도메인 객체나 응답 타입의 참조 그대로 넘어온다. 프로세스 밖에 저장하는 구현은 직렬화 형식을 스스로 정하고,
+ * 세대 교체가 모든 노드에 보이도록 저장소를 공유해야 한다. 비밀번호 해시 같은 민감 정보는 캐시 값에 넣지 않는다.
+ */
+interface MemberCacheBackend {
+    fun get(
+        region: CacheRegion,
+        key: String,
+    ): Any?
+
+    fun put(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    )
+
+    /** [key]에 값이 없을 때만 저장하고, 이미 있던 값을 돌려준다 (없었으면 null). */
+    fun putIfAbsent(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    ): Any?
+}
@@ -0,0 +1,28 @@
+package kr.io.team.loop.common.config
+
+import kr.io.team.loop.common.domain.event.GoalChangedEvent
+import kr.io.team.loop.common.domain.event.ReviewChangedEvent
+import kr.io.team.loop.common.domain.event.TaskChangedEvent
+import org.springframework.stereotype.Component
+import org.springframework.transaction.event.TransactionPhase
+import org.springframework.transaction.event.TransactionalEventListener
+
+@Component
+class MemberCacheEventListener(
+    private val memberCache: MemberCache,
+) {
+    @TransactionalEventListener(phase = TransactionPhase.AFTER_COMMIT)
+    fun handleGoalChanged(event: GoalChangedEvent) {
+        memberCache.evict(CacheRegion.GOALS, event.memberId)
+    }
+
+    @TransactionalEventListener(phase = TransactionPhase.AFTER_COMMIT)
+    fun handleTaskChanged(event: TaskChangedEvent) {
+        memberCache.evict(CacheRegion.TASKS, event.memberId)
+    }
+
+    @TransactionalEventListener(phase = TransactionPhase.AFTER_COMMIT)
+    fun handleReviewChanged(event: ReviewChangedEvent) {
+        memberCache.evict(CacheRegion.REVIEW_STATS, event.memberId)
+    }
+}
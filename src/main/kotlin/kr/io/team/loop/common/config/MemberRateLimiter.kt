@@ -0,0 +1,60 @@
+package kr.io.team.loop.common.config
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.time.Duration
+
+/**
+ * 회원별 토큰 버킷 레이트 리미터.
+ *
+ * 버킷은 [capacity]개까지 토큰을 모으고 초당 [refillPerSecond]개씩 채워진다. 연산 하나가 토큰 하나를 쓴다.
+ * 일정 시간 요청이 없는 회원의 버킷은 가득 찬 상태와 같으므로 캐시에서 제거해도 된다.
+ */
+@Component
+class MemberRateLimiter(
+    @Value("\${app.graphql.rate-limit.capacity:60}") private val capacity: Long,
+    @Value("\${app.graphql.rate-limit.refill-per-second:10}") private val refillPerSecond: Long,
+    @Value("\${app.graphql.rate-limit.maximum-members:100000}") maximumMembers: Long,
+) {
+    private val buckets: Cache<Long, TokenBucket> =
+        Caffeine
+            .newBuilder()
+            .maximumSize(maximumMembers)
+            .expireAfterAccess(Duration.ofSeconds(capacity / refillPerSecond.coerceAtLeast(1) + 1))
+            .build()
+
+    fun tryAcquire(
+        memberId: Long,
+        nowNanos: Long = System.nanoTime(),
+    ): Boolean =
+        buckets
+            .get(memberId) { TokenBucket(capacity.toDouble(), nowNanos) }
+            .tryConsume(capacity.toDouble(), refillPerSecond / NANOS_PER_SECOND, nowNanos)
+
+    private class TokenBucket(
+        private var tokens: Double,
+        private var refilledAt: Long,
+    ) {
+        @Synchronized
+        fun tryConsume(
+            capacity: Double,
+            refillPerNano: Double,
+            nowNanos: Long,
+        ): Boolean {
+            val elapsed = (nowNanos - refilledAt).coerceAtLeast(0)
+            tokens = (tokens + elapsed * refillPerNano).coerceAtMost(capacity)
+            refilledAt = maxOf(refilledAt, nowNanos)
+            if (tokens < 1.0) {
+                return false
+            }
+            tokens -= 1.0
+            return true
+        }
+    }
+
+    companion object {
+        private const val NANOS_PER_SECOND = 1_000_000_000.0
+    }
+}
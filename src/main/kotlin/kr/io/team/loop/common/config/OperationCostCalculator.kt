@@ -0,0 +1,74 @@
+package kr.io.team.loop.common.config
+
+import graphql.analysis.QueryTraverser
+import graphql.analysis.QueryVisitorFieldEnvironment
+import graphql.analysis.QueryVisitorStub
+import graphql.execution.CoercedVariables
+import graphql.language.Document
+import graphql.schema.GraphQLSchema
+import org.springframework.stereotype.Component
+
+/**
+ * 스키마의 `@cost` 디렉티브로 선언된 필드 가중치를 이용해 연산의 정적 비용과 깊이를 계산한다.
+ *
+ * 필드 비용은 `weight + 배수 * 하위 필드 비용 합`이다. 배수는 `first` 인자, 디렉티브의 `listSize`, 1 순으로 정한다.
+ * 디렉티브가 없는 필드의 가중치는 1이며, 인트로스펙션 필드는 계산에서 제외한다.
+ */
+@Component
+class OperationCostCalculator {
+    fun calculate(
+        schema: GraphQLSchema,
+        document: Document,
+        operationName: String?,
+        variables: CoercedVariables,
+    ): OperationCost {
+        val childCosts = HashMap<QueryVisitorFieldEnvironment?, Long>()
+        var maxDepth = 0
+        QueryTraverser
+            .newQueryTraverser()
+            .schema(schema)
+            .document(document)
+            .operationName(operationName)
+            .coercedVariables(variables)
+            .build()
+            .visitPostOrder(
+                object : QueryVisitorStub() {
+                    override fun visitField(env: QueryVisitorFieldEnvironment) {
+                        val ancestors = generateSequence(env) { it.parentEnvironment }.toList()
+                        if (ancestors.last().fieldDefinition.name.startsWith("__")) {
+                            return
+                        }
+                        val cost = env.weight() + env.multiplier() * childCosts.getOrDefault(env, 0L)
+                        childCosts.merge(env.parentEnvironment, cost, Long::plus)
+                        maxDepth = maxOf(maxDepth, ancestors.size)
+                    }
+                },
+            )
+        return OperationCost(cost = childCosts.getOrDefault(null, 0L), depth = maxDepth)
+    }
+
+    private fun QueryVisitorFieldEnvironment.weight(): Long =
+        costArgument(WEIGHT_ARGUMENT)?.toLong() ?: DEFAULT_WEIGHT
+
+    private fun QueryVisitorFieldEnvironment.multiplier(): Long =
+        ((arguments[FIRST_ARGUMENT] as? Int) ?: costArgument(LIST_SIZE_ARGUMENT))?.toLong() ?: 1L
+
+    private fun QueryVisitorFieldEnvironment.costArgument(name: String): Int? =
+        fieldDefinition
+            .getAppliedDirective(COST_DIRECTIVE)
+            ?.getArgument(name)
+            ?.getValue<Int?>()
+
+    companion object {
+        private const val COST_DIRECTIVE = "cost"
+        private const val WEIGHT_ARGUMENT = "weight"
+        private const val LIST_SIZE_ARGUMENT = "listSize"
+        private const val FIRST_ARGUMENT = "first"
+        private const val DEFAULT_WEIGHT = 1L
+    }
+}
+
+data class OperationCost(
+    val cost: Long,
+    val depth: Int,
+)
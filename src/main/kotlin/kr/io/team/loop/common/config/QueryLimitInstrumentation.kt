@@ -0,0 +1,120 @@
+package kr.io.team.loop.common.config
+
+import graphql.ExecutionResult
+import graphql.GraphQLError
+import graphql.execution.AbortExecutionException
+import graphql.execution.instrumentation.InstrumentationContext
+import graphql.execution.instrumentation.InstrumentationState
+import graphql.execution.instrumentation.SimplePerformantInstrumentation
+import graphql.execution.instrumentation.parameters.InstrumentationExecuteOperationParameters
+import io.micrometer.core.instrument.Counter
+import io.micrometer.core.instrument.DistributionSummary
+import io.micrometer.core.instrument.MeterRegistry
+import kr.io.team.loop.common.domain.exception.QueryComplexityException
+import kr.io.team.loop.common.domain.exception.RateLimitExceededException
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+
+/**
+ * 실행 직전(파싱·검증 이후)에 연산 단위 제한을 적용하는 instrumentation.
+ *
+ * 1. [OperationCostCalculator]로 계산한 비용과 깊이가 설정값을 넘으면 실행하지 않는다.
+ * 2. 인증된 회원은 [MemberRateLimiter]의 토큰 버킷에서 토큰 하나를 소비해야 한다.
+ *
+ * 비용·깊이 검사를 먼저 하므로 어차피 거절될 연산은 토큰을 소비하지 않는다.
+ * 거절된 연산은 리졸버를 하나도 실행하지 않으며, 오류는 [GraphQlExceptionHandler]의 매핑으로 만들어진다.
+ * 연산별 비용·깊이는 Prometheus 히스토그램으로 기록해 제한값 조정에 사용한다.
+ * 태그에는 [RegisteredOperations]에 등록된 연산 이름만 쓴다.
+ */
+@Component
+class QueryLimitInstrumentation(
+    private val requestMemberResolver: RequestMemberResolver,
+    private val memberRateLimiter: MemberRateLimiter,
+    private val operationCostCalculator: OperationCostCalculator,
+    private val registeredOperations: RegisteredOperations,
+    private val exceptionHandler: GraphQlExceptionHandler,
+    private val meterRegistry: MeterRegistry,
+    @Value("\${app.graphql.limits.max-cost:5000}") private val maxCost: Long,
+    @Value("\${app.graphql.limits.max-depth:10}") private val maxDepth: Int,
+) : SimplePerformantInstrumentation() {
+    override fun beginExecuteOperation(
+        parameters: InstrumentationExecuteOperationParameters,
+        state: InstrumentationState?,
+    ): InstrumentationContext<ExecutionResult>? {
+        val context = parameters.executionContext
+        val operationCost =
+            operationCostCalculator.calculate(
+                context.graphQLSchema,
+                context.document,
+                context.operationDefinition.name,
+                context.coercedVariables,
+            )
+        record(registeredOperations.metricTag(context.operationDefinition.name), operationCost)
+        if (operationCost.depth > maxDepth) {
+            reject(
+                REASON_DEPTH,
+                exceptionHandler.handleQueryComplexity(
+                    QueryComplexityException("Query depth ${operationCost.depth} exceeds maximum $maxDepth"),
+                ),
+            )
+        }
+        if (operationCost.cost > maxCost) {
+            reject(
+                REASON_COST,
+                exceptionHandler.handleQueryComplexity(
+                    QueryComplexityException("Query cost ${operationCost.cost} exceeds maximum $maxCost"),
+                ),
+            )
+        }
+
+        val memberId = requestMemberResolver.resolve(context.graphQLContext)
+        if (memberId != null && !memberRateLimiter.tryAcquire(memberId)) {
+            reject(
+                REASON_RATE_LIMIT,
+                exceptionHandler.handleRateLimitExceeded(
+                    RateLimitExceededException("Rate limit exceeded for member: $memberId"),
+                ),
+            )
+        }
+        return super.beginExecuteOperation(parameters, state)
+    }
+
+    private fun record(
+        operationTag: String,
+        operationCost: OperationCost,
+    ) {
+        DistributionSummary
+            .builder("graphql.operation.cost")
+            .description("Static cost of executed GraphQL operations")
+            .tag("operation", operationTag)
+            .publishPercentileHistogram()
+            .register(meterRegistry)
+            .record(operationCost.cost.toDouble())
+        DistributionSummary
+            .builder("graphql.operation.depth")
+            .description("Selection depth of executed GraphQL operations")
+            .tag("operation", operationTag)
+            .publishPercentileHistogram()
+            .register(meterRegistry)
+            .record(operationCost.depth.toDouble())
+    }
+
+    private fun reject(
+        reason: String,
+        error: GraphQLError,
+    ): Nothing {
+        Counter
+            .builder("graphql.operation.rejected")
+            .description("GraphQL operations rejected before execution")
+            .tag("reason", reason)
+            .register(meterRegistry)
+            .increment()
+        throw AbortExecutionException(listOf(error))
+    }
+
+    companion object {
+        private const val REASON_RATE_LIMIT = "rate_limit"
+        private const val REASON_DEPTH = "depth"
+        private const val REASON_COST = "cost"
+    }
+}
@@ -0,0 +1,33 @@
+package kr.io.team.loop.common.config
+
+import graphql.ExecutionInput
+import graphql.ParseAndValidate
+import graphql.execution.preparsed.PreparsedDocumentEntry
+import graphql.schema.GraphQLSchema
+import org.slf4j.LoggerFactory
+import org.springframework.boot.context.event.ApplicationReadyEvent
+import org.springframework.context.event.EventListener
+import org.springframework.stereotype.Component
+
+/**
+ * 시작 시 `graphql/operations/` 아래 등록된 연산을 파싱·검증해 문서 캐시에 올린다.
+ * 스키마와 맞지 않는 연산이 있으면 기동을 실패시킨다.
+ */
+@Component
+class RegisteredOperationPrecompiler(
+    private val schema: GraphQLSchema,
+    private val registeredOperations: RegisteredOperations,
+    private val documentProvider: CachingPreparsedDocumentProvider,
+) {
+    private val log = LoggerFactory.getLogger(javaClass)
+
+    @EventListener(ApplicationReadyEvent::class)
+    fun precompile() {
+        registeredOperations.documents.forEach { (filename, query) ->
+            val result = ParseAndValidate.parseAndValidate(schema, ExecutionInput.newExecutionInput(query).build())
+            check(!result.isFailure) { "Registered operation $filename is invalid: ${result.errors}" }
+            documentProvider.register(query, PreparsedDocumentEntry(result.document))
+        }
+        log.info("Precompiled {} registered GraphQL operations", registeredOperations.documents.size)
+    }
+}
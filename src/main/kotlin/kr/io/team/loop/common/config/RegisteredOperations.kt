@@ -0,0 +1,36 @@
+package kr.io.team.loop.common.config
+
+import graphql.language.OperationDefinition
+import graphql.parser.Parser
+import org.springframework.core.io.support.PathMatchingResourcePatternResolver
+import org.springframework.stereotype.Component
+
+/**
+ * `graphql/operations/` 아래 등록된 연산 문서와 그 연산 이름.
+ *
+ * 클라이언트가 보낸 연산 이름은 임의의 문자열이므로, 지표 태그에는 등록된 이름만 쓰고 나머지는 [OTHER_OPERATION]으로 묶는다.
+ */
+@Component
+class RegisteredOperations {
+    /** 파일 이름별 연산 문서. */
+    val documents: Map<String, String> =
+        PathMatchingResourcePatternResolver()
+            .getResources(OPERATIONS_LOCATION)
+            .associate { resource ->
+                (resource.filename ?: resource.description) to resource.getContentAsString(Charsets.UTF_8)
+            }
+
+    val operationNames: Set<String> =
+        documents.values
+            .flatMap { query -> Parser.parse(query).getDefinitionsOfType(OperationDefinition::class.java) }
+            .mapNotNull { it.name }
+            .toSet()
+
+    /** 등록된 연산 이름은 그대로, 그 밖의 이름(익명 포함)은 [OTHER_OPERATION]으로 돌려준다. */
+    fun metricTag(operationName: String?): String = operationName?.takeIf { it in operationNames } ?: OTHER_OPERATION
+
+    companion object {
+        const val OTHER_OPERATION = "other"
+        private const val OPERATIONS_LOCATION = "classpath*:graphql/operations/*.graphql"
+    }
+}
@@ -0,0 +1,38 @@
+package kr.io.team.loop.common.config
+
+import com.netflix.graphql.dgs.context.DgsContext
+import graphql.GraphQLContext
+import org.springframework.stereotype.Component
+import java.util.Optional
+
+/**
+ * 요청의 Authorization 헤더에서 회원 ID를 해석한다.
+ *
+ * 결과는 요청 컨텍스트에 저장되어, 한 요청 안의 여러 @Authorize 필드와 실행 전 검사(레이트 리밋)가 같은 값을 공유한다.
+ */
+@Component
+class RequestMemberResolver(
+    private val verifiedTokenCache: VerifiedTokenCache,
+) {
+    fun resolve(context: GraphQLContext): Long? =
+        context
+            .computeIfAbsent(MEMBER_ID_KEY) { Optional.ofNullable(authenticate(context)) }
+            .orElse(null)
+
+    private fun authenticate(context: GraphQLContext): Long? =
+        extractToken(context)?.let { verifiedTokenCache.memberIdOf(it) }
+
+    private fun extractToken(context: GraphQLContext): String? {
+        val authHeader =
+            DgsContext
+                .getRequestData(context)
+                ?.headers
+                ?.getFirst("Authorization")
+                ?: return null
+        return authHeader.removePrefix("Bearer ").takeIf { it != authHeader }
+    }
+
+    companion object {
+        private val MEMBER_ID_KEY = RequestMemberResolver::class.qualifiedName + ".memberId"
+    }
+}
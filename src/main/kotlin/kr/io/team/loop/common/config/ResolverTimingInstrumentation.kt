@@ -0,0 +1,123 @@
+package kr.io.team.loop.common.config
+
+import graphql.ExecutionResult
+import graphql.execution.instrumentation.InstrumentationState
+import graphql.execution.instrumentation.SimplePerformantInstrumentation
+import graphql.execution.instrumentation.parameters.InstrumentationCreateStateParameters
+import graphql.execution.instrumentation.parameters.InstrumentationExecutionParameters
+import graphql.execution.instrumentation.parameters.InstrumentationFieldFetchParameters
+import graphql.schema.DataFetcher
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.stereotype.Component
+import java.util.concurrent.CompletableFuture
+import java.util.concurrent.CompletionStage
+import java.util.concurrent.ConcurrentLinkedQueue
+import java.util.concurrent.TimeUnit
+
+/**
+ * 리졸버(non-trivial DataFetcher) 단위 실행 시간을 `graphql.resolver` 타이머로 기록한다.
+ *
+ * `app.tracing.resolvers.enabled=true`일 때만 등록된다. 단순 프로퍼티 fetcher는 감싸지 않는다.
+ * `app.tracing.response-timings.enabled=true`이면 요청별 측정값을 응답의 `extensions.timings`에 담는다 (디버그 전용).
+ */
+@Component
+@ConditionalOnProperty(prefix = "app.tracing.resolvers", name = ["enabled"], havingValue = "true")
+class ResolverTimingInstrumentation(
+    private val meterRegistry: MeterRegistry,
+    @Value("\${app.tracing.response-timings.enabled:false}") private val responseTimingsEnabled: Boolean,
+) : SimplePerformantInstrumentation() {
+    override fun createStateAsync(
+        parameters: InstrumentationCreateStateParameters,
+    ): CompletableFuture<InstrumentationState?>? =
+        CompletableFuture.completedFuture(if (responseTimingsEnabled) TimingState() else null)
+
+    override fun instrumentDataFetcher(
+        dataFetcher: DataFetcher<*>,
+        parameters: InstrumentationFieldFetchParameters,
+        state: InstrumentationState?,
+    ): DataFetcher<*> {
+        if (parameters.isTrivialDataFetcher) {
+            return dataFetcher
+        }
+        val stepInfo = parameters.executionStepInfo
+        val parentType = stepInfo.objectType.name
+        val field = stepInfo.fieldDefinition.name
+        val timer =
+            Timer
+                .builder("graphql.resolver")
+                .description("Execution time of GraphQL field resolvers")
+                .tag("parent", parentType)
+                .tag("field", field)
+                .publishPercentileHistogram()
+                .register(meterRegistry)
+        val timingState = state as? TimingState
+        return DataFetcher<Any?> { env ->
+            val start = System.nanoTime()
+            val record = {
+                val elapsed = System.nanoTime() - start
+                timer.record(elapsed, TimeUnit.NANOSECONDS)
+                timingState?.add(stepInfo.path.toString(), "$parentType.$field", start, elapsed)
+            }
+            val result =
+                try {
+                    dataFetcher.get(env)
+                } catch (ex: Exception) {
+                    record()
+                    throw ex
+                }
+            if (result is CompletionStage<*>) {
+                result.whenComplete { _, _ -> record() }
+            } else {
+                record()
+            }
+            result
+        }
+    }
+
+    override fun instrumentExecutionResult(
+        executionResult: ExecutionResult,
+        parameters: InstrumentationExecutionParameters,
+        state: InstrumentationState?,
+    ): CompletableFuture<ExecutionResult> {
+        val timingState = state as? TimingState ?: return CompletableFuture.completedFuture(executionResult)
+        return CompletableFuture.completedFuture(
+            executionResult.transform { it.addExtension(TIMINGS_EXTENSION, timingState.toExtension()) },
+        )
+    }
+
+    private class TimingState : InstrumentationState {
+        private val startedAt = System.nanoTime()
+        private val resolvers = ConcurrentLinkedQueue<Map<String, Any>>()
+
+        fun add(
+            path: String,
+            resolver: String,
+            start: Long,
+            elapsed: Long,
+        ) {
+            resolvers.add(
+                mapOf(
+                    "path" to path,
+                    "resolver" to resolver,
+                    "startOffsetMs" to millis(start - startedAt),
+                    "durationMs" to millis(elapsed),
+                ),
+            )
+        }
+
+        fun toExtension(): Map<String, Any> =
+            mapOf(
+                "totalMs" to millis(System.nanoTime() - startedAt),
+                "resolvers" to resolvers.sortedBy { it["startOffsetMs"] as Double },
+            )
+
+        private fun millis(nanos: Long): Double = nanos / 1_000_000.0
+    }
+
+    companion object {
+        private const val TIMINGS_EXTENSION = "timings"
+    }
+}
@@ -0,0 +1,128 @@
+package kr.io.team.loop.common.config
+
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.Timer
+import jakarta.annotation.PostConstruct
+import jakarta.annotation.PreDestroy
+import org.jetbrains.exposed.v1.core.Transaction
+import org.jetbrains.exposed.v1.core.statements.StatementContext
+import org.jetbrains.exposed.v1.core.statements.StatementType
+import org.jetbrains.exposed.v1.core.statements.expandArgs
+import org.jetbrains.exposed.v1.jdbc.transactions.TransactionManager
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.boot.autoconfigure.condition.ConditionalOnProperty
+import org.springframework.stereotype.Component
+import java.sql.Connection
+import java.sql.SQLException
+import java.util.concurrent.TimeUnit
+
+/**
+ * Exposed 구문 실행 시간을 호출한 리포지토리 메서드별 `db.statement` 타이머로 기록한다.
+ *
+ * `app.tracing.sql.enabled=true`일 때만 등록되며, [SqlTimingInterceptor]가 측정값을 넘겨준다.
+ * `app.tracing.sql.slow-threshold-ms` 이상 걸린 구문은 SQL과 함께 경고 로그로 남긴다.
+ * 로그에는 바인딩 값 없이 파라미터화된 SQL만 남기며(비밀번호 해시, 로그인 ID 등이 섞이지 않도록),
+ * 값은 `app.tracing.sql.log-parameters=true`로 명시적으로 켰을 때만 남긴다.
+ * 파라미터가 없는 SELECT는 `app.tracing.sql.explain=true`이면 EXPLAIN 결과(실행 계획)도 함께 남긴다.
+ */
+@Component
+@ConditionalOnProperty(prefix = "app.tracing.sql", name = ["enabled"], havingValue = "true")
+class SqlStatementRecorder(
+    private val meterRegistry: MeterRegistry,
+    @Value("\${app.tracing.sql.slow-threshold-ms:200}") slowThresholdMs: Long,
+    @Value("\${app.tracing.sql.explain:true}") private val explainEnabled: Boolean,
+    @Value("\${app.tracing.sql.log-parameters:false}") private val logParameters: Boolean,
+) {
+    private val log = LoggerFactory.getLogger(javaClass)
+    private val slowThresholdNanos = TimeUnit.MILLISECONDS.toNanos(slowThresholdMs)
+
+    @PostConstruct
+    fun register() {
+        SqlTimingInterceptor.recorder = this
+    }
+
+    @PreDestroy
+    fun unregister() {
+        if (SqlTimingInterceptor.recorder === this) {
+            SqlTimingInterceptor.recorder = null
+        }
+    }
+
+    fun record(
+        transaction: Transaction,
+        context: StatementContext,
+        elapsedNanos: Long,
+    ) {
+        val type = context.statement.type
+        val origin = repositoryMethod()
+        Timer
+            .builder("db.statement")
+            .description("Execution time of Exposed statements by repository method")
+            .tag("repository", origin)
+            .tag("type", type.name)
+            .publishPercentileHistogram()
+            .register(meterRegistry)
+            .record(elapsedNanos, TimeUnit.NANOSECONDS)
+        if (elapsedNanos >= slowThresholdNanos) {
+            logSlowStatement(transaction, context, type, origin, elapsedNanos)
+        }
+    }
+
+    private fun logSlowStatement(
+        transaction: Transaction,
+        context: StatementContext,
+        type: StatementType,
+        origin: String,
+        elapsedNanos: Long,
+    ) {
+        val parameterized = context.args.any()
+        val sql = if (logParameters) context.expandArgs(transaction) else context.sql(transaction)
+        val plan = if (explainEnabled && type == StatementType.SELECT && !parameterized) explain(sql) else null
+        log.warn(
+            "[SLOW_QUERY] {} took {}ms: {}{}",
+            origin,
+            TimeUnit.NANOSECONDS.toMillis(elapsedNanos),
+            sql,
+            plan?.let { "\n$it" } ?: "",
+        )
+    }
+
+    /**
+     * 인터셉터를 다시 타지 않도록 요청 트랜잭션의 JDBC 커넥션으로 직접 실행하되, 세이브포인트 안에서 실행하고 되돌린다.
+     * PostgreSQL은 실패한 구문이 트랜잭션 전체를 중단 상태로 만들기 때문에, EXPLAIN이 실패해도
+     * 세이브포인트로 되돌려 요청의 다음 구문이 영향을 받지 않게 한다.
+     */
+    private fun explain(sql: String): String? {
+        val connection = TransactionManager.current().connection.connection as Connection
+        val savepoint = runCatching { connection.setSavepoint() }.getOrElse { return null }
+        return try {
+            connection.createStatement().use { statement ->
+                statement.executeQuery("EXPLAIN $sql").use { resultSet ->
+                    buildList { while (resultSet.next()) add(resultSet.getString(1)) }.joinToString("\n")
+                }
+            }
+        } catch (e: SQLException) {
+            log.debug("EXPLAIN failed: {}", sql, e)
+            null
+        } finally {
+            connection.rollback(savepoint)
+        }
+    }
+
+    /** 호출 스택에서 가장 가까운 infrastructure.persistence 리포지토리 메서드를 찾는다. */
+    private fun repositoryMethod(): String =
+        StackWalker.getInstance().walk { frames ->
+            frames
+                .filter { it.className.contains(PERSISTENCE_PACKAGE) && it.className.endsWith(REPOSITORY_SUFFIX) }
+                .findFirst()
+                .map { "${it.className.substringAfterLast('.')}.${it.methodName}" }
+                .orElse(UNKNOWN_ORIGIN)
+        }
+
+    companion object {
+        private const val PERSISTENCE_PACKAGE = ".infrastructure.persistence."
+        private const val REPOSITORY_SUFFIX = "Repository"
+        private const val UNKNOWN_ORIGIN = "unknown"
+    }
+}
@@ -0,0 +1,48 @@
+package kr.io.team.loop.common.config
+
+import org.jetbrains.exposed.v1.core.Transaction
+import org.jetbrains.exposed.v1.core.statements.GlobalStatementInterceptor
+import org.jetbrains.exposed.v1.core.statements.StatementContext
+import org.jetbrains.exposed.v1.core.statements.api.PreparedStatementApi
+
+/**
+ * 모든 Exposed 트랜잭션의 구문 실행 시간을 측정해 [SqlStatementRecorder]에 넘기는 전역 인터셉터.
+ *
+ * Exposed가 ServiceLoader(META-INF/services)로 생성하므로 Spring 빈이 아니다.
+ * 기록기가 등록되지 않은 동안(`app.tracing.sql.enabled=false`)은 null 검사 외에 아무 일도 하지 않는다.
+ *
+ * 구문이 예외로 끝나면 afterExecution이 호출되지 않으므로, 시작 시각은 매 구문마다 덮어쓰고
+ * 롤백 시점에 지워 실패한 구문의 시작 시각이 다음 구문 측정에 섞이지 않게 한다.
+ */
+class SqlTimingInterceptor : GlobalStatementInterceptor {
+    override fun beforeExecution(
+        transaction: Transaction,
+        context: StatementContext,
+    ) {
+        if (recorder == null) {
+            return
+        }
+        startedAt.set(System.nanoTime())
+    }
+
+    override fun afterExecution(
+        transaction: Transaction,
+        contexts: List<StatementContext>,
+        executedStatement: PreparedStatementApi,
+    ) {
+        val start = startedAt.get() ?: return
+        startedAt.remove()
+        recorder?.record(transaction, contexts.first(), System.nanoTime() - start)
+    }
+
+    override fun afterRollback(transaction: Transaction) {
+        startedAt.remove()
+    }
+
+    companion object {
+        @Volatile
+        internal var recorder: SqlStatementRecorder? = null
+
+        private val startedAt = ThreadLocal<Long>()
+    }
+}
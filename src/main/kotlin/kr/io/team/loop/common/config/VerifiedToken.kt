@@ -0,0 +1,8 @@
+package kr.io.team.loop.common.config
+
+import java.time.Instant
+
+data class VerifiedToken(
+    val memberId: Long,
+    val expiresAt: Instant,
+)
@@ -0,0 +1,44 @@
+package kr.io.team.loop.common.config
+
+import com.github.benmanes.caffeine.cache.Cache
+import com.github.benmanes.caffeine.cache.Caffeine
+import com.github.benmanes.caffeine.cache.Expiry
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.stereotype.Component
+import java.security.MessageDigest
+import java.time.Duration
+import java.time.Instant
+import java.util.HexFormat
+
+/**
+ * 검증된 토큰의 memberId를 요청 간에 공유하는 캐시.
+ *
+ * 키는 토큰 원문 대신 SHA-256 다이제스트를 사용하고, 각 항목은 토큰의 exp 시각에 만료된다.
+ * 검증에 실패한 토큰은 캐시하지 않는다.
+ */
+@Component
+class VerifiedTokenCache(
+    private val jwtTokenProvider: JwtTokenProvider,
+    @Value("\${app.jwt.cache.maximum-size:10000}") maximumSize: Long,
+) {
+    private val cache: Cache<String, VerifiedToken> =
+        Caffeine
+            .newBuilder()
+            .maximumSize(maximumSize)
+            .expireAfter(Expiry.creating<String, VerifiedToken> { _, token -> token.remainingLifetime() })
+            .build()
+
+    fun memberIdOf(token: String): Long? {
+        val digest = digest(token)
+        cache.getIfPresent(digest)?.let { return it.memberId }
+        val verified = jwtTokenProvider.verify(token) ?: return null
+        cache.put(digest, verified)
+        return verified.memberId
+    }
+
+    private fun VerifiedToken.remainingLifetime(): Duration =
+        Duration.between(Instant.now(), expiresAt).coerceAtLeast(Duration.ZERO)
+
+    private fun digest(token: String): String =
+        HexFormat.of().formatHex(MessageDigest.getInstance("SHA-256").digest(token.toByteArray()))
+}
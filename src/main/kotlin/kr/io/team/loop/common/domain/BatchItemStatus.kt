@@ -0,0 +1,8 @@
+package kr.io.team.loop.common.domain
+
+enum class BatchItemStatus {
+    SUCCESS,
+    NOT_FOUND,
+    ACCESS_DENIED,
+    DUPLICATE,
+}
@@ -0,0 +1,11 @@
+package kr.io.team.loop.common.domain
+
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+
+object BatchLimit {
+    const val MAX_SIZE = 100
+
+    fun validate(size: Int) {
+        if (size !in 1..MAX_SIZE) throw InvalidInputException("batch size must be between 1 and $MAX_SIZE")
+    }
+}
@@ -0,0 +1,6 @@
+package kr.io.team.loop.common.domain
+
+data class CursorPage<T>(
+    val items: List<T>,
+    val hasNext: Boolean,
+)
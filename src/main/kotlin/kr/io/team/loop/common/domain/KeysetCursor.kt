@@ -0,0 +1,25 @@
+package kr.io.team.loop.common.domain
+
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+import java.util.Base64
+
+/**
+ * (날짜, ID) 키셋 페이지네이션 커서. 외부에는 불투명한 Base64 문자열로 노출한다.
+ */
+data class KeysetCursor(
+    val date: LocalDate,
+    val id: Long,
+) {
+    fun encode(): String = Base64.getUrlEncoder().withoutPadding().encodeToString("$date:$id".toByteArray())
+
+    companion object {
+        fun decode(value: String): KeysetCursor =
+            try {
+                val (date, id) = String(Base64.getUrlDecoder().decode(value)).split(":", limit = 2)
+                KeysetCursor(LocalDate.parse(date), id.toLong())
+            } catch (e: Exception) {
+                throw InvalidInputException("Invalid cursor: $value", e)
+            }
+    }
+}
@@ -0,0 +1,9 @@
+package kr.io.team.loop.common.domain
+
+/**
+ * 목록 조회(myTasks, myReviews)가 한 번에 반환하는 최대 항목 수.
+ * 상한을 넘는 결과는 정렬 순서대로 잘라내며, 더 많은 결과는 커서 페이지 조회를 사용한다.
+ */
+object ListLimit {
+    const val MAX_SIZE = 500
+}
@@ -0,0 +1,17 @@
+package kr.io.team.loop.common.domain
+
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+
+data class PageRequest(
+    val first: Int = DEFAULT_FIRST,
+    val after: KeysetCursor? = null,
+) {
+    init {
+        if (first !in 1..MAX_FIRST) throw InvalidInputException("first must be between 1 and $MAX_FIRST")
+    }
+
+    companion object {
+        const val DEFAULT_FIRST = 20
+        const val MAX_FIRST = 100
+    }
+}
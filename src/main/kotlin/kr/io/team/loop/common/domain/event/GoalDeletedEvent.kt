@@ -1,7 +1,9 @@
 package kr.io.team.loop.common.domain.event
 
 import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
 
 data class GoalDeletedEvent(
     val goalId: GoalId,
+    val memberId: MemberId,
 )
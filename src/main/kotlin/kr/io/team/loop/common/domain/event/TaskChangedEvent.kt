@@ -0,0 +1,7 @@
+package kr.io.team.loop.common.domain.event
+
+import kr.io.team.loop.common.domain.MemberId
+
+data class TaskChangedEvent(
+    val memberId: MemberId,
+)
@@ -30,3 +30,11 @@ class AuthenticationException(
 class AccessDeniedException(
     message: String,
 ) : LoopException(message)
+
+class QueryComplexityException(
+    message: String,
+) : LoopException(message)
+
+class RateLimitExceededException(
+    message: String,
+) : LoopException(message)
@@ -0,0 +1,11 @@
+package kr.io.team.loop.goal.application.dto
+
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.common.domain.GoalId
+
+data class DailyGoalBatchResultDto(
+    val goalId: GoalId,
+    val date: LocalDate,
+    val status: BatchItemStatus,
+)
@@ -0,0 +1,64 @@
+package kr.io.team.loop.goal.application.service
+
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.common.domain.BatchLimit
+import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
+import kr.io.team.loop.common.domain.event.GoalChangedEvent
+import kr.io.team.loop.goal.application.dto.DailyGoalBatchResultDto
+import kr.io.team.loop.goal.domain.model.DailyGoalCommand
+import kr.io.team.loop.goal.domain.model.GoalQuery
+import kr.io.team.loop.goal.domain.repository.DailyGoalRepository
+import kr.io.team.loop.goal.domain.repository.GoalRepository
+import org.springframework.context.ApplicationEventPublisher
+import org.springframework.stereotype.Service
+import org.springframework.transaction.annotation.Transactional
+
+@Service
+class GoalBatchService(
+    private val goalRepository: GoalRepository,
+    private val dailyGoalRepository: DailyGoalRepository,
+    private val eventPublisher: ApplicationEventPublisher,
+) {
+    @Transactional
+    fun addDailyGoals(commands: List<DailyGoalCommand.Add>): List<DailyGoalBatchResultDto> {
+        BatchLimit.validate(commands.size)
+        val goals = goalRepository.findAll(GoalQuery(ids = commands.map { it.goalId }.distinct())).associateBy { it.id }
+        val statuses =
+            commands
+                .map { command ->
+                    val goal = goals[command.goalId]
+                    when {
+                        goal == null -> BatchItemStatus.NOT_FOUND
+                        !goal.isOwnedBy(command.memberId) -> BatchItemStatus.ACCESS_DENIED
+                        else -> BatchItemStatus.SUCCESS
+                    }
+                }.toMutableList()
+        val accepted = commands.indices.filter { statuses[it] == BatchItemStatus.SUCCESS }
+        val saved = dailyGoalRepository.saveAllIfAbsent(accepted.map { commands[it] })
+        accepted.zip(saved).forEach { (index, isSaved) ->
+            if (!isSaved) statuses[index] = BatchItemStatus.DUPLICATE
+        }
+        accepted
+            .filterIndexed { position, _ -> saved[position] }
+            .map { commands[it].memberId }
+            .distinct()
+            .forEach { eventPublisher.publishEvent(GoalChangedEvent(it)) }
+        return commands.mapIndexed { index, command ->
+            DailyGoalBatchResultDto(goalId = command.goalId, date = command.date, status = statuses[index])
+        }
+    }
+
+    @Transactional
+    fun removeDailyGoals(commands: List<DailyGoalCommand.Remove>): List<DailyGoalBatchResultDto> {
+        BatchLimit.validate(commands.size)
+        // member_id가 삭제 조건에 포함되므로 다른 회원의 배치는 NOT_FOUND로 처리된다 (단건 제거와 동일)
+        val deleted = dailyGoalRepository.deleteAll(commands)
+        val removed = commands.filterIndexed { index, _ -> deleted[index] }
+        removed.forEach { eventPublisher.publishEvent(DailyGoalRemovedEvent(it.goalId, it.memberId, it.date)) }
+        removed.map { it.memberId }.distinct().forEach { eventPublisher.publishEvent(GoalChangedEvent(it)) }
+        return commands.mapIndexed { index, command ->
+            val status = if (deleted[index]) BatchItemStatus.SUCCESS else BatchItemStatus.NOT_FOUND
+            DailyGoalBatchResultDto(goalId = command.goalId, date = command.date, status = status)
+        }
+    }
+}
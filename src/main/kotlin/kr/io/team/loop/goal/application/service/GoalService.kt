@@ -3,6 +3,7 @@ package kr.io.team.loop.goal.application.service
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
 import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
+import kr.io.team.loop.common.domain.event.GoalChangedEvent
 import kr.io.team.loop.common.domain.event.GoalDeletedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.DuplicateEntityException
@@ -24,7 +25,11 @@ class GoalService(
     private val eventPublisher: ApplicationEventPublisher,
 ) {
     @Transactional
-    fun create(command: GoalCommand.Create): Goal = goalRepository.save(command)
+    fun create(command: GoalCommand.Create): Goal {
+        val goal = goalRepository.save(command)
+        eventPublisher.publishEvent(GoalChangedEvent(command.memberId))
+        return goal
+    }
 
     @Transactional(readOnly = true)
     fun findAll(query: GoalQuery): List<Goal> = goalRepository.findAll(query)
@@ -45,7 +50,9 @@ class GoalService(
         if (!goal.isOwnedBy(memberId)) {
             throw AccessDeniedException("Goal does not belong to member: ${memberId.value}")
         }
-        return goalRepository.update(command)
+        val updated = goalRepository.update(goal, command)
+        eventPublisher.publishEvent(GoalChangedEvent(memberId))
+        return updated
     }
 
     @Transactional
@@ -61,7 +68,8 @@ class GoalService(
         }
         dailyGoalRepository.deleteByGoalId(command.goalId)
         goalRepository.delete(command)
-        eventPublisher.publishEvent(GoalDeletedEvent(command.goalId))
+        eventPublisher.publishEvent(GoalDeletedEvent(command.goalId, memberId))
+        eventPublisher.publishEvent(GoalChangedEvent(memberId))
     }
 
     @Transactional
@@ -72,23 +80,23 @@ class GoalService(
         if (!goal.isOwnedBy(command.memberId)) {
             throw AccessDeniedException("Goal does not belong to member: ${command.memberId.value}")
         }
-        if (dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(command.goalId, command.memberId, command.date)) {
+        if (!dailyGoalRepository.saveAllIfAbsent(listOf(command)).single()) {
             throw DuplicateEntityException(
                 "DailyGoal already exists for goal ${command.goalId.value} on ${command.date}",
             )
         }
-        dailyGoalRepository.save(command)
+        eventPublisher.publishEvent(GoalChangedEvent(command.memberId))
         return goal
     }
 
     @Transactional
     fun removeDailyGoal(command: DailyGoalCommand.Remove) {
-        if (!dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(command.goalId, command.memberId, command.date)) {
+        if (!dailyGoalRepository.deleteAll(listOf(command)).single()) {
             throw EntityNotFoundException(
                 "DailyGoal not found for goal ${command.goalId.value} on ${command.date}",
             )
         }
-        dailyGoalRepository.delete(command)
         eventPublisher.publishEvent(DailyGoalRemovedEvent(command.goalId, command.memberId, command.date))
+        eventPublisher.publishEvent(GoalChangedEvent(command.memberId))
     }
 }
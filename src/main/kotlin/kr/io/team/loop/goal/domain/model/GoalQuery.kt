@@ -10,4 +10,15 @@ data class GoalQuery(
     val ids: List<GoalId>? = null,
     val title: String? = null,
     val assignedDate: LocalDate? = null,
-)
+) {
+    /**
+     * 조회 결과가 같은 쿼리를 같은 값으로 정규화한다 (캐시 키 용도).
+     * 필터 우선순위 id > ids > title 에 따라 적용되지 않는 필터는 제거하고, ids는 정렬·중복 제거한다.
+     */
+    fun normalized(): GoalQuery =
+        when {
+            id != null -> copy(ids = null, title = null)
+            ids != null -> copy(ids = ids.distinct().sortedBy { it.value }, title = null)
+            else -> this
+        }
+}
@@ -1,21 +1,14 @@
 package kr.io.team.loop.goal.domain.repository
 
-import kotlinx.datetime.LocalDate
 import kr.io.team.loop.common.domain.GoalId
-import kr.io.team.loop.common.domain.MemberId
-import kr.io.team.loop.goal.domain.model.DailyGoal
 import kr.io.team.loop.goal.domain.model.DailyGoalCommand
 
 interface DailyGoalRepository {
-    fun save(command: DailyGoalCommand.Add): DailyGoal
+    /** 이미 배치된 항목은 건너뛰고, 항목별 저장 여부를 입력 순서대로 반환한다. */
+    fun saveAllIfAbsent(commands: List<DailyGoalCommand.Add>): List<Boolean>
 
-    fun delete(command: DailyGoalCommand.Remove)
+    /** 항목별 삭제 여부를 입력 순서대로 반환한다. */
+    fun deleteAll(commands: List<DailyGoalCommand.Remove>): List<Boolean>
 
     fun deleteByGoalId(goalId: GoalId)
-
-    fun existsByGoalIdAndMemberIdAndDate(
-        goalId: GoalId,
-        memberId: MemberId,
-        date: LocalDate,
-    ): Boolean
 }
@@ -8,7 +8,10 @@ import kr.io.team.loop.goal.domain.model.GoalQuery
 interface GoalRepository {
     fun save(command: GoalCommand.Create): Goal
 
-    fun update(command: GoalCommand.Update): Goal
+    fun update(
+        current: Goal,
+        command: GoalCommand.Update,
+    ): Goal
 
     fun delete(command: GoalCommand.Delete)
 
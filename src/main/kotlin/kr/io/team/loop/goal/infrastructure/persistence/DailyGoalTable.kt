@@ -7,7 +7,7 @@ import org.jetbrains.exposed.v1.datetime.timestampWithTimeZone
 object DailyGoalTable : Table("daily_goal") {
     val dailyGoalId = long("daily_goal_id").autoIncrement()
     val goalId = long("goal_id")
-    val memberId = long("member_id").index()
+    val memberId = long("member_id")
     val date = date("date")
     val createdAt = timestampWithTimeZone("created_at")
 
@@ -15,5 +15,6 @@ object DailyGoalTable : Table("daily_goal") {
 
     init {
         uniqueIndex(goalId, memberId, date)
+        index("idx_daily_goal_member_id_date", false, memberId, date)
     }
 }
@@ -2,61 +2,88 @@ package kr.io.team.loop.goal.infrastructure.persistence
 
 import kotlinx.datetime.LocalDate
 import kr.io.team.loop.common.domain.GoalId
-import kr.io.team.loop.common.domain.MemberId
-import kr.io.team.loop.goal.domain.model.DailyGoal
 import kr.io.team.loop.goal.domain.model.DailyGoalCommand
-import kr.io.team.loop.goal.domain.model.DailyGoalId
 import kr.io.team.loop.goal.domain.repository.DailyGoalRepository
-import org.jetbrains.exposed.v1.core.and
+import org.jetbrains.exposed.v1.core.Op
 import org.jetbrains.exposed.v1.core.eq
+import org.jetbrains.exposed.v1.core.inList
+import org.jetbrains.exposed.v1.jdbc.batchInsert
 import org.jetbrains.exposed.v1.jdbc.deleteWhere
-import org.jetbrains.exposed.v1.jdbc.insert
-import org.jetbrains.exposed.v1.jdbc.selectAll
+import org.jetbrains.exposed.v1.jdbc.select
 import org.springframework.stereotype.Repository
 import java.time.OffsetDateTime
 
+/**
+ * 일일 목표 배치 저장/삭제의 항목별 결과는 복합 키(goal_id, member_id, date) IN 조건의 키 조회로 만든다.
+ *
+ * JDBC 배치의 갱신 건수는 드라이버 설정(`reWriteBatchedInserts` 등)에 따라 SUCCESS_NO_INFO로 뭉개질 수 있어 쓰지 않는다.
+ * 항목 수는 BatchLimit으로 제한되므로 IN 목록이 바인딩 파라미터 수 한도에 걸리지 않는다.
+ */
 @Repository
 class ExposedDailyGoalRepository : DailyGoalRepository {
-    override fun save(command: DailyGoalCommand.Add): DailyGoal {
-        val now = OffsetDateTime.now()
-        val row =
-            DailyGoalTable.insert {
-                it[goalId] = command.goalId.value
-                it[memberId] = command.memberId.value
-                it[date] = command.date
-                it[createdAt] = now
+    /**
+     * 이미 있는 키를 먼저 조회해 없는 키만 배치로 넣고, 다시 조회해 새로 생긴 키를 저장된 것으로 본다.
+     * 두 조회 사이에 다른 트랜잭션이 같은 키를 넣으면 유니크 충돌은 건너뛰지만(ignore) 양쪽 모두 저장된 것으로 보고된다.
+     */
+    override fun saveAllIfAbsent(commands: List<DailyGoalCommand.Add>): List<Boolean> {
+        val keys = commands.map { DailyGoalKey(it.goalId.value, it.memberId.value, it.date) }
+        val absent = keys.distinct() - findKeys(keys)
+        if (absent.isNotEmpty()) {
+            val now = OffsetDateTime.now()
+            DailyGoalTable.batchInsert(absent, ignore = true, shouldReturnGeneratedValues = false) { key ->
+                this[DailyGoalTable.goalId] = key.goalId
+                this[DailyGoalTable.memberId] = key.memberId
+                this[DailyGoalTable.date] = key.date
+                this[DailyGoalTable.createdAt] = now
             }
-        return DailyGoal(
-            id = DailyGoalId(row[DailyGoalTable.dailyGoalId]),
-            goalId = command.goalId,
-            memberId = command.memberId,
-            date = command.date,
-            createdAt = now.toInstant(),
-        )
+        }
+        return markFirst(keys, findKeys(absent))
     }
 
-    override fun delete(command: DailyGoalCommand.Remove) {
-        DailyGoalTable.deleteWhere {
-            (goalId eq command.goalId.value) and
-                (memberId eq command.memberId.value) and
-                (date eq command.date)
+    /** 지울 행을 먼저 잠가 두므로, 같은 키를 동시에 지우는 트랜잭션 중 하나만 삭제된 것으로 보고된다. */
+    override fun deleteAll(commands: List<DailyGoalCommand.Remove>): List<Boolean> {
+        val keys = commands.map { DailyGoalKey(it.goalId.value, it.memberId.value, it.date) }
+        val locked = findKeys(keys, forUpdate = true)
+        if (locked.isNotEmpty()) {
+            DailyGoalTable.deleteWhere { keyIn(locked) }
         }
+        return markFirst(keys, locked)
     }
 
     override fun deleteByGoalId(goalId: GoalId) {
         DailyGoalTable.deleteWhere { DailyGoalTable.goalId eq goalId.value }
     }
 
-    override fun existsByGoalIdAndMemberIdAndDate(
-        goalId: GoalId,
-        memberId: MemberId,
-        date: LocalDate,
-    ): Boolean =
-        DailyGoalTable
-            .selectAll()
-            .where {
-                (DailyGoalTable.goalId eq goalId.value) and
-                    (DailyGoalTable.memberId eq memberId.value) and
-                    (DailyGoalTable.date eq date)
-            }.count() > 0
+    private fun findKeys(
+        keys: Collection<DailyGoalKey>,
+        forUpdate: Boolean = false,
+    ): Set<DailyGoalKey> {
+        if (keys.isEmpty()) return emptySet()
+        return DailyGoalTable
+            .select(DailyGoalTable.goalId, DailyGoalTable.memberId, DailyGoalTable.date)
+            .where { keyIn(keys) }
+            .let { query -> if (forUpdate) query.forUpdate() else query }
+            .mapTo(HashSet()) {
+                DailyGoalKey(it[DailyGoalTable.goalId], it[DailyGoalTable.memberId], it[DailyGoalTable.date])
+            }
+    }
+
+    private fun keyIn(keys: Collection<DailyGoalKey>): Op<Boolean> =
+        Triple(DailyGoalTable.goalId, DailyGoalTable.memberId, DailyGoalTable.date) inList
+            keys.distinct().map { Triple(it.goalId, it.memberId, it.date) }
+
+    /** 입력 순서대로 각 키의 첫 항목만 반영된 것으로 표시한다. 두 번째부터는 이미 저장(삭제)된 것과 같으므로 false다. */
+    private fun markFirst(
+        keys: List<DailyGoalKey>,
+        affected: Set<DailyGoalKey>,
+    ): List<Boolean> {
+        val remaining = affected.toMutableSet()
+        return keys.map { remaining.remove(it) }
+    }
+
+    private data class DailyGoalKey(
+        val goalId: Long,
+        val memberId: Long,
+        val date: LocalDate,
+    )
 }
@@ -41,13 +41,16 @@ class ExposedGoalRepository : GoalRepository {
         )
     }
 
-    override fun update(command: GoalCommand.Update): Goal {
+    override fun update(
+        current: Goal,
+        command: GoalCommand.Update,
+    ): Goal {
         val now = OffsetDateTime.now()
         GoalTable.update({ GoalTable.goalId eq command.goalId.value }) {
             it[title] = command.title.value
             it[updatedAt] = now
         }
-        return findById(command.goalId)!!
+        return current.copy(title = command.title, updatedAt = now.toInstant())
     }
 
     override fun delete(command: GoalCommand.Delete) {
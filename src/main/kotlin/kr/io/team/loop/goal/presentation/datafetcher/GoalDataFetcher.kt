@@ -7,23 +7,31 @@ import com.netflix.graphql.dgs.InputArgument
 import kotlinx.datetime.LocalDate
 import kr.io.team.loop.codegen.types.AddDailyGoalInput
 import kr.io.team.loop.codegen.types.CreateGoalInput
+import kr.io.team.loop.codegen.types.DailyGoalResult
 import kr.io.team.loop.codegen.types.GoalFilter
 import kr.io.team.loop.codegen.types.RemoveDailyGoalInput
 import kr.io.team.loop.codegen.types.UpdateGoalInput
 import kr.io.team.loop.common.config.Authorize
+import kr.io.team.loop.common.config.CacheRegion
+import kr.io.team.loop.common.config.MemberCache
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.goal.application.dto.DailyGoalBatchResultDto
+import kr.io.team.loop.goal.application.service.GoalBatchService
 import kr.io.team.loop.goal.application.service.GoalService
 import kr.io.team.loop.goal.domain.model.DailyGoalCommand
 import kr.io.team.loop.goal.domain.model.Goal
 import kr.io.team.loop.goal.domain.model.GoalCommand
 import kr.io.team.loop.goal.domain.model.GoalQuery
 import kr.io.team.loop.goal.domain.model.GoalTitle
+import kr.io.team.loop.codegen.types.BatchItemStatus as BatchItemStatusGraphql
 import kr.io.team.loop.codegen.types.Goal as GoalGraphql
 
 @DgsComponent
 class GoalDataFetcher(
     private val goalService: GoalService,
+    private val goalBatchService: GoalBatchService,
+    private val memberCache: MemberCache,
 ) {
     @DgsQuery
     fun myGoals(
@@ -37,8 +45,10 @@ class GoalDataFetcher(
                 ids = filter?.ids?.map { GoalId(it.toLong()) },
                 title = filter?.title,
                 assignedDate = filter?.assignedDate?.let { LocalDate.parse(it) },
-            )
-        return goalService.findAll(query).map { it.toGraphql() }
+            ).normalized()
+        return memberCache
+            .getOrLoad(CacheRegion.GOALS, MemberId(memberId), query) { goalService.findAll(query) }
+            .map { it.toGraphql() }
     }
 
     @DgsMutation
@@ -81,31 +91,52 @@ class GoalDataFetcher(
     fun addDailyGoal(
         @InputArgument input: AddDailyGoalInput,
         @Authorize memberId: Long,
-    ): GoalGraphql {
-        val command =
-            DailyGoalCommand.Add(
-                goalId = GoalId(input.goalId.toLong()),
-                memberId = MemberId(memberId),
-                date = LocalDate.parse(input.date),
-            )
-        return goalService.addDailyGoal(command).toGraphql()
-    }
+    ): GoalGraphql = goalService.addDailyGoal(input.toCommand(memberId)).toGraphql()
 
     @DgsMutation
     fun removeDailyGoal(
         @InputArgument input: RemoveDailyGoalInput,
         @Authorize memberId: Long,
     ): Boolean {
-        val command =
-            DailyGoalCommand.Remove(
-                goalId = GoalId(input.goalId.toLong()),
-                memberId = MemberId(memberId),
-                date = LocalDate.parse(input.date),
-            )
-        goalService.removeDailyGoal(command)
+        goalService.removeDailyGoal(input.toCommand(memberId))
         return true
     }
 
+    @DgsMutation
+    fun addDailyGoals(
+        @InputArgument inputs: List<AddDailyGoalInput>,
+        @Authorize memberId: Long,
+    ): List<DailyGoalResult> =
+        goalBatchService.addDailyGoals(inputs.map { it.toCommand(memberId) }).map { it.toGraphql() }
+
+    @DgsMutation
+    fun removeDailyGoals(
+        @InputArgument inputs: List<RemoveDailyGoalInput>,
+        @Authorize memberId: Long,
+    ): List<DailyGoalResult> =
+        goalBatchService.removeDailyGoals(inputs.map { it.toCommand(memberId) }).map { it.toGraphql() }
+
+    private fun AddDailyGoalInput.toCommand(memberId: Long): DailyGoalCommand.Add =
+        DailyGoalCommand.Add(
+            goalId = GoalId(goalId.toLong()),
+            memberId = MemberId(memberId),
+            date = LocalDate.parse(date),
+        )
+
+    private fun RemoveDailyGoalInput.toCommand(memberId: Long): DailyGoalCommand.Remove =
+        DailyGoalCommand.Remove(
+            goalId = GoalId(goalId.toLong()),
+            memberId = MemberId(memberId),
+            date = LocalDate.parse(date),
+        )
+
+    private fun DailyGoalBatchResultDto.toGraphql(): DailyGoalResult =
+        DailyGoalResult(
+            goalId = goalId.value.toString(),
+            date = date.toString(),
+            status = BatchItemStatusGraphql.valueOf(status.name),
+        )
+
     private fun Goal.toGraphql(): GoalGraphql =
         GoalGraphql(
             id = id.value.toString(),
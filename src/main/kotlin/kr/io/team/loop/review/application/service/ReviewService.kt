@@ -1,8 +1,11 @@
 package kr.io.team.loop.review.application.service
 
 import kotlinx.datetime.LocalDate
-import kotlinx.datetime.minus
+import kr.io.team.loop.common.domain.CursorPage
+import kr.io.team.loop.common.domain.ListLimit
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
+import kr.io.team.loop.common.domain.event.ReviewChangedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.DuplicateEntityException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
@@ -11,6 +14,7 @@ import kr.io.team.loop.review.domain.model.Review
 import kr.io.team.loop.review.domain.model.ReviewCommand
 import kr.io.team.loop.review.domain.model.ReviewQuery
 import kr.io.team.loop.review.domain.repository.ReviewRepository
+import org.springframework.context.ApplicationEventPublisher
 import org.springframework.dao.DataIntegrityViolationException
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
@@ -18,6 +22,7 @@ import org.springframework.transaction.annotation.Transactional
 @Service
 class ReviewService(
     private val reviewRepository: ReviewRepository,
+    private val eventPublisher: ApplicationEventPublisher,
 ) {
     @Transactional
     fun delete(
@@ -31,15 +36,20 @@ class ReviewService(
             throw AccessDeniedException("Review does not belong to member: ${memberId.value}")
         }
         reviewRepository.delete(command)
+        eventPublisher.publishEvent(ReviewChangedEvent(memberId))
     }
 
     @Transactional
-    fun create(command: ReviewCommand.Create): Review =
-        try {
-            reviewRepository.save(command)
-        } catch (e: DataIntegrityViolationException) {
-            throw DuplicateEntityException("Review already exists for this period")
-        }
+    fun create(command: ReviewCommand.Create): Review {
+        val review =
+            try {
+                reviewRepository.save(command)
+            } catch (e: DataIntegrityViolationException) {
+                throw DuplicateEntityException("Review already exists for this period")
+            }
+        eventPublisher.publishEvent(ReviewChangedEvent(command.memberId))
+        return review
+    }
 
     @Transactional
     fun update(
@@ -52,41 +62,29 @@ class ReviewService(
         if (!review.isOwnedBy(memberId)) {
             throw AccessDeniedException("Cannot update other member's review")
         }
-        return reviewRepository.update(command)
+        val updated = reviewRepository.update(command)
+        eventPublisher.publishEvent(ReviewChangedEvent(memberId))
+        return updated
     }
 
     @Transactional(readOnly = true)
-    fun findAll(query: ReviewQuery): List<Review> {
-        val reviews = reviewRepository.findAll(query.copy(stepType = null))
-        val stepType = query.stepType ?: return reviews
-        return reviews.filter { it.containsStepType(stepType) }
-    }
+    fun findAll(query: ReviewQuery): List<Review> = reviewRepository.findAll(query, ListLimit.MAX_SIZE)
+
+    @Transactional(readOnly = true)
+    fun findPage(
+        query: ReviewQuery,
+        page: PageRequest,
+    ): CursorPage<Review> = reviewRepository.findPage(query, page)
 
     @Transactional(readOnly = true)
     fun getStats(
         memberId: MemberId,
         today: LocalDate,
     ): ReviewStatsDto {
-        val totalCount = reviewRepository.countByMemberId(memberId)
-        val reviews = reviewRepository.findAll(ReviewQuery(memberId = memberId))
-        val consecutiveDays = calculateConsecutiveDays(reviews, today)
+        val summary = reviewRepository.summarizeByMemberId(memberId, today)
         return ReviewStatsDto(
-            totalCount = totalCount,
-            consecutiveDays = consecutiveDays,
+            totalCount = summary.totalCount,
+            consecutiveDays = summary.consecutiveDays,
         )
     }
-
-    private fun calculateConsecutiveDays(
-        reviews: List<Review>,
-        today: LocalDate,
-    ): Int {
-        val reviewDates = reviews.map { it.startDate }.toSet()
-        var count = 0
-        var current = today
-        while (current in reviewDates) {
-            count++
-            current = current.minus(1, kotlinx.datetime.DateTimeUnit.DAY)
-        }
-        return count
-    }
 }
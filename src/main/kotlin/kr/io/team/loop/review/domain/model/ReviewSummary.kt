@@ -0,0 +1,6 @@
+package kr.io.team.loop.review.domain.model
+
+data class ReviewSummary(
+    val totalCount: Long,
+    val consecutiveDays: Int,
+)
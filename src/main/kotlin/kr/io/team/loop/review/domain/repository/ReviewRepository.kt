@@ -1,9 +1,13 @@
 package kr.io.team.loop.review.domain.repository
 
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
 import kr.io.team.loop.review.domain.model.Review
 import kr.io.team.loop.review.domain.model.ReviewCommand
 import kr.io.team.loop.review.domain.model.ReviewQuery
+import kr.io.team.loop.review.domain.model.ReviewSummary
 
 interface ReviewRepository {
     fun save(command: ReviewCommand.Create): Review
@@ -12,9 +16,21 @@ interface ReviewRepository {
 
     fun delete(command: ReviewCommand.Delete)
 
-    fun findAll(query: ReviewQuery): List<Review>
+    /** [limit]이 null이면 조건에 맞는 회고를 모두 반환한다. */
+    fun findAll(
+        query: ReviewQuery,
+        limit: Int? = null,
+    ): List<Review>
+
+    fun findPage(
+        query: ReviewQuery,
+        page: PageRequest,
+    ): CursorPage<Review>
 
     fun findById(id: kr.io.team.loop.review.domain.model.ReviewId): Review?
 
-    fun countByMemberId(memberId: MemberId): Long
+    fun summarizeByMemberId(
+        memberId: MemberId,
+        today: LocalDate,
+    ): ReviewSummary
 }
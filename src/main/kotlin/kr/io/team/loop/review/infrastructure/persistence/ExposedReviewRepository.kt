@@ -1,15 +1,23 @@
 package kr.io.team.loop.review.infrastructure.persistence
 
+import kotlinx.datetime.DateTimeUnit
+import kotlinx.datetime.LocalDate
+import kotlinx.datetime.minus
+import kotlinx.datetime.plus
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
 import kr.io.team.loop.review.domain.model.PeriodKey
 import kr.io.team.loop.review.domain.model.Review
 import kr.io.team.loop.review.domain.model.ReviewCommand
 import kr.io.team.loop.review.domain.model.ReviewId
 import kr.io.team.loop.review.domain.model.ReviewQuery
 import kr.io.team.loop.review.domain.model.ReviewStep
+import kr.io.team.loop.review.domain.model.ReviewSummary
 import kr.io.team.loop.review.domain.model.ReviewType
 import kr.io.team.loop.review.domain.model.StepType
 import kr.io.team.loop.review.domain.repository.ReviewRepository
+import org.jetbrains.exposed.v1.core.IColumnType
 import org.jetbrains.exposed.v1.core.Op
 import org.jetbrains.exposed.v1.core.ResultRow
 import org.jetbrains.exposed.v1.core.SortOrder
@@ -17,10 +25,16 @@ import org.jetbrains.exposed.v1.core.and
 import org.jetbrains.exposed.v1.core.count
 import org.jetbrains.exposed.v1.core.eq
 import org.jetbrains.exposed.v1.core.greaterEq
+import org.jetbrains.exposed.v1.core.less
 import org.jetbrains.exposed.v1.core.lessEq
+import org.jetbrains.exposed.v1.core.or
+import org.jetbrains.exposed.v1.core.vendors.PostgreSQLDialect
+import org.jetbrains.exposed.v1.core.vendors.currentDialect
 import org.jetbrains.exposed.v1.jdbc.deleteWhere
 import org.jetbrains.exposed.v1.jdbc.insert
+import org.jetbrains.exposed.v1.jdbc.select
 import org.jetbrains.exposed.v1.jdbc.selectAll
+import org.jetbrains.exposed.v1.jdbc.transactions.TransactionManager
 import org.jetbrains.exposed.v1.jdbc.update
 import org.springframework.stereotype.Repository
 import java.time.OffsetDateTime
@@ -71,21 +85,38 @@ class ExposedReviewRepository : ReviewRepository {
         return findById(command.reviewId)!!
     }
 
-    override fun findAll(query: ReviewQuery): List<Review> {
-        var condition: Op<Boolean> = Op.TRUE
-        query.memberId?.let { condition = condition and (ReviewTable.memberId eq it.value) }
-        query.reviewType?.let { condition = condition and (ReviewTable.reviewType eq it.name) }
-        query.date?.let {
-            condition = condition and (ReviewTable.startDate eq it)
-        }
-        query.startDate?.let { condition = condition and (ReviewTable.startDate greaterEq it) }
-        query.endDate?.let { condition = condition and (ReviewTable.startDate lessEq it) }
-
-        return ReviewTable
+    override fun findAll(
+        query: ReviewQuery,
+        limit: Int?,
+    ): List<Review> =
+        ReviewTable
             .selectAll()
-            .where(condition)
-            .orderBy(ReviewTable.startDate, SortOrder.DESC)
+            .where(query.toCondition())
+            .orderBy(ReviewTable.startDate to SortOrder.DESC, ReviewTable.reviewId to SortOrder.DESC)
+            .let { rows -> if (limit != null) rows.limit(limit) else rows }
+            .fetchSize(FETCH_SIZE)
             .map { it.toReview() }
+
+    override fun findPage(
+        query: ReviewQuery,
+        page: PageRequest,
+    ): CursorPage<Review> {
+        var condition = query.toCondition()
+        page.after?.let { cursor ->
+            condition = condition and
+                (
+                    (ReviewTable.startDate less cursor.date) or
+                        ((ReviewTable.startDate eq cursor.date) and (ReviewTable.reviewId less cursor.id))
+                )
+        }
+        val reviews =
+            ReviewTable
+                .selectAll()
+                .where(condition)
+                .orderBy(ReviewTable.startDate to SortOrder.DESC, ReviewTable.reviewId to SortOrder.DESC)
+                .limit(page.first + 1)
+                .map { it.toReview() }
+        return CursorPage(items = reviews.take(page.first), hasNext = reviews.size > page.first)
     }
 
     override fun findById(id: ReviewId): Review? =
@@ -95,11 +126,77 @@ class ExposedReviewRepository : ReviewRepository {
             .singleOrNull()
             ?.toReview()
 
-    override fun countByMemberId(memberId: MemberId): Long =
-        ReviewTable
-            .selectAll()
-            .where { ReviewTable.memberId eq memberId.value }
-            .count()
+    override fun summarizeByMemberId(
+        memberId: MemberId,
+        today: LocalDate,
+    ): ReviewSummary =
+        if (currentDialect is PostgreSQLDialect) {
+            summarizeWithWindowFunction(memberId, today)
+        } else {
+            summarizeByDateScan(memberId, today)
+        }
+
+    /**
+     * 총 회고 수와 today로 끝나는 연속 회고일수를 한 번의 쿼리로 계산한다 (gaps-and-islands).
+     * 날짜 내림차순 순번을 더했을 때 today + 1이 되는 날짜들이 today부터 끊김 없이 이어진 구간이다.
+     */
+    private fun summarizeWithWindowFunction(
+        memberId: MemberId,
+        today: LocalDate,
+    ): ReviewSummary =
+        TransactionManager.current().exec(
+            SUMMARY_SQL,
+            listOf<Pair<IColumnType<*>, Any?>>(
+                ReviewTable.memberId.columnType to memberId.value,
+                ReviewTable.memberId.columnType to memberId.value,
+                ReviewTable.startDate.columnType to today,
+                ReviewTable.startDate.columnType to today.plus(1, DateTimeUnit.DAY),
+            ),
+        ) { rs ->
+            rs.next()
+            ReviewSummary(totalCount = rs.getLong("total_count"), consecutiveDays = rs.getInt("consecutive_days"))
+        }!!
+
+    /**
+     * PostgreSQL 외 DB(H2 PostgreSQL 모드 테스트 프로필)를 위한 동등한 대체 경로.
+     * today부터 날짜 내림차순으로 읽다가 첫 공백에서 멈추므로 연속 구간 길이만큼만 읽는다.
+     */
+    private fun summarizeByDateScan(
+        memberId: MemberId,
+        today: LocalDate,
+    ): ReviewSummary {
+        val totalCount =
+            ReviewTable
+                .selectAll()
+                .where { ReviewTable.memberId eq memberId.value }
+                .count()
+        val reviewDates =
+            ReviewTable
+                .select(ReviewTable.startDate)
+                .where { (ReviewTable.memberId eq memberId.value) and (ReviewTable.startDate lessEq today) }
+                .withDistinct()
+                .orderBy(ReviewTable.startDate, SortOrder.DESC)
+                .fetchSize(FETCH_SIZE)
+        var consecutiveDays = 0
+        var expected = today
+        for (row in reviewDates) {
+            if (row[ReviewTable.startDate] != expected) break
+            consecutiveDays++
+            expected = expected.minus(1, DateTimeUnit.DAY)
+        }
+        return ReviewSummary(totalCount = totalCount, consecutiveDays = consecutiveDays)
+    }
+
+    private fun ReviewQuery.toCondition(): Op<Boolean> {
+        var condition: Op<Boolean> = Op.TRUE
+        memberId?.let { condition = condition and (ReviewTable.memberId eq it.value) }
+        reviewType?.let { condition = condition and (ReviewTable.reviewType eq it.name) }
+        date?.let { condition = condition and (ReviewTable.startDate eq it) }
+        startDate?.let { condition = condition and (ReviewTable.startDate greaterEq it) }
+        endDate?.let { condition = condition and (ReviewTable.startDate lessEq it) }
+        stepType?.let { condition = condition and StepTypeContainsOp(it) }
+        return condition
+    }
 
     private fun ResultRow.toReview(): Review =
         Review(
@@ -119,4 +216,20 @@ class ExposedReviewRepository : ReviewRepository {
             createdAt = this[ReviewTable.createdAt].toInstant(),
             updatedAt = this[ReviewTable.updatedAt]?.toInstant(),
         )
+
+    companion object {
+        private const val FETCH_SIZE = 500
+
+        private val SUMMARY_SQL =
+            """
+            SELECT
+                (SELECT COUNT(*) FROM review WHERE member_id = ?) AS total_count,
+                COUNT(*) AS consecutive_days
+            FROM (
+                SELECT start_date, ROW_NUMBER() OVER (ORDER BY start_date DESC) AS rn
+                FROM (SELECT DISTINCT start_date FROM review WHERE member_id = ? AND start_date <= ?) AS review_days
+            ) AS ranked
+            WHERE start_date + CAST(rn AS INTEGER) = ?
+            """.trimIndent()
+    }
 }
@@ -12,7 +12,7 @@ private val objectMapper = jacksonObjectMapper()
 object ReviewTable : Table("review") {
     val reviewId = long("review_id").autoIncrement()
     val reviewType = text("review_type")
-    val memberId = long("member_id").index()
+    val memberId = long("member_id")
     val steps =
         jsonb<List<StepJson>>(
             "steps",
@@ -29,6 +29,7 @@ object ReviewTable : Table("review") {
 
     init {
         uniqueIndex(memberId, periodKey)
+        index("idx_review_member_id_start_date", false, memberId, startDate, reviewId)
     }
 }
 
@@ -0,0 +1,30 @@
+package kr.io.team.loop.review.infrastructure.persistence
+
+import kr.io.team.loop.review.domain.model.StepType
+import org.jetbrains.exposed.v1.core.Op
+import org.jetbrains.exposed.v1.core.QueryBuilder
+import org.jetbrains.exposed.v1.core.stringLiteral
+import org.jetbrains.exposed.v1.core.vendors.PostgreSQLDialect
+import org.jetbrains.exposed.v1.core.vendors.currentDialect
+
+/**
+ * `steps`에 주어진 단계 유형이 포함된 회고만 남기는 조건.
+ *
+ * PostgreSQL에서는 GIN 인덱스를 사용하는 JSONB 포함 연산(`@>`)으로, H2(PostgreSQL 모드)에서는
+ * 직렬화된 JSON 문자열 비교로 같은 결과를 낸다.
+ */
+class StepTypeContainsOp(
+    private val stepType: StepType,
+) : Op<Boolean>(),
+    Op.OpBoolean {
+    override fun toQueryBuilder(queryBuilder: QueryBuilder) {
+        queryBuilder {
+            val typeEntry = "\"type\":\"${stepType.name}\""
+            if (currentDialect is PostgreSQLDialect) {
+                append(ReviewTable.steps, " @> ", stringLiteral("[{$typeEntry}]"), "::jsonb")
+            } else {
+                append("CAST(", ReviewTable.steps, " AS VARCHAR) LIKE ", stringLiteral("%$typeEntry%"))
+            }
+        }
+    }
+}
@@ -8,11 +8,18 @@ import kotlinx.datetime.LocalDate
 import kotlinx.datetime.TimeZone
 import kotlinx.datetime.toLocalDateTime
 import kr.io.team.loop.codegen.types.CreateReviewInput
+import kr.io.team.loop.codegen.types.PageInfo
+import kr.io.team.loop.codegen.types.ReviewConnection
+import kr.io.team.loop.codegen.types.ReviewEdge
 import kr.io.team.loop.codegen.types.ReviewFilter
 import kr.io.team.loop.codegen.types.ReviewStepOutput
 import kr.io.team.loop.codegen.types.UpdateReviewInput
 import kr.io.team.loop.common.config.Authorize
+import kr.io.team.loop.common.config.CacheRegion
+import kr.io.team.loop.common.config.MemberCache
+import kr.io.team.loop.common.domain.KeysetCursor
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
 import kr.io.team.loop.review.application.service.ReviewService
 import kr.io.team.loop.review.domain.model.Review
 import kr.io.team.loop.review.domain.model.ReviewCommand
@@ -30,22 +37,35 @@ import kr.io.team.loop.review.domain.model.StepType as StepTypeDomain
 @DgsComponent
 class ReviewDataFetcher(
     private val reviewService: ReviewService,
+    private val memberCache: MemberCache,
 ) {
     @DgsQuery
     fun myReviews(
         @InputArgument filter: ReviewFilter,
         @Authorize memberId: Long,
-    ): List<ReviewGraphql> {
-        val query =
-            ReviewQuery(
-                memberId = MemberId(memberId),
-                reviewType = filter.reviewType?.let { ReviewTypeDomain.valueOf(it.name) },
-                stepType = filter.stepType?.let { StepTypeDomain.valueOf(it.name) },
-                date = filter.date?.let { LocalDate.parse(it) },
-                startDate = filter.startDate?.let { LocalDate.parse(it) },
-                endDate = filter.endDate?.let { LocalDate.parse(it) },
+    ): List<ReviewGraphql> = reviewService.findAll(filter.toQuery(memberId)).map { it.toGraphql() }
+
+    @DgsQuery
+    fun myReviewsConnection(
+        @InputArgument filter: ReviewFilter,
+        @InputArgument first: Int?,
+        @InputArgument after: String?,
+        @Authorize memberId: Long,
+    ): ReviewConnection {
+        val page =
+            PageRequest(
+                first = first ?: PageRequest.DEFAULT_FIRST,
+                after = after?.let { KeysetCursor.decode(it) },
             )
-        return reviewService.findAll(query).map { it.toGraphql() }
+        val result = reviewService.findPage(filter.toQuery(memberId), page)
+        val edges =
+            result.items.map {
+                ReviewEdge(cursor = KeysetCursor(it.startDate, it.id.value).encode(), node = it.toGraphql())
+            }
+        return ReviewConnection(
+            edges = edges,
+            pageInfo = PageInfo(hasNextPage = result.hasNext, endCursor = edges.lastOrNull()?.cursor),
+        )
     }
 
     @DgsQuery
@@ -57,7 +77,10 @@ class ReviewDataFetcher(
                 .now()
                 .toLocalDateTime(TimeZone.currentSystemDefault())
                 .date
-        val stats = reviewService.getStats(MemberId(memberId), today)
+        val stats =
+            memberCache.getOrLoad(CacheRegion.REVIEW_STATS, MemberId(memberId), today) {
+                reviewService.getStats(MemberId(memberId), today)
+            }
         return ReviewStatsGraphql(
             totalCount = stats.totalCount.toInt(),
             consecutiveDays = stats.consecutiveDays,
@@ -113,6 +136,16 @@ class ReviewDataFetcher(
         return true
     }
 
+    private fun ReviewFilter.toQuery(memberId: Long): ReviewQuery =
+        ReviewQuery(
+            memberId = MemberId(memberId),
+            reviewType = reviewType?.let { ReviewTypeDomain.valueOf(it.name) },
+            stepType = stepType?.let { StepTypeDomain.valueOf(it.name) },
+            date = date?.let { LocalDate.parse(it) },
+            startDate = startDate?.let { LocalDate.parse(it) },
+            endDate = endDate?.let { LocalDate.parse(it) },
+        )
+
     private fun Review.toGraphql(): ReviewGraphql =
         ReviewGraphql(
             id = id.value.toString(),
@@ -0,0 +1,11 @@
+package kr.io.team.loop.task.application.dto
+
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.task.domain.model.Task
+import kr.io.team.loop.task.domain.model.TaskId
+
+data class TaskBatchResultDto(
+    val taskId: TaskId,
+    val status: BatchItemStatus,
+    val task: Task?,
+)
@@ -0,0 +1,74 @@
+package kr.io.team.loop.task.application.service
+
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.common.domain.BatchLimit
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.event.TaskChangedEvent
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+import kr.io.team.loop.task.application.dto.TaskBatchResultDto
+import kr.io.team.loop.task.domain.model.Task
+import kr.io.team.loop.task.domain.model.TaskCommand
+import kr.io.team.loop.task.domain.model.TaskStatus
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
+import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.springframework.context.ApplicationEventPublisher
+import org.springframework.stereotype.Service
+import org.springframework.transaction.annotation.Transactional
+
+@Service
+class TaskBatchService(
+    private val taskRepository: TaskRepository,
+    private val goalTaskStatsRepository: GoalTaskStatsRepository,
+    private val eventPublisher: ApplicationEventPublisher,
+) {
+    @Transactional
+    fun createAll(commands: List<TaskCommand.Create>): List<Task> {
+        BatchLimit.validate(commands.size)
+        val tasks = taskRepository.saveAll(commands)
+        tasks.groupingBy { it.goalId }.eachCount().forEach { (goalId, count) ->
+            goalTaskStatsRepository.increment(goalId, totalDelta = count, completedDelta = 0)
+        }
+        tasks.map { it.memberId }.distinct().forEach { eventPublisher.publishEvent(TaskChangedEvent(it)) }
+        return tasks
+    }
+
+    @Transactional
+    fun updateAll(
+        commands: List<TaskCommand.Update>,
+        memberId: MemberId,
+    ): List<TaskBatchResultDto> {
+        BatchLimit.validate(commands.size)
+        if (commands.distinctBy { it.taskId }.size != commands.size) {
+            throw InvalidInputException("Duplicate task ids in batch")
+        }
+        val current = taskRepository.findAllByIdsForUpdate(commands.map { it.taskId }).associateBy { it.id }
+        val statuses =
+            commands.map { command ->
+                val task = current[command.taskId]
+                when {
+                    task == null -> BatchItemStatus.NOT_FOUND
+                    !task.isOwnedBy(memberId) -> BatchItemStatus.ACCESS_DENIED
+                    else -> BatchItemStatus.SUCCESS
+                }
+            }
+        val accepted = commands.filterIndexed { index, _ -> statuses[index] == BatchItemStatus.SUCCESS }
+        val before = accepted.map { current.getValue(it.taskId) }
+        val updated = taskRepository.updateAll(before, accepted)
+        before
+            .zip(updated)
+            .groupBy({ (task, _) -> task.goalId }) { (task, result) -> result.completedCount() - task.completedCount() }
+            .forEach { (goalId, deltas) ->
+                val completedDelta = deltas.sum()
+                if (completedDelta != 0) {
+                    goalTaskStatsRepository.increment(goalId, totalDelta = 0, completedDelta = completedDelta)
+                }
+            }
+        if (updated.isNotEmpty()) eventPublisher.publishEvent(TaskChangedEvent(memberId))
+        val updatedById = updated.associateBy { it.id }
+        return commands.mapIndexed { index, command ->
+            TaskBatchResultDto(taskId = command.taskId, status = statuses[index], task = updatedById[command.taskId])
+        }
+    }
+
+    private fun Task.completedCount(): Int = if (status == TaskStatus.DONE) 1 else 0
+}
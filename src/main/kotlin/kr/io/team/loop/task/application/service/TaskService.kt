@@ -1,17 +1,25 @@
 package kr.io.team.loop.task.application.service
 
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.ListLimit
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
 import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
 import kr.io.team.loop.common.domain.event.GoalDeletedEvent
+import kr.io.team.loop.common.domain.event.TaskChangedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
 import kr.io.team.loop.task.application.dto.GoalTaskStatsDto
+import kr.io.team.loop.task.domain.model.GoalTaskCount
 import kr.io.team.loop.task.domain.model.Task
 import kr.io.team.loop.task.domain.model.TaskCommand
 import kr.io.team.loop.task.domain.model.TaskQuery
 import kr.io.team.loop.task.domain.model.TaskStatus
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
 import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.springframework.beans.factory.annotation.Value
+import org.springframework.context.ApplicationEventPublisher
 import org.springframework.stereotype.Service
 import org.springframework.transaction.annotation.Transactional
 import org.springframework.transaction.event.TransactionPhase
@@ -20,40 +28,64 @@ import org.springframework.transaction.event.TransactionalEventListener
 @Service
 class TaskService(
     private val taskRepository: TaskRepository,
+    private val goalTaskStatsRepository: GoalTaskStatsRepository,
+    private val eventPublisher: ApplicationEventPublisher,
+    @Value("\${app.task.stats-table.enabled:false}") private val statsTableEnabled: Boolean,
 ) {
     @Transactional
-    fun create(command: TaskCommand.Create): Task = taskRepository.save(command)
+    fun create(command: TaskCommand.Create): Task {
+        val task = taskRepository.save(command)
+        goalTaskStatsRepository.increment(task.goalId, totalDelta = 1, completedDelta = task.status.completedCount())
+        eventPublisher.publishEvent(TaskChangedEvent(command.memberId))
+        return task
+    }
+
+    @Transactional(readOnly = true)
+    fun findAll(query: TaskQuery): List<Task> = taskRepository.findAll(query, ListLimit.MAX_SIZE)
 
     @Transactional(readOnly = true)
-    fun findAll(query: TaskQuery): List<Task> = taskRepository.findAll(query)
+    fun findPage(
+        query: TaskQuery,
+        page: PageRequest,
+    ): CursorPage<Task> = taskRepository.findPage(query, page)
 
     @Transactional
     fun update(
         command: TaskCommand.Update,
         memberId: MemberId,
     ): Task {
+        // 잠근 행의 상태로 증감을 계산해야 동시 수정이 같은 변화를 두 번 반영하지 않는다
         val task =
-            taskRepository.findById(command.taskId)
+            taskRepository.findByIdForUpdate(command.taskId)
                 ?: throw EntityNotFoundException("Task not found: ${command.taskId.value}")
         if (!task.isOwnedBy(memberId)) {
             throw AccessDeniedException("Task does not belong to member: ${memberId.value}")
         }
-        return taskRepository.update(command)
+        val updated = taskRepository.update(task, command)
+        val completedDelta = updated.status.completedCount() - task.status.completedCount()
+        if (completedDelta != 0) {
+            goalTaskStatsRepository.increment(task.goalId, totalDelta = 0, completedDelta = completedDelta)
+        }
+        eventPublisher.publishEvent(TaskChangedEvent(memberId))
+        return updated
     }
 
     @Transactional(readOnly = true)
     fun getStatsByGoalIds(goalIds: Set<GoalId>): Map<GoalId, GoalTaskStatsDto> {
-        val tasks = taskRepository.findAllByGoalIds(goalIds)
-        return tasks
-            .groupBy { it.goalId }
-            .map { (goalId, goalTasks) ->
-                goalId to
-                    GoalTaskStatsDto(
-                        goalId = goalId,
-                        totalCount = goalTasks.size,
-                        completedCount = goalTasks.count { it.status == TaskStatus.DONE },
-                    )
-            }.toMap()
+        val counts =
+            if (statsTableEnabled) {
+                goalTaskStatsRepository.findAllByGoalIds(goalIds)
+            } else {
+                taskRepository.countByGoalIds(goalIds)
+            }
+        return counts.associate { count ->
+            count.goalId to
+                GoalTaskStatsDto(
+                    goalId = count.goalId,
+                    totalCount = count.totalCount,
+                    completedCount = count.completedCount,
+                )
+        }
     }
 
     @Transactional
@@ -62,21 +94,34 @@ class TaskService(
         memberId: MemberId,
     ) {
         val task =
-            taskRepository.findById(command.taskId)
+            taskRepository.findByIdForUpdate(command.taskId)
                 ?: throw EntityNotFoundException("Task not found: ${command.taskId.value}")
         if (!task.isOwnedBy(memberId)) {
             throw AccessDeniedException("Task does not belong to member: ${memberId.value}")
         }
-        taskRepository.delete(command)
+        if (!taskRepository.delete(command)) {
+            return
+        }
+        goalTaskStatsRepository.increment(task.goalId, totalDelta = -1, completedDelta = -task.status.completedCount())
+        eventPublisher.publishEvent(TaskChangedEvent(memberId))
     }
 
     @TransactionalEventListener(phase = TransactionPhase.BEFORE_COMMIT)
     fun handleGoalDeleted(event: GoalDeletedEvent) {
         taskRepository.deleteByGoalId(event.goalId)
+        goalTaskStatsRepository.deleteByGoalId(event.goalId)
+        eventPublisher.publishEvent(TaskChangedEvent(event.memberId))
     }
 
     @TransactionalEventListener(phase = TransactionPhase.BEFORE_COMMIT)
     fun handleDailyGoalRemoved(event: DailyGoalRemovedEvent) {
         taskRepository.deleteByGoalIdAndMemberIdAndTaskDate(event.goalId, event.memberId, event.date)
+        val count =
+            taskRepository.countByGoalIds(setOf(event.goalId)).singleOrNull()
+                ?: GoalTaskCount(goalId = event.goalId, totalCount = 0, completedCount = 0)
+        goalTaskStatsRepository.save(count)
+        eventPublisher.publishEvent(TaskChangedEvent(event.memberId))
     }
+
+    private fun TaskStatus.completedCount(): Int = if (this == TaskStatus.DONE) 1 else 0
 }
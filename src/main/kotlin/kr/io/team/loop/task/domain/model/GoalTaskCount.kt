@@ -0,0 +1,9 @@
+package kr.io.team.loop.task.domain.model
+
+import kr.io.team.loop.common.domain.GoalId
+
+data class GoalTaskCount(
+    val goalId: GoalId,
+    val totalCount: Int,
+    val completedCount: Int,
+)
@@ -0,0 +1,18 @@
+package kr.io.team.loop.task.domain.repository
+
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.task.domain.model.GoalTaskCount
+
+interface GoalTaskStatsRepository {
+    fun findAllByGoalIds(goalIds: Set<GoalId>): List<GoalTaskCount>
+
+    fun increment(
+        goalId: GoalId,
+        totalDelta: Int,
+        completedDelta: Int,
+    )
+
+    fun save(count: GoalTaskCount)
+
+    fun deleteByGoalId(goalId: GoalId)
+}
@@ -1,8 +1,11 @@
 package kr.io.team.loop.task.domain.repository
 
 import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
+import kr.io.team.loop.task.domain.model.GoalTaskCount
 import kr.io.team.loop.task.domain.model.Task
 import kr.io.team.loop.task.domain.model.TaskCommand
 import kr.io.team.loop.task.domain.model.TaskId
@@ -11,9 +14,20 @@ import kr.io.team.loop.task.domain.model.TaskQuery
 interface TaskRepository {
     fun save(command: TaskCommand.Create): Task
 
-    fun update(command: TaskCommand.Update): Task
+    fun saveAll(commands: List<TaskCommand.Create>): List<Task>
 
-    fun delete(command: TaskCommand.Delete)
+    fun update(
+        current: Task,
+        command: TaskCommand.Update,
+    ): Task
+
+    fun updateAll(
+        current: List<Task>,
+        commands: List<TaskCommand.Update>,
+    ): List<Task>
+
+    /** 삭제된 행이 있으면 true. */
+    fun delete(command: TaskCommand.Delete): Boolean
 
     fun deleteByGoalId(goalId: GoalId)
 
@@ -23,9 +37,27 @@ interface TaskRepository {
         taskDate: LocalDate,
     )
 
-    fun findAll(query: TaskQuery): List<Task>
+    /** [limit]이 null이면 조건에 맞는 할일을 모두 반환한다. */
+    fun findAll(
+        query: TaskQuery,
+        limit: Int? = null,
+    ): List<Task>
+
+    fun findPage(
+        query: TaskQuery,
+        page: PageRequest,
+    ): CursorPage<Task>
 
     fun findById(id: TaskId): Task?
 
-    fun findAllByGoalIds(goalIds: Set<GoalId>): List<Task>
+    /**
+     * 행 잠금(`SELECT ... FOR UPDATE`)을 걸고 조회한다. 읽은 상태로 통계 카운터 증감을 계산하는 수정·삭제에서 쓰며,
+     * 같은 할일을 동시에 바꾸는 트랜잭션은 먼저 잡은 쪽이 커밋할 때까지 기다린 뒤 바뀐 상태를 읽는다.
+     */
+    fun findByIdForUpdate(id: TaskId): Task?
+
+    /** [findByIdForUpdate]의 다건 버전. 교착을 피하도록 항상 task_id 순서로 잠근다. */
+    fun findAllByIdsForUpdate(ids: Collection<TaskId>): List<Task>
+
+    fun countByGoalIds(goalIds: Set<GoalId>): List<GoalTaskCount>
 }
@@ -0,0 +1,59 @@
+package kr.io.team.loop.task.infrastructure.persistence
+
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.task.domain.model.GoalTaskCount
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
+import org.jetbrains.exposed.v1.core.eq
+import org.jetbrains.exposed.v1.core.inList
+import org.jetbrains.exposed.v1.core.plus
+import org.jetbrains.exposed.v1.jdbc.deleteWhere
+import org.jetbrains.exposed.v1.jdbc.selectAll
+import org.jetbrains.exposed.v1.jdbc.upsert
+import org.springframework.stereotype.Repository
+
+@Repository
+class ExposedGoalTaskStatsRepository : GoalTaskStatsRepository {
+    override fun findAllByGoalIds(goalIds: Set<GoalId>): List<GoalTaskCount> {
+        if (goalIds.isEmpty()) return emptyList()
+        val goalIdValues = goalIds.map { it.value }
+        return GoalTaskStatsTable
+            .selectAll()
+            .where { GoalTaskStatsTable.goalId inList goalIdValues }
+            .map {
+                GoalTaskCount(
+                    goalId = GoalId(it[GoalTaskStatsTable.goalId]),
+                    totalCount = it[GoalTaskStatsTable.totalCount],
+                    completedCount = it[GoalTaskStatsTable.completedCount],
+                )
+            }
+    }
+
+    override fun increment(
+        goalId: GoalId,
+        totalDelta: Int,
+        completedDelta: Int,
+    ) {
+        GoalTaskStatsTable.upsert(
+            onUpdate = {
+                it[GoalTaskStatsTable.totalCount] = GoalTaskStatsTable.totalCount + totalDelta
+                it[GoalTaskStatsTable.completedCount] = GoalTaskStatsTable.completedCount + completedDelta
+            },
+        ) {
+            it[this.goalId] = goalId.value
+            it[totalCount] = totalDelta
+            it[completedCount] = completedDelta
+        }
+    }
+
+    override fun save(count: GoalTaskCount) {
+        GoalTaskStatsTable.upsert {
+            it[goalId] = count.goalId.value
+            it[totalCount] = count.totalCount
+            it[completedCount] = count.completedCount
+        }
+    }
+
+    override fun deleteByGoalId(goalId: GoalId) {
+        GoalTaskStatsTable.deleteWhere { GoalTaskStatsTable.goalId eq goalId.value }
+    }
+}
@@ -1,8 +1,11 @@
 package kr.io.team.loop.task.infrastructure.persistence
 
 import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
+import kr.io.team.loop.task.domain.model.GoalTaskCount
 import kr.io.team.loop.task.domain.model.Task
 import kr.io.team.loop.task.domain.model.TaskCommand
 import kr.io.team.loop.task.domain.model.TaskId
@@ -14,12 +17,17 @@ import org.jetbrains.exposed.v1.core.Op
 import org.jetbrains.exposed.v1.core.ResultRow
 import org.jetbrains.exposed.v1.core.SortOrder
 import org.jetbrains.exposed.v1.core.and
+import org.jetbrains.exposed.v1.core.count
 import org.jetbrains.exposed.v1.core.eq
+import org.jetbrains.exposed.v1.core.greater
 import org.jetbrains.exposed.v1.core.greaterEq
 import org.jetbrains.exposed.v1.core.inList
 import org.jetbrains.exposed.v1.core.lessEq
+import org.jetbrains.exposed.v1.core.or
+import org.jetbrains.exposed.v1.jdbc.batchInsert
 import org.jetbrains.exposed.v1.jdbc.deleteWhere
 import org.jetbrains.exposed.v1.jdbc.insert
+import org.jetbrains.exposed.v1.jdbc.select
 import org.jetbrains.exposed.v1.jdbc.selectAll
 import org.jetbrains.exposed.v1.jdbc.update
 import org.springframework.stereotype.Repository
@@ -38,32 +46,57 @@ class ExposedTaskRepository : TaskRepository {
                 it[taskDate] = command.taskDate
                 it[createdAt] = now
             }
-        return Task(
-            id = TaskId(row[TaskTable.taskId]),
-            title = command.title,
-            status = TaskStatus.TODO,
-            goalId = command.goalId,
-            memberId = command.memberId,
-            taskDate = command.taskDate,
-            createdAt = now.toInstant(),
-            updatedAt = null,
-        )
+        return command.toTask(TaskId(row[TaskTable.taskId]), now)
     }
 
-    override fun update(command: TaskCommand.Update): Task {
+    override fun saveAll(commands: List<TaskCommand.Create>): List<Task> {
+        if (commands.isEmpty()) return emptyList()
         val now = OffsetDateTime.now()
-        TaskTable.update({ TaskTable.taskId eq command.taskId.value }) {
-            command.title?.let { newTitle -> it[title] = newTitle.value }
-            command.status?.let { newStatus -> it[status] = newStatus.name }
-            it[updatedAt] = now
-        }
-        return findById(command.taskId)!!
+        return TaskTable
+            .batchInsert(commands) { command ->
+                this[TaskTable.title] = command.title.value
+                this[TaskTable.status] = TaskStatus.TODO.name
+                this[TaskTable.goalId] = command.goalId.value
+                this[TaskTable.memberId] = command.memberId.value
+                this[TaskTable.taskDate] = command.taskDate
+                this[TaskTable.createdAt] = now
+            }.zip(commands) { row, command -> command.toTask(TaskId(row[TaskTable.taskId]), now) }
     }
 
-    override fun delete(command: TaskCommand.Delete) {
-        TaskTable.deleteWhere { taskId eq command.taskId.value }
+    override fun update(
+        current: Task,
+        command: TaskCommand.Update,
+    ): Task = updateAll(listOf(current), listOf(command)).single()
+
+    override fun updateAll(
+        current: List<Task>,
+        commands: List<TaskCommand.Update>,
+    ): List<Task> {
+        val now = OffsetDateTime.now()
+        // 변경 내용(title, status)이 같은 항목끼리 묶어 UPDATE ... WHERE task_id IN (...) 한 번으로 처리한다
+        commands.groupBy { it.title to it.status }.forEach { (change, group) ->
+            val (newTitle, newStatus) = change
+            TaskTable.update({ TaskTable.taskId inList group.map { it.taskId.value } }) {
+                if (newTitle != null) it[title] = newTitle.value
+                if (newStatus != null) it[status] = newStatus.name
+                it[updatedAt] = now
+            }
+        }
+        // 갱신 결과는 다시 읽지 않고 현재 상태에 변경 내용을 적용해 만든다
+        val currentById = current.associateBy { it.id }
+        return commands.map { command ->
+            val task = currentById.getValue(command.taskId)
+            task.copy(
+                title = command.title ?: task.title,
+                status = command.status ?: task.status,
+                updatedAt = now.toInstant(),
+            )
+        }
     }
 
+    override fun delete(command: TaskCommand.Delete): Boolean =
+        TaskTable.deleteWhere { taskId eq command.taskId.value } > 0
+
     override fun deleteByGoalId(goalId: GoalId) {
         TaskTable.deleteWhere { TaskTable.goalId eq goalId.value }
     }
@@ -80,17 +113,38 @@ class ExposedTaskRepository : TaskRepository {
         }
     }
 
-    override fun findAll(query: TaskQuery): List<Task> {
-        var condition: Op<Boolean> = Op.TRUE
-        query.memberId?.let { condition = condition and (TaskTable.memberId eq it.value) }
-        query.goalId?.let { condition = condition and (TaskTable.goalId eq it.value) }
-        query.startDate?.let { condition = condition and (TaskTable.taskDate greaterEq it) }
-        query.endDate?.let { condition = condition and (TaskTable.taskDate lessEq it) }
-        return TaskTable
+    override fun findAll(
+        query: TaskQuery,
+        limit: Int?,
+    ): List<Task> =
+        TaskTable
             .selectAll()
-            .where(condition)
-            .orderBy(TaskTable.taskDate, SortOrder.ASC)
+            .where(query.toCondition())
+            .orderBy(TaskTable.taskDate to SortOrder.ASC, TaskTable.taskId to SortOrder.ASC)
+            .let { rows -> if (limit != null) rows.limit(limit) else rows }
+            .fetchSize(FETCH_SIZE)
             .map { it.toTask() }
+
+    override fun findPage(
+        query: TaskQuery,
+        page: PageRequest,
+    ): CursorPage<Task> {
+        var condition = query.toCondition()
+        page.after?.let { cursor ->
+            condition = condition and
+                (
+                    (TaskTable.taskDate greater cursor.date) or
+                        ((TaskTable.taskDate eq cursor.date) and (TaskTable.taskId greater cursor.id))
+                )
+        }
+        val tasks =
+            TaskTable
+                .selectAll()
+                .where(condition)
+                .orderBy(TaskTable.taskDate to SortOrder.ASC, TaskTable.taskId to SortOrder.ASC)
+                .limit(page.first + 1)
+                .map { it.toTask() }
+        return CursorPage(items = tasks.take(page.first), hasNext = tasks.size > page.first)
     }
 
     override fun findById(id: TaskId): Task? =
@@ -100,15 +154,74 @@ class ExposedTaskRepository : TaskRepository {
             .singleOrNull()
             ?.toTask()
 
-    override fun findAllByGoalIds(goalIds: Set<GoalId>): List<Task> {
+    override fun findByIdForUpdate(id: TaskId): Task? =
+        TaskTable
+            .selectAll()
+            .where { TaskTable.taskId eq id.value }
+            .forUpdate()
+            .singleOrNull()
+            ?.toTask()
+
+    override fun findAllByIdsForUpdate(ids: Collection<TaskId>): List<Task> {
+        if (ids.isEmpty()) return emptyList()
+        return TaskTable
+            .selectAll()
+            .where { TaskTable.taskId inList ids.map { it.value } }
+            .orderBy(TaskTable.taskId)
+            .forUpdate()
+            .map { it.toTask() }
+    }
+
+    override fun countByGoalIds(goalIds: Set<GoalId>): List<GoalTaskCount> {
         if (goalIds.isEmpty()) return emptyList()
         val goalIdValues = goalIds.map { it.value }
+        val taskCount = TaskTable.taskId.count()
+        // (goal_id, status) 단위 집계 행만 읽고 목표별로 합산한다 (목표당 최대 2행)
         return TaskTable
-            .selectAll()
+            .select(TaskTable.goalId, TaskTable.status, taskCount)
             .where { TaskTable.goalId inList goalIdValues }
-            .map { it.toTask() }
+            .groupBy(TaskTable.goalId, TaskTable.status)
+            .map { row ->
+                val count = row[taskCount].toInt()
+                GoalTaskCount(
+                    goalId = GoalId(row[TaskTable.goalId]),
+                    totalCount = count,
+                    completedCount = if (row[TaskTable.status] == TaskStatus.DONE.name) count else 0,
+                )
+            }.groupBy { it.goalId }
+            .map { (goalId, counts) ->
+                GoalTaskCount(
+                    goalId = goalId,
+                    totalCount = counts.sumOf { it.totalCount },
+                    completedCount = counts.sumOf { it.completedCount },
+                )
+            }
     }
 
+    private fun TaskQuery.toCondition(): Op<Boolean> {
+        var condition: Op<Boolean> = Op.TRUE
+        memberId?.let { condition = condition and (TaskTable.memberId eq it.value) }
+        goalId?.let { condition = condition and (TaskTable.goalId eq it.value) }
+        startDate?.let { condition = condition and (TaskTable.taskDate greaterEq it) }
+        endDate?.let { condition = condition and (TaskTable.taskDate lessEq it) }
+        return condition
+    }
+
+    private fun TaskCommand.Create.toTask(
+        id: TaskId,
+        now: OffsetDateTime,
+    ): Task =
+        Task(
+            id = id,
+            title = title,
+            status = TaskStatus.TODO,
+            goalId = goalId,
+            memberId = memberId,
+            taskDate = taskDate,
+            createdAt = now.toInstant(),
+            updatedAt = null,
+        )
+
     private fun ResultRow.toTask(): Task =
         Task(
             id = TaskId(this[TaskTable.taskId]),
@@ -120,4 +233,8 @@ class ExposedTaskRepository : TaskRepository {
             createdAt = this[TaskTable.createdAt].toInstant(),
             updatedAt = this[TaskTable.updatedAt]?.toInstant(),
         )
+
+    companion object {
+        private const val FETCH_SIZE = 500
+    }
 }
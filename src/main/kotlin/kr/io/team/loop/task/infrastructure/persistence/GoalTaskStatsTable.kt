@@ -0,0 +1,11 @@
+package kr.io.team.loop.task.infrastructure.persistence
+
+import org.jetbrains.exposed.v1.core.Table
+
+object GoalTaskStatsTable : Table("goal_task_stats") {
+    val goalId = long("goal_id")
+    val totalCount = integer("total_count")
+    val completedCount = integer("completed_count")
+
+    override val primaryKey = PrimaryKey(goalId)
+}
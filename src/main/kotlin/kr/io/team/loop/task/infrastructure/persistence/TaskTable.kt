@@ -9,10 +9,15 @@ object TaskTable : Table("task") {
     val title = text("title")
     val status = text("status")
     val goalId = long("goal_id").index()
-    val memberId = long("member_id").index()
+    val memberId = long("member_id")
     val taskDate = date("task_date")
     val createdAt = timestampWithTimeZone("created_at")
     val updatedAt = timestampWithTimeZone("updated_at").nullable()
 
     override val primaryKey = PrimaryKey(taskId)
+
+    init {
+        index("idx_task_member_id_task_date", false, memberId, taskDate, taskId)
+        index("idx_task_member_id_goal_id_task_date", false, memberId, goalId, taskDate, taskId)
+    }
 }
@@ -6,11 +6,20 @@ import com.netflix.graphql.dgs.DgsQuery
 import com.netflix.graphql.dgs.InputArgument
 import kotlinx.datetime.LocalDate
 import kr.io.team.loop.codegen.types.CreateTaskInput
+import kr.io.team.loop.codegen.types.PageInfo
+import kr.io.team.loop.codegen.types.TaskConnection
+import kr.io.team.loop.codegen.types.TaskEdge
 import kr.io.team.loop.codegen.types.TaskFilter
 import kr.io.team.loop.codegen.types.UpdateTaskInput
+import kr.io.team.loop.codegen.types.UpdateTaskResult
 import kr.io.team.loop.common.config.Authorize
+import kr.io.team.loop.common.config.CacheRegion
+import kr.io.team.loop.common.config.MemberCache
 import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.KeysetCursor
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
+import kr.io.team.loop.task.application.service.TaskBatchService
 import kr.io.team.loop.task.application.service.TaskService
 import kr.io.team.loop.task.domain.model.Task
 import kr.io.team.loop.task.domain.model.TaskCommand
@@ -18,56 +27,80 @@ import kr.io.team.loop.task.domain.model.TaskId
 import kr.io.team.loop.task.domain.model.TaskQuery
 import kr.io.team.loop.task.domain.model.TaskStatus
 import kr.io.team.loop.task.domain.model.TaskTitle
+import kr.io.team.loop.codegen.types.BatchItemStatus as BatchItemStatusGraphql
 import kr.io.team.loop.codegen.types.Task as TaskGraphql
 import kr.io.team.loop.codegen.types.TaskStatus as TaskStatusGraphql
 
 @DgsComponent
 class TaskDataFetcher(
     private val taskService: TaskService,
+    private val taskBatchService: TaskBatchService,
+    private val memberCache: MemberCache,
 ) {
     @DgsQuery
     fun myTasks(
         @InputArgument filter: TaskFilter,
         @Authorize memberId: Long,
     ): List<TaskGraphql> {
-        val query =
-            TaskQuery(
-                memberId = MemberId(memberId),
-                goalId = filter.goalId?.let { GoalId(it.toLong()) },
-                startDate = filter.startDate?.let { LocalDate.parse(it) },
-                endDate = filter.endDate?.let { LocalDate.parse(it) },
+        val query = filter.toQuery(memberId)
+        return memberCache
+            .getOrLoad(CacheRegion.TASKS, MemberId(memberId), query) { taskService.findAll(query) }
+            .map { it.toGraphql() }
+    }
+
+    @DgsQuery
+    fun myTasksConnection(
+        @InputArgument filter: TaskFilter,
+        @InputArgument first: Int?,
+        @InputArgument after: String?,
+        @Authorize memberId: Long,
+    ): TaskConnection {
+        val page =
+            PageRequest(
+                first = first ?: PageRequest.DEFAULT_FIRST,
+                after = after?.let { KeysetCursor.decode(it) },
             )
-        return taskService.findAll(query).map { it.toGraphql() }
+        val result = taskService.findPage(filter.toQuery(memberId), page)
+        val edges =
+            result.items.map {
+                TaskEdge(cursor = KeysetCursor(it.taskDate, it.id.value).encode(), node = it.toGraphql())
+            }
+        return TaskConnection(
+            edges = edges,
+            pageInfo = PageInfo(hasNextPage = result.hasNext, endCursor = edges.lastOrNull()?.cursor),
+        )
     }
 
     @DgsMutation
     fun createTask(
         @InputArgument input: CreateTaskInput,
         @Authorize memberId: Long,
-    ): TaskGraphql {
-        val command =
-            TaskCommand.Create(
-                title = TaskTitle(input.title),
-                goalId = GoalId(input.goalId.toLong()),
-                memberId = MemberId(memberId),
-                taskDate = LocalDate.parse(input.date),
-            )
-        return taskService.create(command).toGraphql()
-    }
+    ): TaskGraphql = taskService.create(input.toCommand(memberId)).toGraphql()
+
+    @DgsMutation
+    fun createTasks(
+        @InputArgument inputs: List<CreateTaskInput>,
+        @Authorize memberId: Long,
+    ): List<TaskGraphql> = taskBatchService.createAll(inputs.map { it.toCommand(memberId) }).map { it.toGraphql() }
 
     @DgsMutation
     fun updateTask(
         @InputArgument input: UpdateTaskInput,
         @Authorize memberId: Long,
-    ): TaskGraphql {
-        val command =
-            TaskCommand.Update(
-                taskId = TaskId(input.id.toLong()),
-                title = input.title?.let { TaskTitle(it) },
-                status = input.status?.let { TaskStatus.valueOf(it.name) },
+    ): TaskGraphql = taskService.update(input.toCommand(), MemberId(memberId)).toGraphql()
+
+    @DgsMutation
+    fun updateTasks(
+        @InputArgument inputs: List<UpdateTaskInput>,
+        @Authorize memberId: Long,
+    ): List<UpdateTaskResult> =
+        taskBatchService.updateAll(inputs.map { it.toCommand() }, MemberId(memberId)).map { result ->
+            UpdateTaskResult(
+                id = result.taskId.value.toString(),
+                status = BatchItemStatusGraphql.valueOf(result.status.name),
+                task = result.task?.toGraphql(),
             )
-        return taskService.update(command, MemberId(memberId)).toGraphql()
-    }
+        }
 
     @DgsMutation
     fun deleteTask(
@@ -79,6 +112,29 @@ class TaskDataFetcher(
         return true
     }
 
+    private fun CreateTaskInput.toCommand(memberId: Long): TaskCommand.Create =
+        TaskCommand.Create(
+            title = TaskTitle(title),
+            goalId = GoalId(goalId.toLong()),
+            memberId = MemberId(memberId),
+            taskDate = LocalDate.parse(date),
+        )
+
+    private fun UpdateTaskInput.toCommand(): TaskCommand.Update =
+        TaskCommand.Update(
+            taskId = TaskId(id.toLong()),
+            title = title?.let { TaskTitle(it) },
+            status = status?.let { TaskStatus.valueOf(it.name) },
+        )
+
+    private fun TaskFilter.toQuery(memberId: Long): TaskQuery =
+        TaskQuery(
+            memberId = MemberId(memberId),
+            goalId = goalId?.let { GoalId(it.toLong()) },
+            startDate = startDate?.let { LocalDate.parse(it) },
+            endDate = endDate?.let { LocalDate.parse(it) },
+        )
+
     private fun Task.toGraphql(): TaskGraphql =
         TaskGraphql(
             id = id.value.toString(),
@@ -1,6 +1,7 @@
 package kr.io.team.loop.task.presentation.dataloader
 
 import com.netflix.graphql.dgs.DgsDataLoader
+import kr.io.team.loop.common.config.DataLoaderMetrics
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.task.application.dto.GoalTaskStatsDto
 import kr.io.team.loop.task.application.service.TaskService
@@ -11,11 +12,14 @@ import java.util.concurrent.CompletionStage
 @DgsDataLoader(name = "goalTaskStats")
 class GoalTaskStatsDataLoader(
     private val taskService: TaskService,
+    private val dataLoaderMetrics: DataLoaderMetrics,
 ) : MappedBatchLoader<Long, GoalTaskStatsDto> {
     override fun load(keys: Set<Long>): CompletionStage<Map<Long, GoalTaskStatsDto>> =
-        CompletableFuture.supplyAsync {
-            val goalIds = keys.map { GoalId(it) }.toSet()
-            val stats = taskService.getStatsByGoalIds(goalIds)
-            stats.map { (goalId, goalTaskStats) -> goalId.value to goalTaskStats }.toMap()
+        dataLoaderMetrics.record("goalTaskStats", keys.size) {
+            CompletableFuture.supplyAsync {
+                val goalIds = keys.map { GoalId(it) }.toSet()
+                val stats = taskService.getStatsByGoalIds(goalIds)
+                stats.map { (goalId, goalTaskStats) -> goalId.value to goalTaskStats }.toMap()
+            }
         }
 }
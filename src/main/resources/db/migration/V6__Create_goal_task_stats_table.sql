@@ -0,0 +1,12 @@
+CREATE TABLE goal_task_stats (
+    goal_id         BIGINT  PRIMARY KEY,
+    total_count     INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0
+);
+
+INSERT INTO goal_task_stats (goal_id, total_count, completed_count)
+SELECT goal_id,
+       COUNT(*),
+       SUM(CASE WHEN status = 'DONE' THEN 1 ELSE 0 END)
+FROM task
+GROUP BY goal_id;
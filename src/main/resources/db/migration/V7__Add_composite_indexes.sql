@@ -0,0 +1,12 @@
+-- 실제 조회 형태(member_id + 날짜 범위, 키셋 정렬)에 맞춘 복합 인덱스.
+-- member_id 단일 인덱스는 복합 인덱스의 선두 컬럼으로 대체되므로 제거한다.
+
+CREATE INDEX idx_task_member_id_task_date ON task (member_id, task_date, task_id);
+CREATE INDEX idx_task_member_id_goal_id_task_date ON task (member_id, goal_id, task_date, task_id);
+DROP INDEX idx_task_member_id;
+
+CREATE INDEX idx_review_member_id_start_date ON review (member_id, start_date DESC, review_id DESC);
+DROP INDEX idx_review_member_id;
+
+CREATE INDEX idx_daily_goal_member_id_date ON daily_goal (member_id, date);
+DROP INDEX idx_daily_goal_member_id;
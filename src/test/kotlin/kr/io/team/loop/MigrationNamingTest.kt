@@ -0,0 +1,48 @@
+package kr.io.team.loop
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.collections.shouldBeIn
+import io.kotest.matchers.collections.shouldNotBeEmpty
+import io.kotest.matchers.shouldBe
+import org.springframework.core.io.support.PathMatchingResourcePatternResolver
+
+/**
+ * 공용 마이그레이션(db/migration)은 V<N>, vendor 마이그레이션(db/vendor/{vendor})은 V<N>_<M> 형식인지 확인한다.
+ * vendor 파일이 공용 버전 번호를 차지하면 다음 공용 마이그레이션이 그 DB에서만 버전 충돌을 일으킨다.
+ */
+class MigrationNamingTest :
+    BehaviorSpec({
+
+        val shared = Regex("""V(\d+)__\w+\.sql""")
+        val vendor = Regex("""V(\d+)_(\d+)__\w+\.sql""")
+        val resolver = PathMatchingResourcePatternResolver()
+
+        fun fileNames(pattern: String): List<String> = resolver.getResources(pattern).mapNotNull { it.filename }
+
+        val sharedVersions =
+            fileNames("classpath*:db/migration/*.sql").map { name ->
+                shared.matchEntire(name)?.groupValues?.get(1) ?: error("unexpected shared migration name: $name")
+            }
+
+        Given("공용 마이그레이션") {
+            When("버전을 읽으면") {
+                Then("정수 버전이 중복 없이 붙어 있다") {
+                    sharedVersions.shouldNotBeEmpty()
+                    sharedVersions.distinct().size shouldBe sharedVersions.size
+                }
+            }
+        }
+
+        Given("vendor 마이그레이션") {
+            val vendorFiles = fileNames("classpath*:db/vendor/*/*.sql")
+
+            When("버전을 읽으면") {
+                Then("직전 공용 버전에 하위 번호를 붙인 형식이다") {
+                    vendorFiles.forEach { name ->
+                        val match = vendor.matchEntire(name) ?: error("vendor migration must be V<N>_<M>__: $name")
+                        match.groupValues[1] shouldBeIn sharedVersions
+                    }
+                }
+            }
+        }
+    })
@@ -0,0 +1,120 @@
+package kr.io.team.loop.common.config
+
+import graphql.GraphQLContext
+import io.jsonwebtoken.Jwts
+import io.jsonwebtoken.security.Keys
+import org.assertj.core.api.Assertions.assertThat
+import org.assertj.core.api.Assertions.entry
+import org.junit.jupiter.api.Tag
+import org.junit.jupiter.api.Test
+import org.slf4j.LoggerFactory
+import java.util.Optional
+
+/**
+ * 요청당 인증 비용 벤치마크. `@Authorize` 필드가 [FIELDS_PER_REQUEST]개인 쿼리 하나를 한 요청으로 본다.
+ *
+ * - before: 필드마다 parser를 새로 만들어 토큰 검증과 memberId 추출을 따로 수행 (서명 검증 2회)
+ * - after (cold): 요청마다 처음 보는 토큰 — 요청당 서명 검증 1회, 나머지 필드는 요청 컨텍스트 재사용
+ * - after (warm): 같은 토큰의 반복 요청 — 공유 캐시 적중, 서명 검증 없음
+ *
+ * 소요 시간은 머신과 JIT 상태에 따라 흔들리므로 로그로만 남기고,
+ * 검증 대상은 서명 검증 호출 횟수(토큰당 정확히 1회)다.
+ * `./gradlew benchmark`로만 실행된다 (기본 `test` 태스크에서는 제외).
+ */
+@Tag("benchmark")
+class AuthorizeBenchmarkTest {
+    private val log = LoggerFactory.getLogger(javaClass)
+
+    private val secret = "test-jwt-secret-key-must-be-at-least-256-bits-long-for-hs256"
+    private val provider = JjwtTokenProvider(secret, 3_600_000L)
+    private val key = Keys.hmacShaKeyFor(secret.toByteArray())
+    private val tokens = (1L..REQUESTS).map { provider.generateToken(it) }
+
+    // 측정 구간과 겹치지 않는 토큰으로 워밍업해 cold 측정에 캐시 적중이 섞이지 않게 한다
+    private val warmupTokens = (1L..WARMUP_REQUESTS).map { provider.generateToken(REQUESTS + it) }
+
+    @Test
+    fun `per-request auth overhead - before vs after`() {
+        measure("before") { token -> repeat(FIELDS_PER_REQUEST) { legacyResolve(token) } }
+
+        val coldProvider = CountingTokenProvider(provider)
+        val coldCache = VerifiedTokenCache(coldProvider, maximumSize = 10_000)
+        measure("after (cold)") { token -> resolveRequest(coldCache, token) }
+
+        val warmProvider = CountingTokenProvider(provider)
+        val warmCache = VerifiedTokenCache(warmProvider, maximumSize = 10_000)
+        val warmToken = tokens.first()
+        measure("after (warm)") { _ -> resolveRequest(warmCache, warmToken) }
+
+        // 요청마다 새 토큰이면 필드 수와 무관하게 요청(토큰)당 한 번만 검증한다
+        assertThat(coldProvider.verifyCounts).hasSize(warmupTokens.size + tokens.size)
+        assertThat(coldProvider.verifyCounts.values).containsOnly(1)
+        // 같은 토큰의 반복 요청은 첫 요청에서만 검증한다
+        assertThat(warmProvider.verifyCounts).containsExactly(entry(warmToken, 1))
+    }
+
+    /** 기존 AuthorizeArgumentResolver 경로: 필드마다 parser 생성 + 서명 검증 2회. */
+    private fun legacyResolve(token: String): Long {
+        Jwts
+            .parser()
+            .verifyWith(key)
+            .build()
+            .parseSignedClaims(token)
+        return Jwts
+            .parser()
+            .verifyWith(key)
+            .build()
+            .parseSignedClaims(token)
+            .payload
+            .subject
+            .toLong()
+    }
+
+    /** 현재 AuthorizeArgumentResolver 경로: 요청 컨텍스트에 memberId를 한 번만 저장한다. */
+    private fun resolveRequest(
+        cache: VerifiedTokenCache,
+        token: String,
+    ) {
+        val context = GraphQLContext.newContext().build()
+        repeat(FIELDS_PER_REQUEST) {
+            context.computeIfAbsent(CONTEXT_KEY) { Optional.ofNullable(cache.memberIdOf(token)) }
+        }
+    }
+
+    /** 요청당 평균 소요 시간(µs)을 로그로 남긴다. */
+    private fun measure(
+        name: String,
+        request: (String) -> Unit,
+    ) {
+        warmupTokens.forEach(request)
+        val start = System.nanoTime()
+        tokens.forEach(request)
+        val perRequestMicros = (System.nanoTime() - start) / 1_000.0 / tokens.size
+        log.info(
+            "[benchmark] auth {} ({} fields/request, {} requests): avg={}µs/request",
+            name,
+            FIELDS_PER_REQUEST,
+            tokens.size,
+            "%.2f".format(perRequestMicros),
+        )
+    }
+
+    /** 토큰별 [JwtTokenProvider.verify] 호출 횟수를 세는 spy. 측정값을 흐리지 않도록 위임만 한다. */
+    private class CountingTokenProvider(
+        private val delegate: JwtTokenProvider,
+    ) : JwtTokenProvider by delegate {
+        val verifyCounts = mutableMapOf<String, Int>()
+
+        override fun verify(token: String): VerifiedToken? {
+            verifyCounts.merge(token, 1, Int::plus)
+            return delegate.verify(token)
+        }
+    }
+
+    companion object {
+        private const val FIELDS_PER_REQUEST = 4
+        private const val REQUESTS = 5_000L
+        private const val WARMUP_REQUESTS = 500L
+        private const val CONTEXT_KEY = "memberId"
+    }
+}
@@ -0,0 +1,128 @@
+package kr.io.team.loop.common.config
+
+import graphql.ExecutionInput
+import graphql.GraphqlErrorBuilder
+import graphql.execution.preparsed.PreparsedDocumentEntry
+import graphql.execution.preparsed.persisted.PersistedQuerySupport
+import graphql.parser.Parser
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import java.security.MessageDigest
+import java.util.HexFormat
+import java.util.function.Function
+
+class CachingPreparsedDocumentProviderTest :
+    BehaviorSpec({
+
+        val meterRegistry = SimpleMeterRegistry()
+        val provider =
+            CachingPreparsedDocumentProvider(meterRegistry, documentCacheSize = 10, persistedQueryCacheSize = 10)
+
+        var parseCount = 0
+        val parseAndValidate =
+            Function<ExecutionInput, PreparsedDocumentEntry> { input ->
+                parseCount++
+                PreparsedDocumentEntry(Parser.parse(input.query))
+            }
+
+        fun sha256(query: String): String =
+            HexFormat.of().formatHex(MessageDigest.getInstance("SHA-256").digest(query.toByteArray()))
+
+        fun input(
+            query: String,
+            hash: String? = null,
+        ) = ExecutionInput
+            .newExecutionInput(query)
+            .extensions(
+                hash?.let { mapOf("persistedQuery" to mapOf("version" to 1, "sha256Hash" to it)) } ?: emptyMap(),
+            )
+            .build()
+
+        fun resolve(input: ExecutionInput) = provider.getDocumentAsync(input, parseAndValidate).join()
+
+        Given("같은 쿼리 원문") {
+            val query = "{ myGoals { id } }"
+
+            When("두 번 요청하면") {
+                parseCount = 0
+                resolve(input(query))
+                resolve(input(query))
+
+                Then("한 번만 파싱·검증한다") {
+                    parseCount shouldBe 1
+                    meterRegistry.get("graphql.document.parse.validate").timer().count() shouldBe 1L
+                }
+            }
+        }
+
+        Given("처음 보는 persisted query 해시") {
+            val query = "{ myTasks(filter: {}) { id } }"
+            val hash = sha256(query)
+
+            When("원문 없이 해시만 보내면") {
+                val entry = resolve(input("", hash))
+
+                Then("PersistedQueryNotFound 오류를 반환한다") {
+                    entry.errors.single().message shouldBe "PersistedQueryNotFound"
+                }
+            }
+
+            When("원문과 해시를 함께 보낸 뒤 해시만 보내면") {
+                resolve(input(query, hash))
+                val entry = resolve(input("", hash))
+
+                Then("등록된 원문의 문서를 반환한다") {
+                    entry.hasErrors() shouldBe false
+                    entry.document shouldBe resolve(input(query)).document
+                }
+            }
+
+            When("해시가 원문과 맞지 않으면") {
+                val mismatched = sha256("{ me { id } }")
+                val entry = resolve(input(query, mismatched))
+
+                Then("해시 불일치 오류를 반환하고 그 해시를 등록하지 않는다") {
+                    entry.errors.single().message shouldBe "PersistedQueryIdInvalid"
+                    resolve(input("", mismatched)).errors.single().message shouldBe "PersistedQueryNotFound"
+                }
+            }
+        }
+
+        Given("검증에 실패하는 문서") {
+            val query = "{ unknownField }"
+            val failingParse =
+                Function<ExecutionInput, PreparsedDocumentEntry> { input ->
+                    parseCount++
+                    PreparsedDocumentEntry(
+                        listOf(GraphqlErrorBuilder.newError().message("Validation error on ${input.query}").build()),
+                    )
+                }
+
+            When("원문과 해시로 두 번 요청하면") {
+                parseCount = 0
+                repeat(2) { provider.getDocumentAsync(input(query, sha256(query)), failingParse).join() }
+
+                Then("오류 결과는 캐시하지 않아 매번 다시 검증하고 해시도 등록하지 않는다") {
+                    parseCount shouldBe 2
+                    resolve(input("", sha256(query))).errors.single().message shouldBe "PersistedQueryNotFound"
+                }
+            }
+        }
+
+        Given("서버에 등록된 연산") {
+            val query = "{ myReviewStats { totalCount } }"
+            provider.register(query, PreparsedDocumentEntry(Parser.parse(query)))
+
+            When("해시만 보내면") {
+                parseCount = 0
+                // Spring GraphQL은 원문 없는 APQ 요청의 쿼리를 PERSISTED_QUERY_MARKER로 채운다
+                val entry = resolve(input(PersistedQuerySupport.PERSISTED_QUERY_MARKER, sha256(query)))
+
+                Then("파싱 없이 미리 컴파일된 문서를 반환한다") {
+                    entry.hasErrors() shouldBe false
+                    parseCount shouldBe 0
+                }
+            }
+        }
+    })
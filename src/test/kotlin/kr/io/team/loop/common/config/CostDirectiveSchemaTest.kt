@@ -0,0 +1,51 @@
+package kr.io.team.loop.common.config
+
+import graphql.language.IntValue
+import graphql.schema.idl.SchemaParser
+import graphql.schema.idl.TypeDefinitionRegistry
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import kr.io.team.loop.common.domain.BatchLimit
+import kr.io.team.loop.common.domain.ListLimit
+import org.springframework.core.io.ClassPathResource
+
+/** 서버가 반환 개수를 제한하는 리스트 필드의 `@cost(listSize)`가 실제 상한과 어긋나지 않는지 확인한다. */
+class CostDirectiveSchemaTest :
+    BehaviorSpec({
+
+        val registry =
+            listOf("schema.graphqls", "goal.graphqls", "task.graphqls", "review.graphqls")
+                .map { file -> ClassPathResource("schema/$file").inputStream.use { SchemaParser().parse(it) } }
+                .reduce(TypeDefinitionRegistry::merge)
+
+        fun listSizeOf(
+            type: String,
+            field: String,
+        ): Int? =
+            registry
+                .objectTypeExtensions()[type]
+                .orEmpty()
+                .flatMap { it.fieldDefinitions }
+                .single { it.name == field }
+                .getDirectives("cost")
+                .single()
+                .getArgument("listSize")
+                ?.let { (it.value as IntValue).value.toInt() }
+
+        Given("애플리케이션 스키마") {
+            When("목록 조회 필드의 listSize를 읽으면") {
+                Then("ListLimit.MAX_SIZE와 같다") {
+                    listSizeOf("Query", "myTasks") shouldBe ListLimit.MAX_SIZE
+                    listSizeOf("Query", "myReviews") shouldBe ListLimit.MAX_SIZE
+                }
+            }
+
+            When("일괄 변경 필드의 listSize를 읽으면") {
+                Then("BatchLimit.MAX_SIZE와 같다") {
+                    listOf("createTasks", "updateTasks", "addDailyGoals", "removeDailyGoals").forEach { field ->
+                        listSizeOf("Mutation", field) shouldBe BatchLimit.MAX_SIZE
+                    }
+                }
+            }
+        }
+    })
@@ -0,0 +1,44 @@
+package kr.io.team.loop.common.config
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.shouldBe
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import java.util.concurrent.CompletableFuture
+
+class DataLoaderMetricsTest :
+    BehaviorSpec({
+
+        Given("활성화된 DataLoaderMetrics") {
+            val meterRegistry = SimpleMeterRegistry()
+            val dataLoaderMetrics = DataLoaderMetrics(meterRegistry, enabled = true)
+
+            When("배치를 실행하면") {
+                val result =
+                    dataLoaderMetrics
+                        .record("goalTaskStats", 3) { CompletableFuture.completedFuture("loaded") }
+                        .toCompletableFuture()
+                        .join()
+
+                Then("결과는 그대로 두고 배치 크기와 처리 시간을 기록한다") {
+                    result shouldBe "loaded"
+                    val batchSize = meterRegistry.get("graphql.dataloader.batch.size").tag("loader", "goalTaskStats")
+                    batchSize.summary().totalAmount() shouldBe 3.0
+                    meterRegistry.get("graphql.dataloader.dispatch").timer().count() shouldBe 1L
+                }
+            }
+        }
+
+        Given("비활성화된 DataLoaderMetrics") {
+            val meterRegistry = SimpleMeterRegistry()
+            val dataLoaderMetrics = DataLoaderMetrics(meterRegistry, enabled = false)
+
+            When("배치를 실행하면") {
+                dataLoaderMetrics.record("goalTaskStats", 3) { CompletableFuture.completedFuture("loaded") }
+
+                Then("아무 지표도 등록하지 않는다") {
+                    meterRegistry.find("graphql.dataloader.batch.size").summary().shouldBeNull()
+                }
+            }
+        }
+    })
@@ -2,6 +2,7 @@ package kr.io.team.loop.common.config
 
 import io.kotest.core.spec.style.BehaviorSpec
 import io.kotest.matchers.shouldBe
+import java.time.Instant
 
 class JjwtTokenProviderTest :
     BehaviorSpec({
@@ -10,20 +11,22 @@ class JjwtTokenProviderTest :
         val expirationMs = 3600000L
         val provider = JjwtTokenProvider(secret, expirationMs)
 
-        Given("validateToken") {
+        Given("verify") {
             When("유효한 토큰이면") {
-                val token = provider.generateToken(1L)
+                val token = provider.generateToken(42L)
 
-                Then("true를 반환한다") {
-                    provider.validateToken(token) shouldBe true
+                Then("memberId와 만료 시각을 반환한다") {
+                    val verified = provider.verify(token)
+                    verified?.memberId shouldBe 42L
+                    (verified!!.expiresAt > Instant.now()) shouldBe true
                 }
             }
 
             When("변조된 토큰이면") {
-                val token = provider.generateToken(1L) + "tampered"
+                val token = provider.generateToken(42L) + "tampered"
 
-                Then("false를 반환한다") {
-                    provider.validateToken(token) shouldBe false
+                Then("null을 반환한다") {
+                    provider.verify(token) shouldBe null
                 }
             }
 
@@ -35,8 +38,8 @@ class JjwtTokenProviderTest :
                     )
                 val token = otherProvider.generateToken(1L)
 
-                Then("false를 반환한다") {
-                    provider.validateToken(token) shouldBe false
+                Then("null을 반환한다") {
+                    provider.verify(token) shouldBe null
                 }
             }
 
@@ -44,24 +47,14 @@ class JjwtTokenProviderTest :
                 val expiredProvider = JjwtTokenProvider(secret, -1000L)
                 val token = expiredProvider.generateToken(1L)
 
-                Then("false를 반환한다") {
-                    provider.validateToken(token) shouldBe false
+                Then("null을 반환한다") {
+                    provider.verify(token) shouldBe null
                 }
             }
 
             When("빈 문자열이면") {
-                Then("false를 반환한다") {
-                    provider.validateToken("") shouldBe false
-                }
-            }
-        }
-
-        Given("getMemberIdFromToken") {
-            When("유효한 토큰이면") {
-                val token = provider.generateToken(42L)
-
-                Then("정확한 memberId를 반환한다") {
-                    provider.getMemberIdFromToken(token) shouldBe 42L
+                Then("null을 반환한다") {
+                    provider.verify("") shouldBe null
                 }
             }
         }
@@ -0,0 +1,122 @@
+package kr.io.team.loop.common.config
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.collections.shouldContainExactlyInAnyOrder
+import io.kotest.matchers.shouldBe
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.support.FakeMemberCacheBackend
+import org.springframework.cache.concurrent.ConcurrentMapCacheManager
+import org.springframework.cache.support.NoOpCacheManager
+
+class MemberCacheTest :
+    BehaviorSpec({
+
+        val memberId = MemberId(1L)
+        val otherMemberId = MemberId(2L)
+
+        Given("캐시에 항목이 적재되어 있을 때") {
+            val backend = FakeMemberCacheBackend()
+            val memberCache = MemberCache(backend)
+            var loadCount = 0
+            val loader = { ++loadCount }
+
+            When("같은 키로 다시 조회하면") {
+                memberCache.getOrLoad(CacheRegion.GOALS, memberId, "query", loader)
+                val result = memberCache.getOrLoad(CacheRegion.GOALS, memberId, "query", loader)
+
+                Then("로더를 다시 호출하지 않는다") {
+                    result shouldBe 1
+                    loadCount shouldBe 1
+                }
+            }
+
+            When("해당 회원의 영역을 무효화하면") {
+                memberCache.getOrLoad(CacheRegion.TASKS, memberId, "query", loader)
+                memberCache.evict(CacheRegion.TASKS, memberId)
+                val before = loadCount
+                memberCache.getOrLoad(CacheRegion.TASKS, memberId, "query", loader)
+
+                Then("다음 조회에서 다시 적재한다") {
+                    loadCount shouldBe before + 1
+                }
+            }
+
+            When("다른 회원의 영역을 무효화하면") {
+                memberCache.getOrLoad(CacheRegion.REVIEW_STATS, memberId, "query", loader)
+                memberCache.evict(CacheRegion.REVIEW_STATS, otherMemberId)
+                val before = loadCount
+                memberCache.getOrLoad(CacheRegion.REVIEW_STATS, memberId, "query", loader)
+
+                Then("기존 항목이 유지된다") {
+                    loadCount shouldBe before
+                }
+            }
+
+            When("항목을 적재하면") {
+                memberCache.getOrLoad(CacheRegion.MEMBERS, memberId, "me", loader)
+
+                Then("회원 세대와 세대를 포함한 항목 키를 해당 영역에 저장한다") {
+                    val generation = backend.get(CacheRegion.MEMBERS, "1:generation")
+                    backend.keys(CacheRegion.MEMBERS) shouldContainExactlyInAnyOrder
+                        listOf("1:generation", "1:$generation:me")
+                }
+            }
+        }
+
+        Given("인프로세스 CacheManager를 쓰는 저장소") {
+            val memberCache =
+                MemberCache(InProcessMemberCacheBackend(ConcurrentMapCacheManager(), singleInstance = true))
+            var loadCount = 0
+
+            When("같은 키로 두 번 조회하면") {
+                repeat(2) { memberCache.getOrLoad(CacheRegion.MEMBERS, memberId, "me") { ++loadCount } }
+
+                Then("한 번만 적재한다") {
+                    loadCount shouldBe 1
+                }
+            }
+        }
+
+        Given("캐시가 비활성화되어 있을 때") {
+            val memberCache = MemberCache(InProcessMemberCacheBackend(NoOpCacheManager(), singleInstance = true))
+            var loadCount = 0
+
+            When("같은 키로 두 번 조회하면") {
+                repeat(2) { memberCache.getOrLoad(CacheRegion.MEMBERS, memberId, "me") { ++loadCount } }
+
+                Then("매번 로더를 호출한다") {
+                    loadCount shouldBe 2
+                }
+            }
+        }
+
+        Given("값을 직렬화해 저장하는 CacheManager") {
+            val cacheManager = ConcurrentMapCacheManager(*CacheRegion.entries.map { it.cacheName }.toTypedArray())
+            cacheManager.isStoreByValue = true
+
+            When("인프로세스 저장소를 만들면") {
+                Then("도메인 객체를 저장할 수 없으므로 거부한다") {
+                    shouldThrow<IllegalStateException> {
+                        InProcessMemberCacheBackend(cacheManager, singleInstance = true)
+                    }
+                }
+            }
+        }
+
+        Given("여러 인스턴스로 배포한다고 설정되어 있을 때") {
+            When("인프로세스 저장소를 만들면") {
+                Then("다른 노드의 항목을 무효화할 수 없으므로 거부한다") {
+                    shouldThrow<IllegalStateException> {
+                        InProcessMemberCacheBackend(ConcurrentMapCacheManager(), singleInstance = false)
+                    }
+                }
+            }
+
+            When("캐시가 비활성화되어 있으면") {
+                Then("오래된 항목이 생길 수 없으므로 허용한다") {
+                    InProcessMemberCacheBackend(NoOpCacheManager(), singleInstance = false)
+                }
+            }
+        }
+    })
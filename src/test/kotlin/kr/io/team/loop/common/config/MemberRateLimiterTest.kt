@@ -0,0 +1,39 @@
+package kr.io.team.loop.common.config
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+
+class MemberRateLimiterTest :
+    BehaviorSpec({
+
+        Given("용량 3, 초당 1개씩 채워지는 버킷") {
+            val limiter = MemberRateLimiter(capacity = 3, refillPerSecond = 1, maximumMembers = 100)
+            val start = 1_000_000_000L
+
+            When("같은 회원이 연속으로 4번 요청하면") {
+                val results = (1..4).map { limiter.tryAcquire(1L, start) }
+
+                Then("용량만큼만 허용한다") {
+                    results shouldBe listOf(true, true, true, false)
+                }
+            }
+
+            When("1초가 지난 뒤 다시 요청하면") {
+                val afterRefill = limiter.tryAcquire(1L, start + 1_000_000_000L)
+                val next = limiter.tryAcquire(1L, start + 1_000_000_000L)
+
+                Then("채워진 토큰 하나만 허용한다") {
+                    afterRefill shouldBe true
+                    next shouldBe false
+                }
+            }
+
+            When("다른 회원이 요청하면") {
+                val other = limiter.tryAcquire(2L, start)
+
+                Then("버킷을 공유하지 않는다") {
+                    other shouldBe true
+                }
+            }
+        }
+    })
@@ -0,0 +1,87 @@
+package kr.io.team.loop.common.config
+
+import graphql.execution.CoercedVariables
+import graphql.parser.Parser
+import graphql.schema.idl.RuntimeWiring
+import graphql.schema.idl.SchemaGenerator
+import graphql.schema.idl.SchemaParser
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+
+class OperationCostCalculatorTest :
+    BehaviorSpec({
+
+        val schema =
+            SchemaGenerator().makeExecutableSchema(
+                SchemaParser().parse(
+                    """
+                    directive @cost(weight: Int! = 1, listSize: Int) on FIELD_DEFINITION
+
+                    type Query {
+                        items: [Item!]! @cost(weight: 5, listSize: 10)
+                        page(first: Int = 20): ItemPage! @cost(weight: 5, listSize: 20)
+                    }
+
+                    type ItemPage {
+                        nodes: [Item!]!
+                    }
+
+                    type Item {
+                        id: ID!
+                        stats: Int! @cost(weight: 3)
+                        children: [Item!]!
+                    }
+                    """.trimIndent(),
+                ),
+                RuntimeWiring.MOCKED_WIRING,
+            )
+        val calculator = OperationCostCalculator()
+
+        fun calculate(
+            query: String,
+            variables: Map<String, Any> = emptyMap(),
+        ): OperationCost = calculator.calculate(schema, Parser.parse(query), null, CoercedVariables.of(variables))
+
+        Given("listSize가 선언된 리스트 필드") {
+            When("하위 필드를 선택하면") {
+                val result = calculate("{ items { id stats } }")
+
+                Then("하위 필드 비용에 listSize를 곱한다") {
+                    result.cost shouldBe 5 + 10 * (1 + 3)
+                    result.depth shouldBe 2
+                }
+            }
+        }
+
+        Given("first 인자가 있는 필드") {
+            When("first를 지정하면") {
+                val result = calculate("query(${'$'}n: Int) { page(first: ${'$'}n) { nodes { id } } }", mapOf("n" to 3))
+
+                Then("listSize 대신 first를 배수로 쓴다") {
+                    result.cost shouldBe 5 + 3 * (1 + 1)
+                    result.depth shouldBe 3
+                }
+            }
+        }
+
+        Given("중첩된 선택") {
+            When("깊이가 늘어나면") {
+                val result = calculate("{ items { children { children { id } } } }")
+
+                Then("가장 깊은 필드의 깊이를 반환한다") {
+                    result.depth shouldBe 4
+                }
+            }
+        }
+
+        Given("인트로스펙션 필드") {
+            When("__schema를 조회하면") {
+                val result = calculate("{ __schema { types { fields { type { ofType { name } } } } } }")
+
+                Then("비용과 깊이에 포함하지 않는다") {
+                    result.cost shouldBe 0
+                    result.depth shouldBe 0
+                }
+            }
+        }
+    })
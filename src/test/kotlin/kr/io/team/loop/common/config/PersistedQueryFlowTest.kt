@@ -0,0 +1,69 @@
+package kr.io.team.loop.common.config
+
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.core.env.Environment
+import tools.jackson.databind.JsonNode
+import tools.jackson.module.kotlin.jacksonObjectMapper
+import java.net.URI
+import java.net.http.HttpClient
+import java.net.http.HttpRequest
+import java.net.http.HttpResponse
+import java.security.MessageDigest
+import java.util.HexFormat
+
+/** 실제 `/graphql` 엔드포인트에서 자동 persisted query 흐름(미등록 → 등록 → 해시만으로 실행)을 검증한다. */
+@SpringBootTest(webEnvironment = SpringBootTest.WebEnvironment.RANDOM_PORT)
+class PersistedQueryFlowTest {
+    @Autowired
+    lateinit var jwtTokenProvider: JwtTokenProvider
+
+    @Autowired
+    lateinit var environment: Environment
+
+    private val client = HttpClient.newHttpClient()
+    private val objectMapper = jacksonObjectMapper()
+
+    private val query = "query PersistedQueryFlow { myReviewStats { totalCount consecutiveDays } }"
+    private val hash = HexFormat.of().formatHex(MessageDigest.getInstance("SHA-256").digest(query.toByteArray()))
+
+    private fun post(body: Map<String, Any>): JsonNode {
+        val port = environment.getRequiredProperty("local.server.port")
+        val request =
+            HttpRequest
+                .newBuilder(URI.create("http://localhost:$port/graphql"))
+                .header("Content-Type", "application/json")
+                .header("Authorization", "Bearer ${jwtTokenProvider.generateToken(800_301L)}")
+                .POST(HttpRequest.BodyPublishers.ofString(objectMapper.writeValueAsString(body)))
+                .build()
+        return objectMapper.readTree(client.send(request, HttpResponse.BodyHandlers.ofString()).body())
+    }
+
+    private fun persistedQuery(hash: String) = mapOf("persistedQuery" to mapOf("version" to 1, "sha256Hash" to hash))
+
+    @Test
+    fun `hash-only request is rejected until the query is registered, then served by hash`() {
+        val notFound = post(mapOf("extensions" to persistedQuery(hash)))
+        assertThat(notFound.path("errors").path(0).path("message").asString()).isEqualTo("PersistedQueryNotFound")
+
+        val registered = post(mapOf("query" to query, "extensions" to persistedQuery(hash)))
+        assertThat(registered.has("errors")).isFalse()
+
+        val hit = post(mapOf("extensions" to persistedQuery(hash)))
+        assertThat(hit.has("errors")).isFalse()
+        assertThat(hit.path("data").path("myReviewStats")).isEqualTo(registered.path("data").path("myReviewStats"))
+    }
+
+    @Test
+    fun `query that does not match its hash is rejected and not registered`() {
+        val wrongHash = "0".repeat(64)
+
+        val mismatch = post(mapOf("query" to query, "extensions" to persistedQuery(wrongHash)))
+        assertThat(mismatch.path("errors").path(0).path("message").asString()).isEqualTo("PersistedQueryIdInvalid")
+
+        val notFound = post(mapOf("extensions" to persistedQuery(wrongHash)))
+        assertThat(notFound.path("errors").path(0).path("message").asString()).isEqualTo("PersistedQueryNotFound")
+    }
+}
@@ -0,0 +1,100 @@
+package kr.io.team.loop.common.config
+
+import com.netflix.graphql.types.errors.ErrorType
+import graphql.ExecutionInput
+import graphql.GraphQL
+import graphql.schema.idl.RuntimeWiring
+import graphql.schema.idl.SchemaGenerator
+import graphql.schema.idl.SchemaParser
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.collections.shouldBeEmpty
+import io.kotest.matchers.nulls.shouldBeNull
+import io.kotest.matchers.nulls.shouldNotBeNull
+import io.kotest.matchers.shouldBe
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import io.mockk.every
+import io.mockk.mockk
+
+class QueryLimitInstrumentationTest :
+    BehaviorSpec({
+
+        val schema =
+            SchemaGenerator().makeExecutableSchema(
+                SchemaParser().parse(
+                    """
+                    directive @cost(weight: Int! = 1, listSize: Int) on FIELD_DEFINITION
+
+                    type Query {
+                        items: [Item] @cost(weight: 5, listSize: 100)
+                        item: Item
+                    }
+
+                    type Item {
+                        id: ID
+                    }
+                    """.trimIndent(),
+                ),
+                RuntimeWiring.MOCKED_WIRING,
+            )
+        val memberId = 900_001L
+
+        fun graphQl(meterRegistry: SimpleMeterRegistry): GraphQL {
+            val requestMemberResolver = mockk<RequestMemberResolver>()
+            every { requestMemberResolver.resolve(any()) } returns memberId
+            val instrumentation =
+                QueryLimitInstrumentation(
+                    requestMemberResolver = requestMemberResolver,
+                    // 충전 없이 토큰 1개: 한 번 소비하면 다시 통과하지 못한다
+                    memberRateLimiter = MemberRateLimiter(capacity = 1, refillPerSecond = 0, maximumMembers = 10),
+                    operationCostCalculator = OperationCostCalculator(),
+                    registeredOperations = RegisteredOperations(),
+                    exceptionHandler = GraphQlExceptionHandler(),
+                    meterRegistry = meterRegistry,
+                    maxCost = 50,
+                    maxDepth = 10,
+                )
+            return GraphQL.newGraphQL(schema).instrumentation(instrumentation).build()
+        }
+
+        fun GraphQL.run(query: String) = execute(ExecutionInput.newExecutionInput(query).build())
+
+        Given("토큰이 하나 남은 회원") {
+            val meterRegistry = SimpleMeterRegistry()
+            val graphQl = graphQl(meterRegistry)
+
+            When("비용 한도를 넘는 연산을 보낸 뒤 가벼운 연산을 보내면") {
+                val rejected = graphQl.run("query Heavy { items { id } }")
+                val accepted = graphQl.run("query Light { item { id } }")
+
+                Then("비용 초과로 거절된 연산은 토큰을 소비하지 않는다") {
+                    rejected.errors.single().errorType shouldBe ErrorType.BAD_REQUEST
+                    accepted.errors.shouldBeEmpty()
+                    meterRegistry.get("graphql.operation.rejected").tag("reason", "cost").counter().count() shouldBe 1.0
+                }
+            }
+
+            When("토큰을 다 쓴 뒤 다시 연산을 보내면") {
+                val result = graphQl.run("query Light { item { id } }")
+
+                Then("요청 한도 초과로 거절한다") {
+                    result.errors.single().errorType shouldBe ErrorType.UNAVAILABLE
+                }
+            }
+        }
+
+        Given("연산 이름") {
+            val meterRegistry = SimpleMeterRegistry()
+            val graphQl = graphQl(meterRegistry)
+
+            When("등록된 연산 이름과 임의의 연산 이름으로 실행하면") {
+                graphQl.run("query MyTasks { item { id } }")
+                graphQl.run("query Random1234 { item { id } }")
+
+                Then("등록된 이름만 태그로 쓰고 나머지는 other로 묶는다") {
+                    meterRegistry.find("graphql.operation.cost").tag("operation", "MyTasks").summary().shouldNotBeNull()
+                    meterRegistry.find("graphql.operation.cost").tag("operation", "other").summary().shouldNotBeNull()
+                    meterRegistry.find("graphql.operation.cost").tag("operation", "Random1234").summary().shouldBeNull()
+                }
+            }
+        }
+    })
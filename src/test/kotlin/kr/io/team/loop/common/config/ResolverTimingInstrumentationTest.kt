@@ -0,0 +1,52 @@
+package kr.io.team.loop.common.config
+
+import com.netflix.graphql.dgs.DgsQueryExecutor
+import com.netflix.graphql.dgs.test.EnableDgsTest
+import io.micrometer.core.instrument.MeterRegistry
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
+import kr.io.team.loop.learning.ActorsBatchLoader
+import kr.io.team.loop.learning.RatingsMappedBatchLoader
+import kr.io.team.loop.learning.ShowDataFetcher
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+
+@SpringBootTest(
+    classes = [
+        ShowDataFetcher::class,
+        ActorsBatchLoader::class,
+        RatingsMappedBatchLoader::class,
+        ResolverTimingInstrumentation::class,
+        SimpleMeterRegistry::class,
+    ],
+    properties = [
+        "app.tracing.resolvers.enabled=true",
+        "app.tracing.response-timings.enabled=true",
+    ],
+)
+@EnableDgsTest
+class ResolverTimingInstrumentationTest {
+    @Autowired
+    lateinit var dgsQueryExecutor: DgsQueryExecutor
+
+    @Autowired
+    lateinit var meterRegistry: MeterRegistry
+
+    @Test
+    fun `resolver timings are recorded and returned in extensions`() {
+        val result = dgsQueryExecutor.execute("{ shows { title } }")
+
+        assertThat(result.errors).isEmpty()
+        val timings = result.extensions["timings"] as Map<*, *>
+        val resolvers = timings["resolvers"] as List<*>
+        assertThat(resolvers.map { (it as Map<*, *>)["resolver"] }).contains("Query.shows")
+        assertThat(
+            meterRegistry
+                .get("graphql.resolver")
+                .tags("parent", "Query", "field", "shows")
+                .timer()
+                .count(),
+        ).isEqualTo(1L)
+    }
+}
@@ -0,0 +1,74 @@
+package kr.io.team.loop.common.config
+
+import io.micrometer.core.instrument.MeterRegistry
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.goal.domain.model.DailyGoalCommand
+import kr.io.team.loop.goal.domain.model.GoalQuery
+import kr.io.team.loop.goal.infrastructure.persistence.ExposedDailyGoalRepository
+import kr.io.team.loop.goal.infrastructure.persistence.ExposedGoalRepository
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.junit.jupiter.api.extension.ExtendWith
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.boot.test.system.CapturedOutput
+import org.springframework.boot.test.system.OutputCaptureExtension
+import org.springframework.test.annotation.DirtiesContext
+import org.springframework.transaction.annotation.Transactional
+
+@SpringBootTest(
+    properties = [
+        "app.tracing.sql.enabled=true",
+        "app.tracing.sql.slow-threshold-ms=0",
+    ],
+)
+@Transactional
+@ExtendWith(OutputCaptureExtension::class)
+// 전역 인터셉터에 등록된 기록기가 캐시된 컨텍스트와 함께 다른 테스트로 새지 않도록 컨텍스트를 닫는다 (@PreDestroy로 해제)
+@DirtiesContext
+class SqlStatementRecorderTest {
+    @Autowired
+    lateinit var goalRepository: ExposedGoalRepository
+
+    @Autowired
+    lateinit var dailyGoalRepository: ExposedDailyGoalRepository
+
+    @Autowired
+    lateinit var meterRegistry: MeterRegistry
+
+    @Test
+    fun `statements are timed by the repository method that issued them`() {
+        goalRepository.findAll(GoalQuery(memberId = MemberId(800_201L)))
+
+        val timer =
+            meterRegistry
+                .find("db.statement")
+                .tags("repository", "ExposedGoalRepository.findAll", "type", "SELECT")
+                .timer()
+        assertThat(timer).isNotNull
+        assertThat(timer!!.count()).isGreaterThanOrEqualTo(1L)
+    }
+
+    @Test
+    fun `slow statement log keeps bound values out by default`(output: CapturedOutput) {
+        goalRepository.findAll(GoalQuery(memberId = MemberId(800_201L)))
+
+        assertThat(output.out).contains("[SLOW_QUERY] ExposedGoalRepository.findAll")
+        assertThat(output.out).doesNotContain("800201")
+    }
+
+    @Test
+    fun `daily goal batches are timed like any other statement`() {
+        val command = DailyGoalCommand.Add(goalId = GoalId(1L), memberId = MemberId(800_201L), date = LocalDate(2026, 3, 24))
+        dailyGoalRepository.saveAllIfAbsent(listOf(command))
+
+        val timer =
+            meterRegistry
+                .find("db.statement")
+                .tags("repository", "ExposedDailyGoalRepository.saveAllIfAbsent")
+                .timer()
+        assertThat(timer).isNotNull
+    }
+}
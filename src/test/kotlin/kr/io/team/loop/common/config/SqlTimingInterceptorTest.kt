@@ -0,0 +1,70 @@
+package kr.io.team.loop.common.config
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.longs.shouldBeLessThan
+import io.mockk.every
+import io.mockk.mockk
+import io.mockk.verify
+import org.jetbrains.exposed.v1.core.Transaction
+import org.jetbrains.exposed.v1.core.statements.StatementContext
+import org.jetbrains.exposed.v1.core.statements.api.PreparedStatementApi
+import java.util.concurrent.TimeUnit
+
+class SqlTimingInterceptorTest :
+    BehaviorSpec({
+
+        val transaction = mockk<Transaction>()
+        val context = mockk<StatementContext>()
+        val executed = mockk<PreparedStatementApi>()
+        val interceptor = SqlTimingInterceptor()
+        val staleGapMillis = 200L
+
+        afterTest { SqlTimingInterceptor.recorder = null }
+
+        Given("기록기가 등록된 인터셉터") {
+            val recorder = mockk<SqlStatementRecorder>(relaxed = true)
+            SqlTimingInterceptor.recorder = recorder
+
+            When("구문이 정상 실행되면") {
+                interceptor.beforeExecution(transaction, context)
+                interceptor.afterExecution(transaction, listOf(context), executed)
+
+                Then("실행 시간을 한 번 기록한다") {
+                    verify(exactly = 1) { recorder.record(transaction, context, any()) }
+                }
+            }
+        }
+
+        Given("구문이 예외로 끝나 afterExecution 없이 롤백된 뒤") {
+            val recorder = mockk<SqlStatementRecorder>(relaxed = true)
+            SqlTimingInterceptor.recorder = recorder
+            interceptor.beforeExecution(transaction, context)
+            interceptor.afterRollback(transaction)
+
+            When("시작 기록 없이 afterExecution이 호출되면") {
+                interceptor.afterExecution(transaction, listOf(context), executed)
+
+                Then("실패한 구문의 시작 시각으로 기록하지 않는다") {
+                    verify(exactly = 0) { recorder.record(any(), any(), any()) }
+                }
+            }
+        }
+
+        Given("이전 구문의 시작 시각이 남아 있을 때") {
+            val recorder = mockk<SqlStatementRecorder>()
+            val elapsed = mutableListOf<Long>()
+            every { recorder.record(transaction, context, capture(elapsed)) } returns Unit
+            SqlTimingInterceptor.recorder = recorder
+            interceptor.beforeExecution(transaction, context)
+            Thread.sleep(staleGapMillis)
+
+            When("다음 구문을 실행하면") {
+                interceptor.beforeExecution(transaction, context)
+                interceptor.afterExecution(transaction, listOf(context), executed)
+
+                Then("다음 구문의 시작 시각부터 잰다") {
+                    elapsed.single() shouldBeLessThan TimeUnit.MILLISECONDS.toNanos(staleGapMillis)
+                }
+            }
+        }
+    })
@@ -0,0 +1,60 @@
+package kr.io.team.loop.common.config
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import io.mockk.every
+import io.mockk.mockk
+import io.mockk.verify
+import java.time.Instant
+
+class VerifiedTokenCacheTest :
+    BehaviorSpec({
+
+        val jwtTokenProvider = mockk<JwtTokenProvider>()
+        val verifiedTokenCache = VerifiedTokenCache(jwtTokenProvider, maximumSize = 100)
+
+        Given("유효한 토큰") {
+            val token = "valid-token"
+            every { jwtTokenProvider.verify(token) } returns VerifiedToken(1L, Instant.now().plusSeconds(3600))
+
+            When("여러 번 조회하면") {
+                val first = verifiedTokenCache.memberIdOf(token)
+                val second = verifiedTokenCache.memberIdOf(token)
+
+                Then("서명 검증은 한 번만 수행한다") {
+                    first shouldBe 1L
+                    second shouldBe 1L
+                    verify(exactly = 1) { jwtTokenProvider.verify(token) }
+                }
+            }
+        }
+
+        Given("이미 만료 시각이 지난 검증 결과") {
+            val token = "expiring-token"
+            every { jwtTokenProvider.verify(token) } returns VerifiedToken(2L, Instant.now().minusSeconds(1))
+
+            When("다시 조회하면") {
+                verifiedTokenCache.memberIdOf(token)
+                verifiedTokenCache.memberIdOf(token)
+
+                Then("캐시하지 않고 다시 검증한다") {
+                    verify(exactly = 2) { jwtTokenProvider.verify(token) }
+                }
+            }
+        }
+
+        Given("유효하지 않은 토큰") {
+            val token = "invalid-token"
+            every { jwtTokenProvider.verify(token) } returns null
+
+            When("여러 번 조회하면") {
+                val first = verifiedTokenCache.memberIdOf(token)
+                verifiedTokenCache.memberIdOf(token)
+
+                Then("null을 반환하고 캐시하지 않는다") {
+                    first shouldBe null
+                    verify(exactly = 2) { jwtTokenProvider.verify(token) }
+                }
+            }
+        }
+    })
@@ -0,0 +1,33 @@
+package kr.io.team.loop.common.domain
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+
+class KeysetCursorTest :
+    BehaviorSpec({
+
+        Given("KeysetCursor 인코딩 시") {
+            When("인코딩한 값을 다시 디코딩하면") {
+                val cursor = KeysetCursor(date = LocalDate(2025, 2, 20), id = 42L)
+
+                val decoded = KeysetCursor.decode(cursor.encode())
+
+                Then("원래 커서와 같다") {
+                    decoded shouldBe cursor
+                }
+            }
+        }
+
+        Given("KeysetCursor 디코딩 시") {
+            When("형식이 잘못된 값이면") {
+                Then("InvalidInputException이 발생한다") {
+                    shouldThrow<InvalidInputException> {
+                        KeysetCursor.decode("not-a-cursor")
+                    }
+                }
+            }
+        }
+    })
@@ -0,0 +1,36 @@
+package kr.io.team.loop.common.domain
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+
+class PageRequestTest :
+    BehaviorSpec({
+
+        Given("PageRequest 생성 시") {
+            When("first를 지정하지 않으면") {
+                val page = PageRequest()
+
+                Then("기본 크기를 사용한다") {
+                    page.first shouldBe PageRequest.DEFAULT_FIRST
+                }
+            }
+
+            When("first가 0이면") {
+                Then("예외가 발생한다") {
+                    shouldThrow<InvalidInputException> {
+                        PageRequest(first = 0)
+                    }
+                }
+            }
+
+            When("first가 최대 크기를 초과하면") {
+                Then("예외가 발생한다") {
+                    shouldThrow<InvalidInputException> {
+                        PageRequest(first = PageRequest.MAX_FIRST + 1)
+                    }
+                }
+            }
+        }
+    })
@@ -0,0 +1,99 @@
+package kr.io.team.loop.goal.application.service
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import io.mockk.every
+import io.mockk.mockk
+import io.mockk.verify
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
+import kr.io.team.loop.common.domain.event.GoalChangedEvent
+import kr.io.team.loop.goal.domain.model.DailyGoalCommand
+import kr.io.team.loop.goal.domain.model.Goal
+import kr.io.team.loop.goal.domain.model.GoalQuery
+import kr.io.team.loop.goal.domain.model.GoalTitle
+import kr.io.team.loop.goal.domain.repository.DailyGoalRepository
+import kr.io.team.loop.goal.domain.repository.GoalRepository
+import org.springframework.context.ApplicationEventPublisher
+import java.time.Instant
+
+class GoalBatchServiceTest :
+    BehaviorSpec({
+
+        val goalRepository = mockk<GoalRepository>()
+        val dailyGoalRepository = mockk<DailyGoalRepository>()
+        val eventPublisher = mockk<ApplicationEventPublisher>(relaxed = true)
+        val goalBatchService = GoalBatchService(goalRepository, dailyGoalRepository, eventPublisher)
+
+        val memberId = MemberId(1L)
+        val otherMemberId = MemberId(2L)
+        val date = LocalDate(2026, 3, 24)
+
+        fun goal(
+            id: Long,
+            owner: MemberId = memberId,
+        ) = Goal(
+            id = GoalId(id),
+            title = GoalTitle("목표 $id"),
+            memberId = owner,
+            createdAt = Instant.now(),
+            updatedAt = null,
+        )
+
+        Given("일별 목표 일괄 추가 시") {
+            When("본인 목표, 이미 배치된 목표, 다른 회원 목표, 없는 목표가 섞여 있으면") {
+                val commands =
+                    listOf(1L, 2L, 3L, 4L).map {
+                        DailyGoalCommand.Add(goalId = GoalId(it), memberId = memberId, date = date)
+                    }
+                every {
+                    goalRepository.findAll(GoalQuery(ids = listOf(GoalId(1L), GoalId(2L), GoalId(3L), GoalId(4L))))
+                } returns listOf(goal(1L), goal(2L), goal(3L, owner = otherMemberId))
+                every { dailyGoalRepository.saveAllIfAbsent(commands.take(2)) } returns listOf(true, false)
+
+                val result = goalBatchService.addDailyGoals(commands)
+
+                Then("항목별 결과를 입력 순서대로 반환한다") {
+                    result.map { it.status } shouldBe
+                        listOf(
+                            BatchItemStatus.SUCCESS,
+                            BatchItemStatus.DUPLICATE,
+                            BatchItemStatus.ACCESS_DENIED,
+                            BatchItemStatus.NOT_FOUND,
+                        )
+                }
+
+                Then("GoalChangedEvent가 발행된다") {
+                    verify { eventPublisher.publishEvent(GoalChangedEvent(memberId)) }
+                }
+            }
+        }
+
+        Given("일별 목표 일괄 제거 시") {
+            When("배치된 항목과 없는 항목이 섞여 있으면") {
+                val commands =
+                    listOf(1L, 2L).map {
+                        DailyGoalCommand.Remove(goalId = GoalId(it), memberId = memberId, date = date)
+                    }
+                every { dailyGoalRepository.deleteAll(commands) } returns listOf(true, false)
+
+                val result = goalBatchService.removeDailyGoals(commands)
+
+                Then("항목별 결과를 입력 순서대로 반환한다") {
+                    result.map { it.status } shouldBe listOf(BatchItemStatus.SUCCESS, BatchItemStatus.NOT_FOUND)
+                }
+
+                Then("제거된 항목에 대해서만 DailyGoalRemovedEvent가 발행된다") {
+                    verify(exactly = 1) {
+                        eventPublisher.publishEvent(DailyGoalRemovedEvent(GoalId(1L), memberId, date))
+                    }
+                    verify(exactly = 0) {
+                        eventPublisher.publishEvent(DailyGoalRemovedEvent(GoalId(2L), memberId, date))
+                    }
+                }
+            }
+        }
+    })
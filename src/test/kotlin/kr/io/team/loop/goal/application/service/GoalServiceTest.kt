@@ -13,13 +13,12 @@ import kotlinx.datetime.LocalDate
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
 import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
+import kr.io.team.loop.common.domain.event.GoalChangedEvent
 import kr.io.team.loop.common.domain.event.GoalDeletedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.DuplicateEntityException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
-import kr.io.team.loop.goal.domain.model.DailyGoal
 import kr.io.team.loop.goal.domain.model.DailyGoalCommand
-import kr.io.team.loop.goal.domain.model.DailyGoalId
 import kr.io.team.loop.goal.domain.model.Goal
 import kr.io.team.loop.goal.domain.model.GoalCommand
 import kr.io.team.loop.goal.domain.model.GoalQuery
@@ -95,7 +94,7 @@ class GoalServiceTest :
                 val command = GoalCommand.Update(goalId = GoalId(1L), title = GoalTitle("수학 공부"))
 
                 every { goalRepository.findById(GoalId(1L)) } returns savedGoal
-                every { goalRepository.update(command) } returns updatedGoal
+                every { goalRepository.update(savedGoal, command) } returns updatedGoal
 
                 val result = goalService.update(command, memberId)
 
@@ -148,6 +147,11 @@ class GoalServiceTest :
                     val eventSlot = slot<GoalDeletedEvent>()
                     verify { eventPublisher.publishEvent(capture(eventSlot)) }
                     eventSlot.captured.goalId shouldBe GoalId(1L)
+                    eventSlot.captured.memberId shouldBe memberId
+                }
+
+                Then("GoalChangedEvent가 발행된다") {
+                    verify { eventPublisher.publishEvent(GoalChangedEvent(memberId)) }
                 }
             }
 
@@ -175,21 +179,12 @@ class GoalServiceTest :
         }
 
         val date = LocalDate(2026, 3, 24)
-        val savedDailyGoal =
-            DailyGoal(
-                id = DailyGoalId(1L),
-                goalId = GoalId(1L),
-                memberId = memberId,
-                date = date,
-                createdAt = Instant.now(),
-            )
 
         Given("일별 목표 추가 시") {
             When("유효한 입력이면") {
                 val command = DailyGoalCommand.Add(goalId = GoalId(1L), memberId = memberId, date = date)
                 every { goalRepository.findById(GoalId(1L)) } returns savedGoal
-                every { dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(GoalId(1L), memberId, date) } returns false
-                every { dailyGoalRepository.save(command) } returns savedDailyGoal
+                every { dailyGoalRepository.saveAllIfAbsent(listOf(command)) } returns listOf(true)
 
                 val result = goalService.addDailyGoal(command)
 
@@ -224,7 +219,7 @@ class GoalServiceTest :
             When("이미 같은 날짜에 같은 목표가 추가되어 있으면") {
                 val command = DailyGoalCommand.Add(goalId = GoalId(1L), memberId = memberId, date = date)
                 every { goalRepository.findById(GoalId(1L)) } returns savedGoal
-                every { dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(GoalId(1L), memberId, date) } returns true
+                every { dailyGoalRepository.saveAllIfAbsent(listOf(command)) } returns listOf(false)
 
                 Then("DuplicateEntityException이 발생한다") {
                     shouldThrow<DuplicateEntityException> {
@@ -237,13 +232,12 @@ class GoalServiceTest :
         Given("일별 목표 제거 시") {
             When("해당 날짜에 목표가 배치되어 있으면") {
                 val command = DailyGoalCommand.Remove(goalId = GoalId(1L), memberId = memberId, date = date)
-                every { dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(GoalId(1L), memberId, date) } returns true
-                justRun { dailyGoalRepository.delete(command) }
+                every { dailyGoalRepository.deleteAll(listOf(command)) } returns listOf(true)
 
                 goalService.removeDailyGoal(command)
 
                 Then("삭제가 수행된다") {
-                    verify { dailyGoalRepository.delete(command) }
+                    verify { dailyGoalRepository.deleteAll(listOf(command)) }
                 }
 
                 Then("DailyGoalRemovedEvent가 발행된다") {
@@ -257,8 +251,7 @@ class GoalServiceTest :
 
             When("해당 날짜에 목표가 배치되어 있지 않으면") {
                 val command = DailyGoalCommand.Remove(goalId = GoalId(99L), memberId = memberId, date = date)
-                every { dailyGoalRepository.existsByGoalIdAndMemberIdAndDate(GoalId(99L), memberId, date) } returns
-                    false
+                every { dailyGoalRepository.deleteAll(listOf(command)) } returns listOf(false)
 
                 Then("EntityNotFoundException이 발생한다") {
                     shouldThrow<EntityNotFoundException> {
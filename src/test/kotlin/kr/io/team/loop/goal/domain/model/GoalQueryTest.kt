@@ -0,0 +1,39 @@
+package kr.io.team.loop.goal.domain.model
+
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+
+class GoalQueryTest :
+    BehaviorSpec({
+
+        Given("GoalQuery 정규화 시") {
+            val memberId = MemberId(1L)
+
+            When("id가 있으면") {
+                val query = GoalQuery(memberId = memberId, id = GoalId(1L), ids = listOf(GoalId(2L)), title = "영어")
+
+                Then("ids와 title이 제거된다") {
+                    query.normalized() shouldBe GoalQuery(memberId = memberId, id = GoalId(1L))
+                }
+            }
+
+            When("ids 순서와 중복만 다르면") {
+                val a = GoalQuery(memberId = memberId, ids = listOf(GoalId(3L), GoalId(1L), GoalId(3L)))
+                val b = GoalQuery(memberId = memberId, ids = listOf(GoalId(1L), GoalId(3L)), title = "영어")
+
+                Then("같은 쿼리로 정규화된다") {
+                    a.normalized() shouldBe b.normalized()
+                }
+            }
+
+            When("title만 있으면") {
+                val query = GoalQuery(memberId = memberId, title = "영어")
+
+                Then("그대로 유지된다") {
+                    query.normalized() shouldBe query
+                }
+            }
+        }
+    })
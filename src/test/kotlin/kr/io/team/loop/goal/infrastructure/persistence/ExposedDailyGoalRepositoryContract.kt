@@ -0,0 +1,71 @@
+package kr.io.team.loop.goal.infrastructure.persistence
+
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.goal.domain.model.DailyGoalCommand
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.transaction.annotation.Transactional
+
+/**
+ * 일일 목표 배치 저장/삭제의 항목별 결과를 검증하는 공통 시나리오.
+ *
+ * H2([ExposedDailyGoalRepositoryTest])와 PostgreSQL([ExposedDailyGoalRepositoryPostgresTest])에서 각각 실행된다.
+ */
+@SpringBootTest
+@Transactional
+abstract class ExposedDailyGoalRepositoryContract {
+    @Autowired
+    lateinit var dailyGoalRepository: ExposedDailyGoalRepository
+
+    private val memberId = MemberId(800_101L)
+    private val date = LocalDate(2026, 3, 24)
+
+    private fun add(
+        goalId: Long,
+        date: LocalDate = this.date,
+    ) = DailyGoalCommand.Add(goalId = GoalId(goalId), memberId = memberId, date = date)
+
+    private fun remove(goalId: Long) =
+        DailyGoalCommand.Remove(goalId = GoalId(goalId), memberId = memberId, date = date)
+
+    @Test
+    fun `saveAllIfAbsent skips rows that conflict on goal, member and date`() {
+        dailyGoalRepository.saveAllIfAbsent(listOf(add(1L)))
+
+        val result =
+            dailyGoalRepository.saveAllIfAbsent(
+                listOf(add(1L), add(2L), add(2L), add(1L, LocalDate(2026, 3, 25))),
+            )
+
+        assertThat(result).containsExactly(false, true, false, true)
+    }
+
+    @Test
+    fun `deleteAll reports which rows existed`() {
+        dailyGoalRepository.saveAllIfAbsent(listOf(add(1L)))
+
+        val result = dailyGoalRepository.deleteAll(listOf(remove(1L), remove(2L)))
+
+        assertThat(result).containsExactly(true, false)
+    }
+
+    @Test
+    fun `deleteAll reports only the first of duplicated items as deleted`() {
+        dailyGoalRepository.saveAllIfAbsent(listOf(add(1L), add(2L)))
+
+        val result = dailyGoalRepository.deleteAll(listOf(remove(1L), remove(3L), remove(1L), remove(2L)))
+
+        assertThat(result).containsExactly(true, false, false, true)
+        assertThat(dailyGoalRepository.deleteAll(listOf(remove(1L), remove(2L)))).containsExactly(false, false)
+    }
+
+    @Test
+    fun `empty batches touch nothing`() {
+        assertThat(dailyGoalRepository.saveAllIfAbsent(emptyList())).isEmpty()
+        assertThat(dailyGoalRepository.deleteAll(emptyList())).isEmpty()
+    }
+}
@@ -0,0 +1,16 @@
+package kr.io.team.loop.goal.infrastructure.persistence
+
+import kr.io.team.loop.support.PostgresTestContainer
+import org.springframework.test.context.DynamicPropertyRegistry
+import org.springframework.test.context.DynamicPropertySource
+import org.testcontainers.junit.jupiter.Testcontainers
+
+/** PostgreSQL에서 `ON CONFLICT (...) DO NOTHING RETURNING`과 `DELETE ... RETURNING` 경로를 검증한다. */
+@Testcontainers(disabledWithoutDocker = true)
+class ExposedDailyGoalRepositoryPostgresTest : ExposedDailyGoalRepositoryContract() {
+    companion object {
+        @JvmStatic
+        @DynamicPropertySource
+        fun datasource(registry: DynamicPropertyRegistry) = PostgresTestContainer.registerDataSource(registry)
+    }
+}
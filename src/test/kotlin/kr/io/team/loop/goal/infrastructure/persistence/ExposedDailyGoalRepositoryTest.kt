@@ -0,0 +1,4 @@
+package kr.io.team.loop.goal.infrastructure.persistence
+
+/** H2(PostgreSQL 모드)에서 데이터 변경 델타 테이블로 반영된 행을 돌려받는 경로를 검증한다. */
+class ExposedDailyGoalRepositoryTest : ExposedDailyGoalRepositoryContract()
@@ -3,11 +3,19 @@ package kr.io.team.loop.goal.presentation.datafetcher
 import com.netflix.graphql.dgs.DgsQueryExecutor
 import com.netflix.graphql.dgs.test.EnableDgsTest
 import com.ninjasquad.springmockk.MockkBean
+import io.micrometer.core.instrument.simple.SimpleMeterRegistry
 import io.mockk.every
 import kr.io.team.loop.common.config.AuthorizeArgumentResolver
+import kr.io.team.loop.common.config.DataLoaderMetrics
+import kr.io.team.loop.common.config.InProcessMemberCacheBackend
 import kr.io.team.loop.common.config.JwtTokenProvider
+import kr.io.team.loop.common.config.MemberCache
+import kr.io.team.loop.common.config.RequestMemberResolver
+import kr.io.team.loop.common.config.VerifiedToken
+import kr.io.team.loop.common.config.VerifiedTokenCache
 import kr.io.team.loop.common.domain.GoalId
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.goal.application.service.GoalBatchService
 import kr.io.team.loop.goal.application.service.GoalService
 import kr.io.team.loop.goal.domain.model.Goal
 import kr.io.team.loop.goal.domain.model.GoalQuery
@@ -20,6 +28,7 @@ import org.assertj.core.api.Assertions.assertThat
 import org.junit.jupiter.api.Test
 import org.springframework.beans.factory.annotation.Autowired
 import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.cache.support.NoOpCacheManager
 import org.springframework.http.HttpHeaders
 import java.time.Instant
 
@@ -29,6 +38,13 @@ import java.time.Instant
         GoalTaskStatsDataFetcher::class,
         GoalTaskStatsDataLoader::class,
         AuthorizeArgumentResolver::class,
+        DataLoaderMetrics::class,
+        SimpleMeterRegistry::class,
+        RequestMemberResolver::class,
+        VerifiedTokenCache::class,
+        MemberCache::class,
+        InProcessMemberCacheBackend::class,
+        NoOpCacheManager::class,
     ],
 )
 @EnableDgsTest
@@ -39,6 +55,9 @@ class GoalDataFetcherTest {
     @MockkBean
     lateinit var goalService: GoalService
 
+    @MockkBean
+    lateinit var goalBatchService: GoalBatchService
+
     @MockkBean
     lateinit var taskService: TaskService
 
@@ -54,8 +73,7 @@ class GoalDataFetcherTest {
         }
 
     private fun setupAuth() {
-        every { jwtTokenProvider.validateToken(testToken) } returns true
-        every { jwtTokenProvider.getMemberIdFromToken(testToken) } returns memberId
+        every { jwtTokenProvider.verify(testToken) } returns VerifiedToken(memberId, Instant.now().plusSeconds(3600))
     }
 
     @Test
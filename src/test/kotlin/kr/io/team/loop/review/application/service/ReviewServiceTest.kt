@@ -9,7 +9,11 @@ import io.mockk.justRun
 import io.mockk.mockk
 import io.mockk.verify
 import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.CursorPage
+import kr.io.team.loop.common.domain.ListLimit
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
+import kr.io.team.loop.common.domain.event.ReviewChangedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.DuplicateEntityException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
@@ -19,9 +23,11 @@ import kr.io.team.loop.review.domain.model.ReviewCommand
 import kr.io.team.loop.review.domain.model.ReviewId
 import kr.io.team.loop.review.domain.model.ReviewQuery
 import kr.io.team.loop.review.domain.model.ReviewStep
+import kr.io.team.loop.review.domain.model.ReviewSummary
 import kr.io.team.loop.review.domain.model.ReviewType
 import kr.io.team.loop.review.domain.model.StepType
 import kr.io.team.loop.review.domain.repository.ReviewRepository
+import org.springframework.context.ApplicationEventPublisher
 import org.springframework.dao.DataIntegrityViolationException
 import java.time.Instant
 
@@ -29,7 +35,8 @@ class ReviewServiceTest :
     BehaviorSpec({
 
         val reviewRepository = mockk<ReviewRepository>()
-        val reviewService = ReviewService(reviewRepository)
+        val eventPublisher = mockk<ApplicationEventPublisher>(relaxed = true)
+        val reviewService = ReviewService(reviewRepository, eventPublisher)
 
         val memberId = MemberId(1L)
         val today = LocalDate(2026, 2, 20)
@@ -75,6 +82,10 @@ class ReviewServiceTest :
                     result.steps shouldHaveSize 3
                     result.memberId shouldBe memberId
                 }
+
+                Then("ReviewChangedEvent가 발행된다") {
+                    verify { eventPublisher.publishEvent(ReviewChangedEvent(memberId)) }
+                }
             }
 
             When("같은 날짜에 이미 회고가 존재하면") {
@@ -145,7 +156,7 @@ class ReviewServiceTest :
         Given("회고 목록 조회 시") {
             When("해당 사용자의 회고가 있으면") {
                 val query = ReviewQuery(memberId = memberId)
-                every { reviewRepository.findAll(query) } returns listOf(savedReview)
+                every { reviewRepository.findAll(query, ListLimit.MAX_SIZE) } returns listOf(savedReview)
 
                 val result = reviewService.findAll(query)
 
@@ -155,28 +166,21 @@ class ReviewServiceTest :
                 }
             }
 
-            When("stepType 필터가 있으면 앱 레벨에서 필터링한다") {
-                val reviewWithoutTry =
-                    savedReview.copy(
-                        id = ReviewId(2L),
-                        steps = listOf(ReviewStep(type = StepType.KEEP, content = "좋은 점")),
-                    )
+            When("stepType 필터가 있으면") {
                 val query = ReviewQuery(memberId = memberId, stepType = StepType.TRY)
-                // Repository는 stepType 없이 조회 (DB 레벨 필터만)
-                val dbQuery = query.copy(stepType = null)
-                every { reviewRepository.findAll(dbQuery) } returns listOf(savedReview, reviewWithoutTry)
+                every { reviewRepository.findAll(query, ListLimit.MAX_SIZE) } returns listOf(savedReview)
 
                 val result = reviewService.findAll(query)
 
-                Then("해당 stepType을 포함하는 회고만 반환한다") {
+                Then("stepType 조건을 Repository에 그대로 전달한다") {
                     result shouldHaveSize 1
-                    result[0].id.value shouldBe 1L
+                    verify { reviewRepository.findAll(query, ListLimit.MAX_SIZE) }
                 }
             }
 
             When("회고가 없으면") {
                 val query = ReviewQuery(memberId = MemberId(99L))
-                every { reviewRepository.findAll(query) } returns emptyList()
+                every { reviewRepository.findAll(query, ListLimit.MAX_SIZE) } returns emptyList()
 
                 val result = reviewService.findAll(query)
 
@@ -186,25 +190,40 @@ class ReviewServiceTest :
             }
         }
 
+        Given("회고 커서 페이지 조회 시") {
+            When("stepType 필터가 없으면") {
+                val query = ReviewQuery(memberId = memberId)
+                val page = PageRequest(first = 1)
+                every { reviewRepository.findPage(query, page) } returns
+                    CursorPage(items = listOf(savedReview), hasNext = true)
+
+                val result = reviewService.findPage(query, page)
+
+                Then("Repository 페이지를 그대로 반환한다") {
+                    result.items shouldHaveSize 1
+                    result.hasNext shouldBe true
+                }
+            }
+
+            When("stepType 필터가 있으면") {
+                val query = ReviewQuery(memberId = memberId, stepType = StepType.TRY)
+                val page = PageRequest(first = 1)
+                every { reviewRepository.findPage(query, page) } returns
+                    CursorPage(items = listOf(savedReview), hasNext = false)
+
+                val result = reviewService.findPage(query, page)
+
+                Then("stepType 조건을 Repository에 그대로 전달한다") {
+                    result.items.map { it.id.value } shouldBe listOf(1L)
+                    verify { reviewRepository.findPage(query, page) }
+                }
+            }
+        }
+
         Given("회고 통계 조회 시") {
             When("회고가 있으면") {
-                every { reviewRepository.countByMemberId(memberId) } returns 5L
-                val reviewDates =
-                    listOf(
-                        LocalDate(2026, 2, 20),
-                        LocalDate(2026, 2, 19),
-                        LocalDate(2026, 2, 18),
-                    )
-                val reviews =
-                    reviewDates.mapIndexed { index, date ->
-                        savedReview.copy(
-                            id = ReviewId((index + 1).toLong()),
-                            startDate = date,
-                            periodKey = PeriodKey.daily(date),
-                        )
-                    }
-                val query = ReviewQuery(memberId = memberId)
-                every { reviewRepository.findAll(query) } returns reviews
+                every { reviewRepository.summarizeByMemberId(memberId, today) } returns
+                    ReviewSummary(totalCount = 5L, consecutiveDays = 3)
 
                 val result = reviewService.getStats(memberId, today)
 
@@ -215,9 +234,8 @@ class ReviewServiceTest :
             }
 
             When("회고가 없으면") {
-                every { reviewRepository.countByMemberId(memberId) } returns 0L
-                val query = ReviewQuery(memberId = memberId)
-                every { reviewRepository.findAll(query) } returns emptyList()
+                every { reviewRepository.summarizeByMemberId(memberId, today) } returns
+                    ReviewSummary(totalCount = 0L, consecutiveDays = 0)
 
                 val result = reviewService.getStats(memberId, today)
 
@@ -226,38 +244,6 @@ class ReviewServiceTest :
                     result.consecutiveDays shouldBe 0
                 }
             }
-
-            When("연속이 끊긴 경우") {
-                every { reviewRepository.countByMemberId(memberId) } returns 3L
-                val reviews =
-                    listOf(
-                        savedReview.copy(
-                            id = ReviewId(1L),
-                            startDate = LocalDate(2026, 2, 20),
-                            periodKey = PeriodKey.daily(LocalDate(2026, 2, 20)),
-                        ),
-                        // 2026-02-19 없음 (연속 끊김)
-                        savedReview.copy(
-                            id = ReviewId(2L),
-                            startDate = LocalDate(2026, 2, 18),
-                            periodKey = PeriodKey.daily(LocalDate(2026, 2, 18)),
-                        ),
-                        savedReview.copy(
-                            id = ReviewId(3L),
-                            startDate = LocalDate(2026, 2, 17),
-                            periodKey = PeriodKey.daily(LocalDate(2026, 2, 17)),
-                        ),
-                    )
-                val query = ReviewQuery(memberId = memberId)
-                every { reviewRepository.findAll(query) } returns reviews
-
-                val result = reviewService.getStats(memberId, today)
-
-                Then("연속 회고일수는 today부터 연속된 일수만 카운트한다") {
-                    result.totalCount shouldBe 3L
-                    result.consecutiveDays shouldBe 1
-                }
-            }
         }
 
         Given("회고 삭제 시") {
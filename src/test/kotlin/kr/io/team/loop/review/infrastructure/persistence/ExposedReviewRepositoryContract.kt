@@ -0,0 +1,102 @@
+package kr.io.team.loop.review.infrastructure.persistence
+
+import kotlinx.datetime.DateTimeUnit
+import kotlinx.datetime.LocalDate
+import kotlinx.datetime.minus
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.review.domain.model.ReviewCommand
+import kr.io.team.loop.review.domain.model.ReviewQuery
+import kr.io.team.loop.review.domain.model.ReviewStep
+import kr.io.team.loop.review.domain.model.ReviewSummary
+import kr.io.team.loop.review.domain.model.StepType
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.transaction.annotation.Transactional
+import kotlin.random.Random
+
+/**
+ * 방언별로 다른 SQL 경로(단계 유형 필터, 연속 회고일 계산)가 같은 결과를 내는지 검증하는 공통 시나리오.
+ *
+ * H2([ExposedReviewRepositoryTest])와 PostgreSQL([ExposedReviewRepositoryPostgresTest])에서 각각 실행된다.
+ */
+@SpringBootTest
+@Transactional
+abstract class ExposedReviewRepositoryContract {
+    @Autowired
+    lateinit var reviewRepository: ExposedReviewRepository
+
+    private val memberId = MemberId(800_001L)
+    private val today = LocalDate(2026, 2, 20)
+
+    private fun saveReview(
+        date: LocalDate,
+        vararg stepTypes: StepType,
+    ) = reviewRepository.save(
+        ReviewCommand.Create(
+            memberId = memberId,
+            // 내용에 포함된 "type":"TRY" 문자열은 JSON 이스케이프되므로 단계 유형 필터에 걸리지 않아야 한다
+            steps = stepTypes.map { ReviewStep(type = it, content = "\"type\":\"TRY\"") },
+            date = date,
+        ),
+    )
+
+    @Test
+    fun `stepType filter returns only reviews containing the step type`() {
+        val withTry = saveReview(today, StepType.KEEP, StepType.TRY)
+        saveReview(LocalDate(2026, 2, 19), StepType.KEEP)
+
+        val result = reviewRepository.findAll(ReviewQuery(memberId = memberId, stepType = StepType.TRY))
+
+        assertThat(result.map { it.id }).containsExactly(withTry.id)
+    }
+
+    @Test
+    fun `summary counts consecutive days ending today`() {
+        saveReview(LocalDate(2026, 2, 20), StepType.KEEP)
+        saveReview(LocalDate(2026, 2, 19), StepType.KEEP)
+        saveReview(LocalDate(2026, 2, 18), StepType.KEEP)
+        saveReview(LocalDate(2026, 2, 16), StepType.KEEP)
+
+        val result = reviewRepository.summarizeByMemberId(memberId, today)
+
+        assertThat(result).isEqualTo(ReviewSummary(totalCount = 4L, consecutiveDays = 3))
+    }
+
+    @Test
+    fun `summary streak is zero when there is no review today`() {
+        saveReview(LocalDate(2026, 2, 19), StepType.KEEP)
+        saveReview(LocalDate(2026, 2, 21), StepType.KEEP)
+
+        val result = reviewRepository.summarizeByMemberId(memberId, today)
+
+        assertThat(result).isEqualTo(ReviewSummary(totalCount = 2L, consecutiveDays = 0))
+    }
+
+    @Test
+    fun `filter and summary match an in-memory reference on generated reviews`() {
+        val random = Random(SEED)
+        val saved =
+            (-3..60)
+                .map { today.minus(it, DateTimeUnit.DAY) }
+                .filter { it == today || random.nextDouble() < 0.7 }
+                .map { date -> saveReview(date, *StepType.entries.filter { random.nextBoolean() }.toTypedArray()) }
+        val expectedStreak =
+            generateSequence(today) { it.minus(1, DateTimeUnit.DAY) }
+                .takeWhile { date -> saved.any { it.startDate == date } }
+                .count()
+
+        StepType.entries.forEach { stepType ->
+            val result = reviewRepository.findAll(ReviewQuery(memberId = memberId, stepType = stepType))
+            assertThat(result.map { it.id })
+                .containsExactlyInAnyOrderElementsOf(saved.filter { it.containsStepType(stepType) }.map { it.id })
+        }
+        assertThat(reviewRepository.summarizeByMemberId(memberId, today))
+            .isEqualTo(ReviewSummary(totalCount = saved.size.toLong(), consecutiveDays = expectedStreak))
+    }
+
+    companion object {
+        private const val SEED = 20_260_220L
+    }
+}
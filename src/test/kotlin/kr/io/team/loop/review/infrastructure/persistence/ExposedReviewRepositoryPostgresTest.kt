@@ -0,0 +1,25 @@
+package kr.io.team.loop.review.infrastructure.persistence
+
+import kr.io.team.loop.support.PostgresTestContainer
+import org.assertj.core.api.Assertions.assertThat
+import org.jetbrains.exposed.v1.core.vendors.PostgreSQLDialect
+import org.jetbrains.exposed.v1.core.vendors.currentDialect
+import org.junit.jupiter.api.Test
+import org.springframework.test.context.DynamicPropertyRegistry
+import org.springframework.test.context.DynamicPropertySource
+import org.testcontainers.junit.jupiter.Testcontainers
+
+/** PostgreSQL에서 JSONB 포함 연산(`@>`)과 윈도 함수 기반 연속 회고일 계산을 검증한다. */
+@Testcontainers(disabledWithoutDocker = true)
+class ExposedReviewRepositoryPostgresTest : ExposedReviewRepositoryContract() {
+    @Test
+    fun `runs against the PostgreSQL dialect`() {
+        assertThat(currentDialect).isInstanceOf(PostgreSQLDialect::class.java)
+    }
+
+    companion object {
+        @JvmStatic
+        @DynamicPropertySource
+        fun datasource(registry: DynamicPropertyRegistry) = PostgresTestContainer.registerDataSource(registry)
+    }
+}
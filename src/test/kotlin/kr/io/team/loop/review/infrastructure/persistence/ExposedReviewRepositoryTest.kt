@@ -0,0 +1,4 @@
+package kr.io.team.loop.review.infrastructure.persistence
+
+/** H2(PostgreSQL 모드)에서 대체 경로(JSON 문자열 비교, 날짜 스캔)를 검증한다. */
+class ExposedReviewRepositoryTest : ExposedReviewRepositoryContract()
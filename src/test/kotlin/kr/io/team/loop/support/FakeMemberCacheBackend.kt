@@ -0,0 +1,30 @@
+package kr.io.team.loop.support
+
+import kr.io.team.loop.common.config.CacheRegion
+import kr.io.team.loop.common.config.MemberCacheBackend
+
+/** 영역별 맵에 값을 보관하는 테스트용 [MemberCacheBackend]. */
+class FakeMemberCacheBackend : MemberCacheBackend {
+    private val entries = mutableMapOf<Pair<CacheRegion, String>, Any>()
+
+    override fun get(
+        region: CacheRegion,
+        key: String,
+    ): Any? = entries[region to key]
+
+    override fun put(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    ) {
+        entries[region to key] = value
+    }
+
+    override fun putIfAbsent(
+        region: CacheRegion,
+        key: String,
+        value: Any,
+    ): Any? = entries.putIfAbsent(region to key, value)
+
+    fun keys(region: CacheRegion): Set<String> = entries.keys.filter { it.first == region }.map { it.second }.toSet()
+}
@@ -0,0 +1,26 @@
+package kr.io.team.loop.support
+
+import org.springframework.test.context.DynamicPropertyRegistry
+import org.testcontainers.postgresql.PostgreSQLContainer
+
+/**
+ * PostgreSQL 전용 SQL 경로를 검증하는 테스트가 공유하는 컨테이너.
+ *
+ * 처음 사용할 때 한 번만 기동하며, 배치 갱신 건수가 SUCCESS_NO_INFO로 돌아오는 `reWriteBatchedInserts=true`로 접속해
+ * 드라이버가 건수를 알려주지 않아도 결과가 맞는지 함께 검증한다.
+ * 사용하는 테스트 클래스는 `@Testcontainers(disabledWithoutDocker = true)`로 Docker가 없는 환경에서 건너뛴다.
+ */
+object PostgresTestContainer {
+    private val container by lazy {
+        PostgreSQLContainer("postgres:17-alpine")
+            .withUrlParam("reWriteBatchedInserts", "true")
+            .also { it.start() }
+    }
+
+    fun registerDataSource(registry: DynamicPropertyRegistry) {
+        registry.add("spring.datasource.url") { container.jdbcUrl }
+        registry.add("spring.datasource.username") { container.username }
+        registry.add("spring.datasource.password") { container.password }
+        registry.add("spring.datasource.driver-class-name") { "org.postgresql.Driver" }
+    }
+}
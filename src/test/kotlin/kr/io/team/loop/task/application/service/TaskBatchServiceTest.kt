@@ -0,0 +1,136 @@
+package kr.io.team.loop.task.application.service
+
+import io.kotest.assertions.throwables.shouldThrow
+import io.kotest.core.spec.style.BehaviorSpec
+import io.kotest.matchers.shouldBe
+import io.mockk.every
+import io.mockk.mockk
+import io.mockk.verify
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.BatchItemStatus
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.event.TaskChangedEvent
+import kr.io.team.loop.common.domain.exception.InvalidInputException
+import kr.io.team.loop.task.domain.model.Task
+import kr.io.team.loop.task.domain.model.TaskCommand
+import kr.io.team.loop.task.domain.model.TaskId
+import kr.io.team.loop.task.domain.model.TaskStatus
+import kr.io.team.loop.task.domain.model.TaskTitle
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
+import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.springframework.context.ApplicationEventPublisher
+import java.time.Instant
+
+class TaskBatchServiceTest :
+    BehaviorSpec({
+
+        val taskRepository = mockk<TaskRepository>()
+        val goalTaskStatsRepository = mockk<GoalTaskStatsRepository>(relaxUnitFun = true)
+        val eventPublisher = mockk<ApplicationEventPublisher>(relaxed = true)
+        val taskBatchService = TaskBatchService(taskRepository, goalTaskStatsRepository, eventPublisher)
+
+        val memberId = MemberId(1L)
+        val otherMemberId = MemberId(2L)
+        val date = LocalDate(2026, 3, 24)
+
+        fun task(
+            id: Long,
+            goalId: Long = 1L,
+            owner: MemberId = memberId,
+        ) = Task(
+            id = TaskId(id),
+            title = TaskTitle("할일 $id"),
+            status = TaskStatus.TODO,
+            goalId = GoalId(goalId),
+            memberId = owner,
+            taskDate = date,
+            createdAt = Instant.now(),
+            updatedAt = null,
+        )
+
+        Given("할일 일괄 생성 시") {
+            When("유효한 입력이면") {
+                val commands =
+                    listOf(1L, 1L, 2L).map { goalId ->
+                        TaskCommand.Create(
+                            title = TaskTitle("할일"),
+                            goalId = GoalId(goalId),
+                            memberId = memberId,
+                            taskDate = date,
+                        )
+                    }
+                every { taskRepository.saveAll(commands) } returns listOf(task(1L), task(2L), task(3L, goalId = 2L))
+
+                val result = taskBatchService.createAll(commands)
+
+                Then("입력 순서대로 생성된 할일을 반환한다") {
+                    result.map { it.id } shouldBe listOf(TaskId(1L), TaskId(2L), TaskId(3L))
+                }
+
+                Then("목표별로 통계 카운터를 한 번씩 증가시킨다") {
+                    verify(exactly = 1) {
+                        goalTaskStatsRepository.increment(GoalId(1L), totalDelta = 2, completedDelta = 0)
+                    }
+                    verify(exactly = 1) {
+                        goalTaskStatsRepository.increment(GoalId(2L), totalDelta = 1, completedDelta = 0)
+                    }
+                }
+            }
+
+            When("입력이 비어 있으면") {
+                Then("InvalidInputException이 발생한다") {
+                    shouldThrow<InvalidInputException> {
+                        taskBatchService.createAll(emptyList())
+                    }
+                }
+            }
+        }
+
+        Given("할일 일괄 수정 시") {
+            When("본인 할일, 다른 회원 할일, 없는 할일이 섞여 있으면") {
+                val mine = task(1L)
+                val others = task(2L, owner = otherMemberId)
+                val commands =
+                    listOf(
+                        TaskCommand.Update(taskId = TaskId(1L), status = TaskStatus.DONE),
+                        TaskCommand.Update(taskId = TaskId(2L), status = TaskStatus.DONE),
+                        TaskCommand.Update(taskId = TaskId(3L), status = TaskStatus.DONE),
+                    )
+                val updated = mine.copy(status = TaskStatus.DONE, updatedAt = Instant.now())
+                every { taskRepository.findAllByIdsForUpdate(commands.map { it.taskId }) } returns listOf(mine, others)
+                every { taskRepository.updateAll(listOf(mine), listOf(commands[0])) } returns listOf(updated)
+
+                val result = taskBatchService.updateAll(commands, memberId)
+
+                Then("항목별 결과를 입력 순서대로 반환한다") {
+                    result.map { it.status } shouldBe
+                        listOf(BatchItemStatus.SUCCESS, BatchItemStatus.ACCESS_DENIED, BatchItemStatus.NOT_FOUND)
+                    result[0].task shouldBe updated
+                    result[1].task shouldBe null
+                }
+
+                Then("본인 할일의 완료 수만 통계 카운터에 반영한다") {
+                    verify { goalTaskStatsRepository.increment(GoalId(1L), totalDelta = 0, completedDelta = 1) }
+                }
+
+                Then("TaskChangedEvent가 발행된다") {
+                    verify { eventPublisher.publishEvent(TaskChangedEvent(memberId)) }
+                }
+            }
+
+            When("같은 할일 ID가 중복되면") {
+                val commands =
+                    listOf(
+                        TaskCommand.Update(taskId = TaskId(1L), status = TaskStatus.DONE),
+                        TaskCommand.Update(taskId = TaskId(1L), status = TaskStatus.TODO),
+                    )
+
+                Then("InvalidInputException이 발생한다") {
+                    shouldThrow<InvalidInputException> {
+                        taskBatchService.updateAll(commands, memberId)
+                    }
+                }
+            }
+        }
+    })
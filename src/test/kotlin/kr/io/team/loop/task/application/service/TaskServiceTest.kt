@@ -9,26 +9,38 @@ import io.mockk.justRun
 import io.mockk.mockk
 import io.mockk.verify
 import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.CursorPage
 import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.ListLimit
 import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.common.domain.PageRequest
 import kr.io.team.loop.common.domain.event.DailyGoalRemovedEvent
 import kr.io.team.loop.common.domain.event.GoalDeletedEvent
+import kr.io.team.loop.common.domain.event.TaskChangedEvent
 import kr.io.team.loop.common.domain.exception.AccessDeniedException
 import kr.io.team.loop.common.domain.exception.EntityNotFoundException
+import kr.io.team.loop.task.domain.model.GoalTaskCount
 import kr.io.team.loop.task.domain.model.Task
 import kr.io.team.loop.task.domain.model.TaskCommand
 import kr.io.team.loop.task.domain.model.TaskId
 import kr.io.team.loop.task.domain.model.TaskQuery
 import kr.io.team.loop.task.domain.model.TaskStatus
 import kr.io.team.loop.task.domain.model.TaskTitle
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
 import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.springframework.context.ApplicationEventPublisher
 import java.time.Instant
 
 class TaskServiceTest :
     BehaviorSpec({
 
         val taskRepository = mockk<TaskRepository>()
-        val taskService = TaskService(taskRepository)
+        val goalTaskStatsRepository = mockk<GoalTaskStatsRepository>(relaxUnitFun = true)
+        val eventPublisher = mockk<ApplicationEventPublisher>(relaxed = true)
+        val taskService =
+            TaskService(taskRepository, goalTaskStatsRepository, eventPublisher, statsTableEnabled = false)
+        val counterTaskService =
+            TaskService(taskRepository, goalTaskStatsRepository, eventPublisher, statsTableEnabled = true)
 
         val memberId = MemberId(1L)
         val otherMemberId = MemberId(2L)
@@ -65,13 +77,17 @@ class TaskServiceTest :
                     result.goalId.value shouldBe 1L
                     result.memberId shouldBe memberId
                 }
+
+                Then("목표 통계 카운터의 전체 수가 1 증가한다") {
+                    verify { goalTaskStatsRepository.increment(GoalId(1L), totalDelta = 1, completedDelta = 0) }
+                }
             }
         }
 
         Given("할일 목록 조회 시") {
             When("해당 사용자의 할일이 있으면") {
                 val query = TaskQuery(memberId = memberId)
-                every { taskRepository.findAll(query) } returns listOf(savedTask)
+                every { taskRepository.findAll(query, ListLimit.MAX_SIZE) } returns listOf(savedTask)
 
                 val result = taskService.findAll(query)
 
@@ -83,7 +99,7 @@ class TaskServiceTest :
 
             When("할일이 없으면") {
                 val query = TaskQuery(memberId = otherMemberId)
-                every { taskRepository.findAll(query) } returns emptyList()
+                every { taskRepository.findAll(query, ListLimit.MAX_SIZE) } returns emptyList()
 
                 val result = taskService.findAll(query)
 
@@ -91,6 +107,34 @@ class TaskServiceTest :
                     result shouldHaveSize 0
                 }
             }
+
+            When("결과가 목록 상한만큼 있으면") {
+                val query = TaskQuery(memberId = memberId, goalId = GoalId(2L))
+                every { taskRepository.findAll(query, ListLimit.MAX_SIZE) } returns
+                    List(ListLimit.MAX_SIZE) { savedTask }
+
+                val result = taskService.findAll(query)
+
+                Then("실패하지 않고 상한까지 반환한다") {
+                    result shouldHaveSize ListLimit.MAX_SIZE
+                }
+            }
+        }
+
+        Given("할일 커서 페이지 조회 시") {
+            When("다음 페이지가 있으면") {
+                val query = TaskQuery(memberId = memberId)
+                val page = PageRequest(first = 1)
+                every { taskRepository.findPage(query, page) } returns
+                    CursorPage(items = listOf(savedTask), hasNext = true)
+
+                val result = taskService.findPage(query, page)
+
+                Then("페이지 항목과 다음 페이지 여부를 반환한다") {
+                    result.items shouldHaveSize 1
+                    result.hasNext shouldBe true
+                }
+            }
         }
 
         Given("할일 수정 시") {
@@ -98,14 +142,18 @@ class TaskServiceTest :
                 val updatedTask = savedTask.copy(status = TaskStatus.DONE, updatedAt = Instant.now())
                 val command = TaskCommand.Update(taskId = TaskId(1L), status = TaskStatus.DONE)
 
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
-                every { taskRepository.update(command) } returns updatedTask
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
+                every { taskRepository.update(savedTask, command) } returns updatedTask
 
                 val result = taskService.update(command, memberId)
 
                 Then("변경된 할일을 반환한다") {
                     result.status shouldBe TaskStatus.DONE
                 }
+
+                Then("목표 통계 카운터의 완료 수가 1 증가한다") {
+                    verify { goalTaskStatsRepository.increment(GoalId(1L), totalDelta = 0, completedDelta = 1) }
+                }
             }
 
             When("본인 할일의 제목을 수정하면") {
@@ -113,8 +161,8 @@ class TaskServiceTest :
                 val updatedTask = savedTask.copy(title = newTitle, updatedAt = Instant.now())
                 val command = TaskCommand.Update(taskId = TaskId(1L), title = newTitle)
 
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
-                every { taskRepository.update(command) } returns updatedTask
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
+                every { taskRepository.update(savedTask, command) } returns updatedTask
 
                 val result = taskService.update(command, memberId)
 
@@ -128,8 +176,8 @@ class TaskServiceTest :
                 val updatedTask = savedTask.copy(title = newTitle, status = TaskStatus.DONE, updatedAt = Instant.now())
                 val command = TaskCommand.Update(taskId = TaskId(1L), title = newTitle, status = TaskStatus.DONE)
 
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
-                every { taskRepository.update(command) } returns updatedTask
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
+                every { taskRepository.update(savedTask, command) } returns updatedTask
 
                 val result = taskService.update(command, memberId)
 
@@ -141,7 +189,7 @@ class TaskServiceTest :
 
             When("존재하지 않는 할일이면") {
                 val command = TaskCommand.Update(taskId = TaskId(99L), status = TaskStatus.DONE)
-                every { taskRepository.findById(TaskId(99L)) } returns null
+                every { taskRepository.findByIdForUpdate(TaskId(99L)) } returns null
 
                 Then("EntityNotFoundException이 발생한다") {
                     shouldThrow<EntityNotFoundException> {
@@ -152,7 +200,7 @@ class TaskServiceTest :
 
             When("본인 할일이 아니면") {
                 val command = TaskCommand.Update(taskId = TaskId(1L), status = TaskStatus.DONE)
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
 
                 Then("AccessDeniedException이 발생한다") {
                     shouldThrow<AccessDeniedException> {
@@ -165,26 +213,19 @@ class TaskServiceTest :
         Given("목표별 할일 통계 조회 시") {
             val goalId1 = GoalId(1L)
             val goalId2 = GoalId(2L)
-
-            fun task(
-                goalId: GoalId,
-                status: TaskStatus,
-            ) = savedTask.copy(goalId = goalId, status = status)
+            val goalIds = setOf(goalId1, goalId2)
+            val counts =
+                listOf(
+                    GoalTaskCount(goalId = goalId1, totalCount = 3, completedCount = 2),
+                    GoalTaskCount(goalId = goalId2, totalCount = 1, completedCount = 1),
+                )
 
             When("할일이 있는 목표들이면") {
-                val goalIds = setOf(goalId1, goalId2)
-                val tasks =
-                    listOf(
-                        task(goalId1, TaskStatus.TODO),
-                        task(goalId1, TaskStatus.DONE),
-                        task(goalId1, TaskStatus.DONE),
-                        task(goalId2, TaskStatus.DONE),
-                    )
-                every { taskRepository.findAllByGoalIds(goalIds) } returns tasks
+                every { taskRepository.countByGoalIds(goalIds) } returns counts
 
                 val result = taskService.getStatsByGoalIds(goalIds)
 
-                Then("목표별 통계를 반환한다") {
+                Then("집계 쿼리 결과로 목표별 통계를 반환한다") {
                     result[goalId1]!!.totalCount shouldBe 3
                     result[goalId1]!!.completedCount shouldBe 2
                     result[goalId2]!!.totalCount shouldBe 1
@@ -193,11 +234,23 @@ class TaskServiceTest :
                 }
             }
 
+            When("통계 테이블 사용이 활성화되어 있으면") {
+                every { goalTaskStatsRepository.findAllByGoalIds(goalIds) } returns counts
+
+                val result = counterTaskService.getStatsByGoalIds(goalIds)
+
+                Then("카운터 테이블에서 목표별 통계를 반환한다") {
+                    result[goalId1]!!.totalCount shouldBe 3
+                    result[goalId1]!!.completedCount shouldBe 2
+                    verify(exactly = 0) { taskRepository.countByGoalIds(goalIds) }
+                }
+            }
+
             When("빈 goalIds이면") {
-                val goalIds = emptySet<GoalId>()
-                every { taskRepository.findAllByGoalIds(goalIds) } returns emptyList()
+                val emptyGoalIds = emptySet<GoalId>()
+                every { taskRepository.countByGoalIds(emptyGoalIds) } returns emptyList()
 
-                val result = taskService.getStatsByGoalIds(goalIds)
+                val result = taskService.getStatsByGoalIds(emptyGoalIds)
 
                 Then("빈 맵을 반환한다") {
                     result shouldBe emptyMap()
@@ -207,7 +260,7 @@ class TaskServiceTest :
 
         Given("GoalDeletedEvent 수신 시") {
             When("해당 goalId의 Task가 있으면") {
-                val event = GoalDeletedEvent(goalId = GoalId(1L))
+                val event = GoalDeletedEvent(goalId = GoalId(1L), memberId = memberId)
                 justRun { taskRepository.deleteByGoalId(GoalId(1L)) }
 
                 taskService.handleGoalDeleted(event)
@@ -215,6 +268,10 @@ class TaskServiceTest :
                 Then("해당 goalId의 모든 Task가 삭제된다") {
                     verify { taskRepository.deleteByGoalId(GoalId(1L)) }
                 }
+
+                Then("해당 goalId의 통계 카운터가 삭제된다") {
+                    verify { goalTaskStatsRepository.deleteByGoalId(GoalId(1L)) }
+                }
             }
         }
 
@@ -222,32 +279,59 @@ class TaskServiceTest :
             When("해당 goalId, memberId, date의 Task가 있으면") {
                 val date = LocalDate(2025, 2, 20)
                 val event = DailyGoalRemovedEvent(goalId = GoalId(1L), memberId = memberId, date = date)
+                val remaining = GoalTaskCount(goalId = GoalId(1L), totalCount = 2, completedCount = 1)
                 justRun { taskRepository.deleteByGoalIdAndMemberIdAndTaskDate(GoalId(1L), memberId, date) }
+                every { taskRepository.countByGoalIds(setOf(GoalId(1L))) } returns listOf(remaining)
 
                 taskService.handleDailyGoalRemoved(event)
 
                 Then("해당 goalId, memberId, date의 Task만 삭제된다") {
                     verify { taskRepository.deleteByGoalIdAndMemberIdAndTaskDate(GoalId(1L), memberId, date) }
                 }
+
+                Then("남은 Task 기준으로 통계 카운터를 재계산한다") {
+                    verify { goalTaskStatsRepository.save(remaining) }
+                }
             }
         }
 
         Given("할일 삭제 시") {
             When("본인 할일이면") {
                 val command = TaskCommand.Delete(taskId = TaskId(1L))
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
-                justRun { taskRepository.delete(command) }
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
+                every { taskRepository.delete(command) } returns true
 
                 taskService.delete(command, memberId)
 
                 Then("삭제가 수행된다") {
                     verify { taskRepository.delete(command) }
                 }
+
+                Then("TaskChangedEvent가 발행된다") {
+                    verify { eventPublisher.publishEvent(TaskChangedEvent(memberId)) }
+                }
+
+                Then("목표 통계 카운터의 전체 수가 1 감소한다") {
+                    verify { goalTaskStatsRepository.increment(GoalId(1L), totalDelta = -1, completedDelta = 0) }
+                }
+            }
+
+            When("잠금을 기다리는 동안 다른 요청이 먼저 삭제해 지워진 행이 없으면") {
+                val command = TaskCommand.Delete(taskId = TaskId(2L))
+                every { taskRepository.findByIdForUpdate(TaskId(2L)) } returns
+                    savedTask.copy(id = TaskId(2L), goalId = GoalId(77L))
+                every { taskRepository.delete(command) } returns false
+
+                taskService.delete(command, memberId)
+
+                Then("통계 카운터를 건드리지 않는다") {
+                    verify(exactly = 0) { goalTaskStatsRepository.increment(GoalId(77L), any(), any()) }
+                }
             }
 
             When("존재하지 않는 할일이면") {
                 val command = TaskCommand.Delete(taskId = TaskId(99L))
-                every { taskRepository.findById(TaskId(99L)) } returns null
+                every { taskRepository.findByIdForUpdate(TaskId(99L)) } returns null
 
                 Then("EntityNotFoundException이 발생한다") {
                     shouldThrow<EntityNotFoundException> {
@@ -258,7 +342,7 @@ class TaskServiceTest :
 
             When("본인 할일이 아니면") {
                 val command = TaskCommand.Delete(taskId = TaskId(1L))
-                every { taskRepository.findById(TaskId(1L)) } returns savedTask
+                every { taskRepository.findByIdForUpdate(TaskId(1L)) } returns savedTask
 
                 Then("AccessDeniedException이 발생한다") {
                     shouldThrow<AccessDeniedException> {
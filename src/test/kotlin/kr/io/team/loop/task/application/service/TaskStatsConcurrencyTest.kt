@@ -0,0 +1,107 @@
+package kr.io.team.loop.task.application.service
+
+import kotlinx.datetime.LocalDate
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.task.domain.model.GoalTaskCount
+import kr.io.team.loop.task.domain.model.TaskCommand
+import kr.io.team.loop.task.domain.model.TaskId
+import kr.io.team.loop.task.domain.model.TaskStatus
+import kr.io.team.loop.task.domain.model.TaskTitle
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
+import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.AfterEach
+import org.junit.jupiter.api.Test
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.transaction.PlatformTransactionManager
+import org.springframework.transaction.support.TransactionTemplate
+import java.util.concurrent.CompletableFuture
+import java.util.concurrent.CountDownLatch
+import java.util.concurrent.Executors
+
+/** 같은 할일을 동시에 수정·삭제해도 목표 통계 카운터가 한 번만 바뀌는지 검증한다. */
+@SpringBootTest
+class TaskStatsConcurrencyTest {
+    @Autowired
+    lateinit var taskService: TaskService
+
+    @Autowired
+    lateinit var taskRepository: TaskRepository
+
+    @Autowired
+    lateinit var goalTaskStatsRepository: GoalTaskStatsRepository
+
+    @Autowired
+    lateinit var transactionManager: PlatformTransactionManager
+
+    private val memberId = MemberId(800_401L)
+    private val goalId = GoalId(800_401L)
+
+    @AfterEach
+    fun cleanUp() {
+        TransactionTemplate(transactionManager).executeWithoutResult {
+            taskRepository.deleteByGoalId(goalId)
+            goalTaskStatsRepository.deleteByGoalId(goalId)
+        }
+    }
+
+    private fun createTask(): TaskId =
+        taskService
+            .create(
+                TaskCommand.Create(
+                    title = TaskTitle("동시성"),
+                    goalId = goalId,
+                    memberId = memberId,
+                    taskDate = LocalDate(2026, 3, 1),
+                ),
+            ).id
+
+    /** 두 스레드가 동시에 [action]을 실행하고, 각 실행의 성공 여부를 돌려준다. */
+    private fun concurrently(action: () -> Unit): List<Boolean> {
+        val executor = Executors.newFixedThreadPool(THREADS)
+        val start = CountDownLatch(1)
+        return try {
+            (1..THREADS)
+                .map {
+                    CompletableFuture.supplyAsync({
+                        start.await()
+                        runCatching(action).isSuccess
+                    }, executor)
+                }.also { start.countDown() }
+                .map { it.join() }
+        } finally {
+            executor.shutdown()
+        }
+    }
+
+    private fun counter(): GoalTaskCount? =
+        TransactionTemplate(transactionManager).execute {
+            goalTaskStatsRepository.findAllByGoalIds(setOf(goalId)).singleOrNull()
+        }
+
+    @Test
+    fun `concurrent completion of the same task counts it once`() {
+        val command = TaskCommand.Update(createTask(), status = TaskStatus.DONE)
+
+        val results = concurrently { taskService.update(command, memberId) }
+
+        assertThat(results).contains(true)
+        assertThat(counter()).isEqualTo(GoalTaskCount(goalId, totalCount = 1, completedCount = 1))
+    }
+
+    @Test
+    fun `concurrent deletes of the same task decrement once`() {
+        val taskId = createTask()
+
+        val results = concurrently { taskService.delete(TaskCommand.Delete(taskId), memberId) }
+
+        assertThat(results.count { it }).isEqualTo(1)
+        assertThat(counter()).isEqualTo(GoalTaskCount(goalId, totalCount = 0, completedCount = 0))
+    }
+
+    companion object {
+        private const val THREADS = 2
+    }
+}
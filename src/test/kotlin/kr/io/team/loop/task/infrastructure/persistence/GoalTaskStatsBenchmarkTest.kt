@@ -0,0 +1,145 @@
+package kr.io.team.loop.task.infrastructure.persistence
+
+import kotlinx.datetime.DatePeriod
+import kotlinx.datetime.LocalDate
+import kotlinx.datetime.plus
+import kr.io.team.loop.common.domain.BatchLimit
+import kr.io.team.loop.common.domain.GoalId
+import kr.io.team.loop.common.domain.MemberId
+import kr.io.team.loop.task.application.service.TaskBatchService
+import kr.io.team.loop.task.application.service.TaskService
+import kr.io.team.loop.task.domain.model.GoalTaskCount
+import kr.io.team.loop.task.domain.model.TaskCommand
+import kr.io.team.loop.task.domain.model.TaskQuery
+import kr.io.team.loop.task.domain.model.TaskStatus
+import kr.io.team.loop.task.domain.model.TaskTitle
+import kr.io.team.loop.task.domain.repository.GoalTaskStatsRepository
+import kr.io.team.loop.task.domain.repository.TaskRepository
+import org.assertj.core.api.Assertions.assertThat
+import org.junit.jupiter.api.AfterEach
+import org.junit.jupiter.api.Tag
+import org.junit.jupiter.api.Test
+import org.slf4j.LoggerFactory
+import org.springframework.beans.factory.annotation.Autowired
+import org.springframework.boot.test.context.SpringBootTest
+import org.springframework.transaction.PlatformTransactionManager
+import org.springframework.transaction.support.TransactionTemplate
+
+/**
+ * 목표별 할일 통계 조회 경로 비교 벤치마크.
+ *
+ * `./gradlew benchmark`로만 실행된다 (기본 `test` 태스크에서는 제외).
+ */
+@Tag("benchmark")
+@SpringBootTest
+class GoalTaskStatsBenchmarkTest {
+    @Autowired
+    lateinit var taskRepository: TaskRepository
+
+    @Autowired
+    lateinit var goalTaskStatsRepository: GoalTaskStatsRepository
+
+    @Autowired
+    lateinit var taskService: TaskService
+
+    @Autowired
+    lateinit var taskBatchService: TaskBatchService
+
+    @Autowired
+    lateinit var transactionManager: PlatformTransactionManager
+
+    private val log = LoggerFactory.getLogger(javaClass)
+    private val transaction by lazy { TransactionTemplate(transactionManager) }
+
+    private val memberId = MemberId(900_001L)
+    private val goalIds = (900_001L..900_020L).map { GoalId(it) }.toSet()
+    private val tasksPerMember = 12_000
+
+    @AfterEach
+    fun cleanUp() {
+        transaction.executeWithoutResult {
+            goalIds.forEach {
+                taskRepository.deleteByGoalId(it)
+                goalTaskStatsRepository.deleteByGoalId(it)
+            }
+        }
+    }
+
+    @Test
+    fun `goal task stats - in-memory vs GROUP BY vs counter table`() {
+        seed()
+
+        val inMemory =
+            measure("in-memory groupBy") {
+                taskRepository
+                    .findAll(TaskQuery(memberId = memberId))
+                    .groupBy { it.goalId }
+                    .map { (goalId, tasks) ->
+                        GoalTaskCount(goalId, tasks.size, tasks.count { it.status == TaskStatus.DONE })
+                    }
+            }
+        val aggregate = measure("GROUP BY aggregate") { taskRepository.countByGoalIds(goalIds) }
+        val counter = measure("counter table") { goalTaskStatsRepository.findAllByGoalIds(goalIds) }
+
+        assertThat(aggregate).containsExactlyInAnyOrderElementsOf(inMemory)
+        assertThat(counter).containsExactlyInAnyOrderElementsOf(inMemory)
+    }
+
+    /**
+     * 카운터 테이블은 집계 결과로 채우지 않고 생성·수정·삭제 서비스 경로로만 갱신해,
+     * 마지막 비교가 증감 로직 자체를 검증하도록 한다.
+     */
+    private fun seed() {
+        val baseDate = LocalDate(2025, 1, 1)
+        val goalIdList = goalIds.toList()
+        val tasks =
+            (0 until tasksPerMember)
+                .map { index ->
+                    TaskCommand.Create(
+                        title = TaskTitle("task-$index"),
+                        goalId = goalIdList[index % goalIdList.size],
+                        memberId = memberId,
+                        taskDate = baseDate.plus(DatePeriod(days = index % 730)),
+                    )
+                }.chunked(BatchLimit.MAX_SIZE)
+                .flatMap { taskBatchService.createAll(it) }
+        tasks
+            .filterIndexed { index, _ -> index % 3 == 0 }
+            .map { TaskCommand.Update(taskId = it.id, status = TaskStatus.DONE) }
+            .chunked(BatchLimit.MAX_SIZE)
+            .forEach { taskBatchService.updateAll(it, memberId) }
+        tasks
+            .filterIndexed { index, _ -> index % 30 == 0 }
+            .forEach { taskService.update(TaskCommand.Update(taskId = it.id, status = TaskStatus.TODO), memberId) }
+        tasks
+            .filterIndexed { index, _ -> index % 7 == 0 }
+            .forEach { taskService.delete(TaskCommand.Delete(taskId = it.id), memberId) }
+    }
+
+    private fun <T> measure(
+        name: String,
+        block: () -> List<T>,
+    ): List<T> {
+        repeat(WARMUP_ITERATIONS) { transaction.execute { block() } }
+        val elapsed =
+            (1..MEASURED_ITERATIONS).map {
+                val start = System.nanoTime()
+                transaction.execute { block() }
+                (System.nanoTime() - start) / 1_000_000.0
+            }
+        log.info(
+            "[benchmark] {} ({} tasks): avg={}ms, min={}ms, max={}ms",
+            name,
+            tasksPerMember,
+            "%.2f".format(elapsed.average()),
+            "%.2f".format(elapsed.min()),
+            "%.2f".format(elapsed.max()),
+        )
+        return transaction.execute { block() }!!
+    }
+
+    companion object {
+        private const val WARMUP_ITERATIONS = 5
+        private const val MEASURED_ITERATIONS = 20
+    }
+}